@@ -17,7 +17,7 @@ A terminal widgets framework for humans.
 
 from __future__ import absolute_import
 
-from .point import Point, Size
+from .point import Point, Rect, Region, Size
 
 
 __title__ = 'nwid'
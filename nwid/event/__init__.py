@@ -14,6 +14,8 @@ from .event import Event, event, FiredEvent
 from .event_handler import EventHandler
 from .event_loop import EventLoop
 from .handler_list import EVENT_BUBBLE, EVENT_CAPTURE, HandlerList
+from .keyboard import KeyDecoder
+from .render_scheduler import RenderScheduler
 
 
 # TODO: This should probably be moved to the terminal module
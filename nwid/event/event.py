@@ -136,43 +136,44 @@ _events = {
         'KEY_RIGHT': '\x1b[C',
         'KEY_LEFT': '\x1b[D',
 
-        'KEY_BACKSPACE': '\x1b[D',
-        'KEY_TAB': '\x1b[D',
-        'KEY_CLEAR': '\x1b[D',
-        'KEY_RETURN': '\x1b[D',
-        'KEY_ENTER': '\x1b[D',
-        'KEY_PAUSE': '\x1b[D',
-        'KEY_DELETE': '\x1b[D',
-        'KEY_KEYPAD_1': '\x1b[D',
-        'KEY_KEYPAD_2': '\x1b[D',
-        'KEY_KEYPAD_3': '\x1b[D',
-        'KEY_KEYPAD_4': '\x1b[D',
-        'KEY_KEYPAD_5': '\x1b[D',
-        'KEY_KEYPAD_6': '\x1b[D',
-        'KEY_KEYPAD_7': '\x1b[D',
-        'KEY_KEYPAD_8': '\x1b[D',
-        'KEY_KEYPAD_9': '\x1b[D',
-        'KEY_INSERT': '\x1b[D',
-        'KEY_HOME': '\x1b[D',
-        'KEY_END': '\x1b[D',
-        'KEY_PAGEUP': '\x1b[D',
-        'KEY_PAGEDOWN': '\x1b[D',
-        'KEY_F1': '\x1b[D',
-        'KEY_F2': '\x1b[D',
-        'KEY_F3': '\x1b[D',
-        'KEY_F4': '\x1b[D',
-        'KEY_F5': '\x1b[D',
-        'KEY_F6': '\x1b[D',
-        'KEY_F7': '\x1b[D',
-        'KEY_F8': '\x1b[D',
-        'KEY_F9': '\x1b[D',
-        'KEY_F10': '\x1b[D',
-        'KEY_F11': '\x1b[D',
-        'KEY_F12': '\x1b[D',
-        'KEY_F13': '\x1b[D',
-        'KEY_F14': '\x1b[D',
-        'KEY_F15': '\x1b[D',
-
+        'KEY_BACKSPACE': '\x7f',
+        'KEY_TAB': '\t',
+        'KEY_SHIFT_TAB': '\x1b[Z',
+        'KEY_CLEAR': '\x1b[E',
+        'KEY_RETURN': '\r',
+        'KEY_ENTER': '\x1bOM',
+        'KEY_DELETE': '\x1b[3~',
+        'KEY_KEYPAD_1': '\x1bOq',
+        'KEY_KEYPAD_2': '\x1bOr',
+        'KEY_KEYPAD_3': '\x1bOs',
+        'KEY_KEYPAD_4': '\x1bOt',
+        'KEY_KEYPAD_5': '\x1bOu',
+        'KEY_KEYPAD_6': '\x1bOv',
+        'KEY_KEYPAD_7': '\x1bOw',
+        'KEY_KEYPAD_8': '\x1bOx',
+        'KEY_KEYPAD_9': '\x1bOy',
+        'KEY_INSERT': '\x1b[2~',
+        'KEY_HOME': '\x1b[H',
+        'KEY_END': '\x1b[F',
+        'KEY_PAGEUP': '\x1b[5~',
+        'KEY_PAGEDOWN': '\x1b[6~',
+        'KEY_F1': '\x1bOP',
+        'KEY_F2': '\x1bOQ',
+        'KEY_F3': '\x1bOR',
+        'KEY_F4': '\x1bOS',
+        'KEY_F5': '\x1b[15~',
+        'KEY_F6': '\x1b[17~',
+        'KEY_F7': '\x1b[18~',
+        'KEY_F8': '\x1b[19~',
+        'KEY_F9': '\x1b[20~',
+        'KEY_F10': '\x1b[21~',
+        'KEY_F11': '\x1b[23~',
+        'KEY_F12': '\x1b[24~',
+        'KEY_F13': '\x1b[25~',
+        'KEY_F14': '\x1b[26~',
+        'KEY_F15': '\x1b[28~',
+
+        'KEY_PAUSE': '',
         'KEY_NUMLOCK': '',
         'KEY_CAPSLOCK': '',
         'KEY_SCROLLLOCK': '',
@@ -194,6 +195,32 @@ _events = {
     },
 }
 
+# xterm reports a key pressed with modifiers by adding a parameter of one plus
+# the sum of the modifiers (shift = 1, alt = 2, ctrl = 4): CSI 1 ; m A for a
+# key ending in a letter and CSI n ; m ~ for a key ending in a tilde.
+_MODIFIERS = ((4, 'CTRL_'), (2, 'ALT_'), (1, 'SHIFT_'))
+
+for _name, _value in list(_events['keyboard'].items()):
+    if _value.startswith('\x1b[') and _value.endswith('~'):
+        _prefix, _final = _value[:-1], '~'
+    elif _value[1:2] in ('[', 'O') and len(_value) == 3 and \
+            _value[2] in 'ABCDEFHPQRS':
+        _prefix, _final = '\x1b[1', _value[2]
+    else:
+        continue
+    for _mask in range(1, 8):
+        _modified = 'KEY_' + ''.join(
+            _modifier for _bit, _modifier in _MODIFIERS if _mask & _bit) + \
+            _name[4:]
+        _events['keyboard'].setdefault(
+            _modified, '{0};{1}{2}'.format(_prefix, _mask + 1, _final))
+
+# Ctrl + a letter sends the letter's control character (except for those
+# that are TAB and RETURN).
+for _letter in 'ABCDEFGHJKLNOPQRSTUVWXYZ':
+    _events['keyboard']['KEY_CTRL_' + _letter] = chr(ord(_letter) - 64)
+_events['keyboard']['KEY_CTRL_SPACE'] = '\x00'
+
 # Using singular because this is a mapping entity
 event = {}
 
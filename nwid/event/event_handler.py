@@ -18,17 +18,28 @@ to handle events.
 
 from __future__ import absolute_import
 
+from weakref import WeakValueDictionary
+
 from .handler_list import EVENT_BUBBLE, EVENT_CAPTURE, HandlerList
 
 
 class EventHandler(object):
     """This class defines an object that can handle events.
     It is intended to be extended by a widget like object.
+
+    Each EventHandler counts the handlers registered for each event on itself
+    and every object below it (see has_listeners()). The counts are updated
+    as handlers are registered and unregistered and as _parent changes, so an
+    event that nothing on its path listens for is dropped right away. This
+    assumes that a focused child's parent is the object it is focused in.
+    When a subclass calls path_changed() instead, the counts can no longer be
+    trusted and are counted again before the next event.
     """
 
     def __init__(self, *args, **kwargs):
         """Initializes an empty collection of events."""
         self.events = {}
+        self.__dict__.setdefault('_listeners', {})
 
     def register(self, event_name, callback_func, priority=50, identifier=None,
                 method=EVENT_BUBBLE):
@@ -53,6 +64,7 @@ class EventHandler(object):
         else:
             self.events[event_name] = HandlerList(callback_func, priority,
                                                   identifier, method)
+        self._count_listeners({event_name: 1})
 
     def unregister(self, event_name, callback_func=None, identifier=None):
         """Unregisters an event handler.
@@ -66,16 +78,32 @@ class EventHandler(object):
             argument. (the event object)
         :param identifier: The identifier of the handler to unregister.
         """
+        handler_list = self.events[event_name]
+        removed = len(handler_list)
         if callback_func:
-            self.events[event_name].remove(callback_func)
+            handler_list.remove(callback_func)
+            removed -= len(handler_list)
         else:
             del self.events[event_name]
+        self._count_listeners({event_name: -removed})
+
+    def has_listeners(self, event_name):
+        """Returns True if a handler for the event is registered on this
+        object or anywhere below it."""
+        if EventHandler._counted_version != EventHandler._path_version:
+            EventHandler._recount_listeners()
+        return event_name in self.__dict__['_listeners']
 
     def run_handlers(self, event, method=EVENT_CAPTURE):
-        """Runs all callbacks for events with the passed propagation method."""
-        if event not in self.events:
+        """Runs all callbacks for events with the passed propagation method.
+
+        The callbacks are run from the handler list's snapshot, so handlers
+        registered or unregistered by a callback take effect from the next
+        event."""
+        handler_list = self.events.get(str(event))
+        if handler_list is None:
             return None
-        for handler in self.events[str(event)].with_method(method):
+        for handler in handler_list.snapshot(method):
             handler(event)
 
     # TODO, event passed here should be an event object NOT a string.
@@ -100,27 +128,152 @@ class EventHandler(object):
         raising the PreventDefault Exception (although this should be used
         sparingly).
 
+        The path of the event is not walked for every event: the path from
+        this object down to the focused leaf and the path from there up to
+        the root are cached (see path_changed()), so propagation is two loops.
+        If nothing in the tree listens for the event, it is dropped without
+        walking either path, and capturing stops where nothing below listens.
+
         :param event: An object representing the event that occurred.
         """
+        name = str(event)
+        if EventHandler._counted_version != EventHandler._path_version:
+            EventHandler._recount_listeners()
+        parent_path = self.parent_path
+        if name not in parent_path[-1].__dict__['_listeners']:
+            return  # Nothing in the tree listens for it
 
         # Event Capturing
         if method == EVENT_CAPTURE:
-            self.run_handlers(event, EVENT_CAPTURE)
+            focus_path = self.focus_path
+            for node in focus_path:
+                if name not in node.__dict__['_listeners']:
+                    break  # Nothing below listens for it
+                handler_list = node.events.get(name)
+                if handler_list is not None:
+                    for handler in handler_list.snapshot(EVENT_CAPTURE):
+                        handler(event)
+            # At the last child, start the bubbling
+            bubble_path = focus_path[-1].parent_path
+        else:
+            bubble_path = parent_path
 
-            # Let children capture the event
-            if self.has_child():
-                self.focused_child.trigger(event, EVENT_CAPTURE)
+        # Event Bubbling
+        for node in bubble_path:
+            handler_list = node.events.get(name)
+            if handler_list is not None:
+                for handler in handler_list.snapshot(EVENT_BUBBLE):
+                    handler(event)
 
-            else: # At the last child, start the bubbling
-                self.trigger(event, EVENT_BUBBLE)
+    ## Propagation paths ##
 
-        # Event Bubbling
-        else:
-            self.run_handlers(event, EVENT_BUBBLE)
+    # Bumped whenever a focused child or parent changes anywhere, which
+    # invalidates every cached path.
+    _path_version = 0
+
+    # The path version the listener counts were last known to be right for
+    _counted_version = 0
+
+    # Every object that has listener counts, by id
+    _counted = WeakValueDictionary()
+
+    @staticmethod
+    def path_changed():
+        """Invalidates the cached propagation paths and the listener counts.
+
+        This is called when _focused_child or _parent is set. A subclass that
+        changes its focused child or parent any other way must call it."""
+        EventHandler._path_version += 1
+
+    @staticmethod
+    def _recount_listeners():
+        """Counts the listeners of every object again, from the handlers
+        registered on each and its current parents."""
+        nodes = list(EventHandler._counted.values())
+        for node in nodes:
+            node.__dict__['_listeners'] = {}
+        EventHandler._counted.clear()
+        for node in nodes:
+            counts = dict((event_name, len(handler_list)) for event_name,
+                          handler_list in getattr(node, 'events', {}).items()
+                          if len(handler_list))
+            if counts:
+                node._count_listeners(counts)
+        EventHandler._counted_version = EventHandler._path_version
+
+    @property
+    def focus_path(self):
+        """A tuple of this object and each focused child below it, down to
+        the focused leaf. (cached)"""
+        cached = self.__dict__.get('_focus_path')
+        if cached is None or cached[0] != EventHandler._path_version:
+            path = [self]
+            while path[-1].has_child():
+                path.append(path[-1].focused_child)
+            cached = self.__dict__['_focus_path'] = \
+                (EventHandler._path_version, tuple(path))
+        return cached[1]
+
+    @property
+    def parent_path(self):
+        """A tuple of this object and each parent above it, up to the root.
+        (cached)"""
+        cached = self.__dict__.get('_parent_path')
+        if cached is None or cached[0] != EventHandler._path_version:
+            path = [self]
+            while path[-1].has_parent():
+                path.append(path[-1].parent)
+            cached = self.__dict__['_parent_path'] = \
+                (EventHandler._path_version, tuple(path))
+        return cached[1]
+
+    @property
+    def _focused_child(self):
+        """The focused child, for subclasses that keep it here. Setting it
+        invalidates the cached propagation paths."""
+        return self.__dict__.get('_focused_child')
+
+    @_focused_child.setter
+    def _focused_child(self, child):
+        counted = EventHandler._counted_version == EventHandler._path_version
+        self.__dict__['_focused_child'] = child
+        self.path_changed()
+        if counted:  # Focus does not change which objects are below which
+            EventHandler._counted_version = EventHandler._path_version
+
+    @property
+    def _parent(self):
+        """The parent, for subclasses that keep it here. Setting it
+        invalidates the cached propagation paths."""
+        return self.__dict__.get('_parent')
+
+    @_parent.setter
+    def _parent(self, parent):
+        counted = EventHandler._counted_version == EventHandler._path_version
+        listeners = self.__dict__.setdefault('_listeners', {})
+        previous = self.__dict__.get('_parent')
+        if listeners and isinstance(previous, EventHandler):
+            previous._count_listeners(listeners, -1)
+        self.__dict__['_parent'] = parent
+        self.path_changed()
+        if listeners and isinstance(parent, EventHandler):
+            parent._count_listeners(listeners)
+        if counted:  # The counts were moved with the subtree
+            EventHandler._counted_version = EventHandler._path_version
 
-            # Let the event bubble to the parents
-            if self.has_parent():
-                self.parent.trigger(event, EVENT_BUBBLE)
+    def _count_listeners(self, counts, sign=1):
+        """Adds (or with a sign of -1, subtracts) counts of handlers by event
+        name to the listener counts of this object and each parent above
+        it."""
+        for node in self.parent_path:
+            listeners = node.__dict__.setdefault('_listeners', {})
+            EventHandler._counted[id(node)] = node
+            for event_name, count in counts.items():
+                count = listeners.get(event_name, 0) + sign * count
+                if count > 0:
+                    listeners[event_name] = count
+                else:
+                    listeners.pop(event_name, None)
 
     def has_child(self):
         """This is a stub that implies the class cannot have children.
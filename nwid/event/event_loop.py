@@ -17,21 +17,105 @@ This module contains the mixin for an object that has an EventLoop.
 from __future__ import absolute_import
 
 import os
+from select import select
+import sys
+import time
+
+from nwid.exceptions import ExitNwidApp, PreventDefault
+from nwid.terminal import output
+from .event import FiredEvent
+from .event_handler import EventHandler
+from .keyboard import KeyDecoder
+from .render_scheduler import RenderScheduler
 
 
 class EventLoop(EventHandler):
-    """A mixin for an EventHandler object that has an event loop (an application object)."""
+    """A mixin for an EventHandler object that has an event loop (an application object).
+
+    Redraws are not drawn immediately. Widgets call schedule_redraw() (or
+    BaseWidget.redraw()) and the loop renders one frame after each batch of
+    events, no more than max_fps times per second.
+
+    Assumptions:
+        self.screen - The ScreenBuffer that frames are rendered onto.
+    """
+
+    max_fps = 60
+
+    # The most bytes of input read at a time
+    read_size = 4096
+
+    @property
+    def keyboard(self):
+        """The KeyDecoder that decodes the input of this event loop."""
+        try:
+            return self._keyboard
+        except AttributeError:
+            self._keyboard = KeyDecoder()
+            return self._keyboard
+
+    @property
+    def render_scheduler(self):
+        """The RenderScheduler for this event loop."""
+        try:
+            return self._render_scheduler
+        except AttributeError:
+            self._render_scheduler = RenderScheduler(self.render, self.max_fps)
+            return self._render_scheduler
+
+    def schedule_redraw(self, widget=None):
+        """Requests that a widget be redrawn in the next frame."""
+        self.render_scheduler.schedule(widget)
+
     def event_loop(self):
+        """Dispatches each batch of input events, then renders a frame if one
+        is pending and due. Exits when ExitNwidApp is raised."""
+        scheduler = self.render_scheduler
         while True:
             try:
-                keyboard_input = self.getch()
-                event = Event(keyboard_input, cursor_pos)
-                self.handle(event)
+                for event in self.get_events(scheduler.timeout()):
+                    try:
+                        self.trigger(event)
+                    except PreventDefault:
+                        """Continue looping. Break out of the event propagation."""
+                        continue
+                scheduler.run()
+            except ExitNwidApp:
+                return
 
-            except PreventDefault:
-                """Continue looping. Break out of the event propagation."""
-                continue
+    def get_events(self, timeout=None):
+        """Returns the list of events waiting on input, waiting up to timeout
+        seconds (or indefinitely if timeout is None) for one to arrive.
+
+        A key sequence that is cut off is completed by the next read. If the
+        rest does not arrive by the keyboard's deadline, the input is taken as
+        it is (a lone ESC is the escape key). Returning sooner for a frame
+        does not cut the wait short."""
+        keyboard = self.keyboard
+        deadline = keyboard.deadline
+        if deadline is not None:
+            wait = max(deadline - time.monotonic(), 0)
+            timeout = wait if timeout is None else min(timeout, wait)
+        if select([sys.stdin], [], [], timeout)[0]:
+            events = keyboard.feed(self.getch())
+        elif deadline is not None and time.monotonic() >= deadline:
+            events = keyboard.flush()
+        else:
+            events = []
+        return [FiredEvent(event) for event in events]
 
     def getch(self):
-        """Gets a single character from input."""
-        return os.read(sys.stdin.fileno(), 4)
+        """Gets the input waiting to be read (up to read_size bytes)."""
+        return os.read(sys.stdin.fileno(), self.read_size)
+
+    def render(self, widgets):
+        """Renders one frame: repaints the damaged parts of the trees
+        containing widgets and flushes the screen in a single write."""
+        with output.frame():
+            roots = []
+            for widget in widgets:
+                root = getattr(widget, 'root', None)
+                if root is not None and root not in roots:
+                    roots.append(root)
+                    root.repaint(self.screen)
+            self.screen.flush()
@@ -20,7 +20,9 @@ for the same event.
 
 from __future__ import absolute_import
 
+from bisect import bisect_left, bisect_right, insort
 from collections import namedtuple
+from itertools import count
 
 
 # Propogation methods:
@@ -42,6 +44,18 @@ class HandlerList(object):
     before higher integers. This list is intended to be used as the list of
     handlers on an object for one particular event.
 
+    Each item is kept by its key of (priority, sequence), where the sequence
+    counts the items added, so items are inserted with bisect and items of
+    the same priority stay in the order they were added. Besides the list of
+    every item, the callbacks of each propagation method are kept in their own
+    ordered list, and the sorted keys of the items of each identifier and
+    callback are indexed in a dict, so removing and testing for an item never
+    search a list: every key is found with bisect.
+
+    The callbacks of each method are handed out as an immutable tuple
+    snapshot, which is only built again after the list changes. Handlers can
+    be added or removed while a snapshot is being run without affecting it.
+
     :param callback_func:
     :param priority:
     :param identifier:
@@ -51,6 +65,12 @@ class HandlerList(object):
                  method=EVENT_BUBBLE):
         """Initializes an empty list. Can optionally add an item at initialization."""
         self._list = []
+        self._keys = []
+        self._items = {}
+        self._methods = {}
+        self._index = {}
+        self._snapshots = {}
+        self._sequence = count()
         if callback_func:
             self.add(callback_func, priority, identifier, method)
 
@@ -61,14 +81,22 @@ class HandlerList(object):
     def add(self, callback_func, priority=50, identifier=None,
             method=EVENT_BUBBLE):
         """Inserts item of (callback_func, priority) into the list based on priority."""
-        new_item = HandlerListItem(callback_func, priority, identifier, method)
-        for index, item in enumerate(self._list):
-            if priority < item.priority:
-                self._list = self._list[:index] + [new_item] + self._list[index:]
-                break
-        else:
-            self._list.append(HandlerListItem(callback_func, priority, identifier,
-                                        method))
+        item = HandlerListItem(callback_func, priority, identifier, method)
+        key = (priority, next(self._sequence))
+        self._items[key] = item
+
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._list.insert(index, item)
+
+        keys, callbacks = self._methods.setdefault(method, ([], []))
+        index = bisect_right(keys, key)
+        keys.insert(index, key)
+        callbacks.insert(index, callback_func)
+        self._snapshots.pop(method, None)
+
+        for id_ in _ids(item):
+            insort(self._index.setdefault(id_, []), key)
 
     def remove(self, id_=None):
         """Removes (all) item(s) with callback_func.
@@ -80,20 +108,60 @@ class HandlerList(object):
 
         if not id_:
             raise TypeError('HandlerList.remove() method must take either a callback_func or an identifier.')
-        for item in self._list:
-            if id_ in [item.identifier, item.callback_func]:
-                self._list.remove(item)
+        for key in self._index.pop(id_, ()):
+            self._remove_key(key, id_)
+
+    def _remove_key(self, key, id_):
+        """Removes the item of a key from the list, its method's list, and
+        the index (other than id_, which has already been removed)."""
+        item = self._items.pop(key)
+
+        index = bisect_left(self._keys, key)
+        del self._keys[index]
+        del self._list[index]
+
+        keys, callbacks = self._methods[item.method]
+        index = bisect_left(keys, key)
+        del keys[index]
+        del callbacks[index]
+        self._snapshots.pop(item.method, None)
+
+        for other in _ids(item):
+            if other != id_:
+                keys = self._index[other]
+                del keys[bisect_left(keys, key)]
+                if not keys:
+                    del self._index[other]
 
     def with_method(self, method):
-        """A generator for yeilding callback functions of a certain method."""
-        for item in (items for items in self._list
-                        if items.method == method):
-            yield item.callback_func
+        """Returns an iterator of the callback functions of a certain method
+        (see snapshot())."""
+        return iter(self.snapshot(method))
+
+    def snapshot(self, method):
+        """Returns a tuple of the callback functions of a certain method, in
+        order. The same tuple is returned until the list changes."""
+        try:
+            return self._snapshots[method]
+        except KeyError:
+            callbacks = self._methods[method][1] if method in self._methods \
+                else ()
+            snapshot = self._snapshots[method] = tuple(callbacks)
+            return snapshot
 
     def __getitem__(self, index):
         """Returns _only_ the callback_func. Priority is only intended to be used internally."""
         return self._list[index].callback_func
 
     def __contains__(self, id_):
-        return any(item.identifier == id_ for item in self._list) or \
-               any(item.callback_func == id_ for item in self._list)
+        return id_ in self._index
+
+
+## HandlerList Helper Functions ##
+
+def _ids(item):
+    """Returns the identifier (if any) and the callback_func of an item, by
+    which it can be removed."""
+    if item.identifier is None or item.identifier == item.callback_func:
+        return (item.callback_func,)
+    return (item.identifier, item.callback_func)
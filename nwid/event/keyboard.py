@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             keyboard.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+nwid.event.keyboard
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the KeyDecoder, which turns keyboard input into Events.
+
+Input is fed to the decoder as it is read, in chunks of any size. The key
+sequences (the keyboard events of nwid.event.event and the other sequences
+terminals send for the same keys) are kept in a prefix trie, so each key is
+found by walking the trie one character at a time, and a chunk is decoded in
+a single pass no matter how many keys it holds.
+
+A key sequence cut off at the end of a chunk is kept until the rest arrives.
+ESC on its own is ambiguous: it is the escape key, but it also starts most key
+sequences. The decoder waits up to timeout seconds for more input before
+deciding it is the escape key, and the timeout adapts to how long it has taken
+the rest of a split sequence to arrive. A bracketed paste is not timed out: it
+stays open, however long it stalls, until the terminal ends it.
+
+Usage::
+    >>> decoder = KeyDecoder()
+    >>> events = decoder.feed(os.read(fd, 4096))
+    >>> if decoder.pending and not select([fd], [], [], decoder.timeout)[0]:
+    ...     events = decoder.flush()   # Past decoder.deadline
+"""
+
+from __future__ import absolute_import
+
+import codecs
+import re
+import time
+
+from .event import _events, Event
+
+
+# The other sequences terminals send for keys. They never replace the sequence
+# of a key that has its own name (for instance, LF is KEY_CTRL_J rather than
+# another KEY_RETURN, and BS is KEY_CTRL_H rather than another KEY_BACKSPACE).
+_ALTERNATES = {
+    '\x1bOA': 'KEY_UP',                     # Application cursor keys
+    '\x1bOB': 'KEY_DOWN',
+    '\x1bOC': 'KEY_RIGHT',
+    '\x1bOD': 'KEY_LEFT',
+    '\x1bOH': 'KEY_HOME',
+    '\x1bOF': 'KEY_END',
+    '\x1bOE': 'KEY_CLEAR',
+    '\x1b[1~': 'KEY_HOME',                  # VT220 style editing keys
+    '\x1b[4~': 'KEY_END',
+    '\x1b[7~': 'KEY_HOME',                  # rxvt
+    '\x1b[8~': 'KEY_END',
+    '\x1b[11~': 'KEY_F1',                   # VT220 style function keys
+    '\x1b[12~': 'KEY_F2',
+    '\x1b[13~': 'KEY_F3',
+    '\x1b[14~': 'KEY_F4',
+    '\x1b[[A': 'KEY_F1',                    # Linux console
+    '\x1b[[B': 'KEY_F2',
+    '\x1b[[C': 'KEY_F3',
+    '\x1b[[D': 'KEY_F4',
+    '\x1b[[E': 'KEY_F5',
+    '\x1b[G': 'KEY_CLEAR',
+}
+
+# Bracketed paste (enabled with CSI ? 2004 h)
+PASTE_START = '\x1b[200~'
+PASTE_END = '\x1b[201~'
+
+# A control sequence that is not a known key (and one that is cut off)
+_UNKNOWN = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]|\x1bO[ -~]')
+_INCOMPLETE = re.compile(r'\x1b(?:\[[0-?]*[ -/]*|O)\Z')
+
+
+def build_trie(keys):
+    """Returns a prefix trie of key sequences from a dict of {sequence: name}.
+
+    Each node is a dict of the next characters to their nodes. The name of a
+    key is stored in the node its sequence ends at, under the key None.
+    """
+    trie = {}
+    for sequence, name in keys.items():
+        node = trie
+        for char in sequence:
+            node = node.setdefault(char, {})
+        node[None] = name
+    return trie
+
+def _keys():
+    """Returns the dict of {sequence: name} of every key."""
+    keys = dict((value, name)
+                for name, value in _events['keyboard'].items() if value)
+    for sequence, name in _ALTERNATES.items():
+        keys.setdefault(sequence, name)
+    keys[PASTE_START] = PASTE_START
+    return keys
+
+_TRIE = build_trie(_keys())
+
+
+class KeyDecoder(object):
+    """Decodes keyboard input into Events incrementally.
+
+    Each key is an Event of its name (such as 'KEY_UP') and the sequence
+    that was read, of type 'keyboard'. Any other character is an Event named
+    by the character itself, of type 'printable'. ESC followed by a character
+    that does not start a key is that character with alt ('KEY_ALT_x').
+    Sequences that are not known keys are 'KEY_UNKNOWN', and a bracketed
+    paste is a single 'PASTE' Event of type 'paste' whose value is the text
+    pasted.
+    """
+
+    # The bounds of the time (in seconds) to wait for the rest of a sequence
+    min_timeout = 0.01
+    max_timeout = 0.5
+
+    # The timeout is this many times the typical delay within a sequence.
+    timeout_factor = 4
+
+    def __init__(self, trie=None, encoding='utf-8'):
+        """Initializes the decoder with a trie of keys (see build_trie())."""
+        self.trie = _TRIE if trie is None else trie
+        self._decoder = codecs.getincrementaldecoder(encoding)('replace')
+        self._pending = ''
+        self._pending_since = None
+        self._paste = None
+        self._delay = self.min_timeout / self.timeout_factor
+
+    @property
+    def pending(self):
+        """True if a key sequence is being kept until more arrives (and
+        flush() should be called if it does not)."""
+        return bool(self._pending) and self._paste is None
+
+    @property
+    def pasting(self):
+        """True if a bracketed paste has started but not yet ended."""
+        return self._paste is not None
+
+    @property
+    def deadline(self):
+        """The time (by the clock of feed()) when the pending sequence times
+        out and flush() should be called, or None if nothing is pending."""
+        if not self.pending:
+            return None
+        return self._pending_since + self.timeout
+
+    @property
+    def timeout(self):
+        """The seconds to wait for the rest of a pending sequence before
+        calling flush(), or None if nothing is pending."""
+        if not self.pending:
+            return None
+        return min(max(self._delay * self.timeout_factor, self.min_timeout),
+                   self.max_timeout)
+
+    def feed(self, data, now=None):
+        """Returns the list of Events decoded from data (bytes or str) and any
+        input pending before it.
+
+        :param now: the time the data was read (by default, time.monotonic()),
+            used to adapt the timeout.
+        """
+        now = time.monotonic() if now is None else now
+        if not isinstance(data, str):
+            data = self._decoder.decode(bytes(data))
+        if self._pending_since is not None and data:
+            # The rest of a split sequence arrived: learn how long it took
+            delay = now - self._pending_since
+            if delay > self._delay:
+                self._delay = delay
+            else:
+                self._delay += (delay - self._delay) / 8
+        string, self._pending = self._pending + data, ''
+        events = self._decode(string, final=False)
+        self._pending_since = now if self.pending else None
+        return events
+
+    def flush(self):
+        """Returns the list of Events of the pending input, taking it as it
+        is (a lone ESC is the escape key). Called when the timeout expires.
+
+        An open paste is left open, since the rest of it may only be slow to
+        arrive."""
+        if not self.pending:
+            return []
+        string, self._pending = self._pending, ''
+        self._pending_since = None
+        return self._decode(string, final=True)
+
+    def _decode(self, string, final):
+        """Returns the Events of string. Unless final, a sequence cut off at
+        its end is kept pending."""
+        events = []
+        index, length = 0, len(string)
+        root = self.trie
+        while index < length:
+            if self._paste is not None:
+                index = self._read_paste(string, index, events)
+                continue
+
+            char = string[index]
+            if char not in root:
+                events.append(Event(char, char, 'printable'))
+                index += 1
+                continue
+
+            # Walk the trie as far as the input goes, remembering the
+            # longest key found
+            node, end, name, stop = root, index, None, index
+            while end < length and string[end] in node:
+                node = node[string[end]]
+                end += 1
+                if None in node:
+                    name, stop = node[None], end
+            if end == length and len(node) > (None in node) and not final:
+                self._pending = string[index:]  # May be cut off
+                break
+
+            if name == PASTE_START:
+                self._paste = []
+                index = stop
+            elif name is not None and (stop > index + 1 or char != '\x1b'):
+                events.append(Event(name, string[index:stop], 'keyboard'))
+                index = stop
+            else:
+                index = self._decode_other(string, index, final, events)
+                if index is None:
+                    break
+        return events
+
+    def _decode_other(self, string, index, final, events):
+        """Decodes input starting with ESC that is not a key. Returns the
+        index after it, or None if it is kept pending."""
+        unknown = _UNKNOWN.match(string, index)
+        if unknown:
+            events.append(Event('KEY_UNKNOWN', unknown.group(), 'keyboard'))
+            return unknown.end()
+        if not final and _INCOMPLETE.match(string, index):
+            self._pending = string[index:]
+            return None
+        following = string[index + 1:index + 2]
+        if following and following.isprintable():
+            events.append(Event('KEY_ALT_' + following, string[index:index + 2],
+                                'keyboard'))
+            return index + 2
+        events.append(Event('KEY_ESCAPE', '\x1b', 'keyboard'))
+        return index + 1
+
+    def _read_paste(self, string, index, events):
+        """Collects pasted text until the end of the paste. Returns the index
+        after what was read."""
+        end = string.find(PASTE_END, index)
+        if end >= 0:
+            self._paste.append(string[index:end])
+            events.append(Event('PASTE', ''.join(self._paste), 'paste'))
+            self._paste = None
+            return end + len(PASTE_END)
+        # Keep anything that may be the start of PASTE_END
+        keep = 0
+        for size in range(min(len(PASTE_END) - 1, len(string) - index), 0, -1):
+            if string.endswith(PASTE_END[:size]):
+                keep = size
+                break
+        self._paste.append(string[index:len(string) - keep])
+        self._pending = string[len(string) - keep:] if keep else ''
+        return len(string)
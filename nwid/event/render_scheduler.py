@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             render_scheduler.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+nwid.event.render_scheduler
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module contains the RenderScheduler object that the event loop uses to
+coalesce redraw requests into frames.
+
+Widgets ask for a redraw with schedule(). Nothing is drawn until the event loop
+has dispatched its current batch of events and calls run(), which renders one
+frame for every widget that asked. Frames are limited to max_fps; requests that
+arrive while a frame is not yet due are simply merged into the next frame, so
+a flood of updates never builds a backlog.
+"""
+
+from __future__ import absolute_import
+
+import time
+
+
+class RenderScheduler(object):
+    """Collects the widgets that need to be redrawn and renders them at most
+    once per event batch and no more than max_fps times per second."""
+
+    def __init__(self, render, max_fps=60, clock=time.monotonic):
+        """Initializes the scheduler.
+
+        :param render: a callable that renders a frame. It is called with the
+            list of widgets that requested a redraw since the last frame.
+        :param max_fps: the maximum number of frames per second (None for no
+            limit).
+        :param clock: a callable returning the current time in seconds.
+        """
+        self.render = render
+        self.max_fps = max_fps
+        self.clock = clock
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+        self._dirty = {}
+        self._last_frame = None
+
+    def __len__(self):
+        """Returns the number of widgets waiting to be redrawn."""
+        return len(self._dirty)
+
+    def schedule(self, widget=None):
+        """Marks a widget as needing to be redrawn in the next frame. A widget
+        scheduled more than once before the frame is only drawn once."""
+        self._dirty[id(widget)] = widget
+
+    @property
+    def pending(self):
+        """True if a frame is waiting to be rendered."""
+        return bool(self._dirty)
+
+    @property
+    def frame_interval(self):
+        """The minimum number of seconds between frames."""
+        return 1.0 / self.max_fps if self.max_fps else 0.0
+
+    def timeout(self):
+        """Returns the number of seconds until the pending frame may be
+        rendered, or None if no frame is pending. The event loop can use this
+        as its timeout when waiting for input."""
+        if not self._dirty:
+            return None
+        if self._last_frame is None:
+            return 0.0
+        remaining = self._last_frame + self.frame_interval - self.clock()
+        return max(remaining, 0.0)
+
+    def run(self):
+        """Renders a frame if one is pending and due. Returns True if a frame
+        was rendered.
+
+        If a frame is pending but not yet due, it is skipped; the widgets stay
+        marked and are drawn (once) in the next frame that is due."""
+        if not self._dirty:
+            return False
+        now = self.clock()
+        if self._last_frame is not None and \
+                now - self._last_frame < self.frame_interval:
+            self.frames_skipped += 1
+            return False
+
+        widgets = list(self._dirty.values())
+        self._dirty = {}
+        self._last_frame = now
+        self.frames_rendered += 1
+        self.render(widgets)
+        return True
@@ -11,8 +11,8 @@
 nwid.point
 ~~~~~~~~~~
 
-This module contains nwid data structures used for designating a Point and a
-Size on a coordinate plane.
+This module contains nwid data structures used for designating a Point, a
+Size, and a Rect on a coordinate plane, and a Region made of Rects.
 """
 
 class Point(object):
@@ -30,6 +30,11 @@ class Point(object):
         """Point repr."""
         return 'Point' + str(self)
 
+    def __iter__(self):
+        """Allows a Point to be unpacked as (row, col)."""
+        yield self.row
+        yield self.col
+
     def __eq__(self, other):
         """Compares this object with another Point object."""
         try:
@@ -109,3 +114,161 @@ class Size(Point):
         """A symantic alias for setting the width correpsonding with a row
         number."""
         self.col += width
+
+
+class Rect(object):
+    """A Rect object represents a rectangle on the screen: the Point of its
+    top left corner and its Size."""
+    def __init__(self, position=None, size=None):
+        """Initializes the position and size attributes."""
+        self.position = Point(*position) if position else Point()
+        self.size = Size(*size) if size else Size()
+
+    def __str__(self):
+        """Rect string."""
+        return '(' + str(self.position) + ', ' + str(self.size) + ')'
+
+    def __repr__(self):
+        """Rect repr."""
+        return 'Rect' + str(self)
+
+    def __eq__(self, other):
+        """Compares this object with another Rect object."""
+        return self.position == other.position and self.size == other.size
+
+    def __iter__(self):
+        """Allows a Rect to be unpacked as ((row, col), (height, width))."""
+        yield (self.position.row, self.position.col)
+        yield (self.size.row, self.size.col)
+
+    @property
+    def top(self):
+        """The first row of the Rect."""
+        return self.position.row
+
+    @property
+    def left(self):
+        """The first column of the Rect."""
+        return self.position.col
+
+    @property
+    def bottom(self):
+        """The row just below the Rect."""
+        return self.position.row + self.size.row
+
+    @property
+    def right(self):
+        """The column just right of the Rect."""
+        return self.position.col + self.size.col
+
+    def is_empty(self):
+        """Returns True if the Rect has no area."""
+        return self.size.row <= 0 or self.size.col <= 0
+
+    def intersects(self, other):
+        """Returns True if this Rect overlaps another."""
+        return not self.is_empty() and not other.is_empty() and \
+            self.top < other.bottom and other.top < self.bottom and \
+            self.left < other.right and other.left < self.right
+
+    def touches(self, other):
+        """Returns True if this Rect overlaps or is directly adjacent to
+        another."""
+        return self.top <= other.bottom and other.top <= self.bottom and \
+            self.left <= other.right and other.left <= self.right
+
+    def contains(self, other):
+        """Returns True if this Rect completely covers another."""
+        return self.top <= other.top and other.bottom <= self.bottom and \
+            self.left <= other.left and other.right <= self.right
+
+    def intersection(self, other):
+        """Returns the Rect where this Rect and another overlap (which may be
+        empty)."""
+        top, left = max(self.top, other.top), max(self.left, other.left)
+        bottom = min(self.bottom, other.bottom)
+        right = min(self.right, other.right)
+        return Rect((top, left), (max(bottom - top, 0), max(right - left, 0)))
+
+    def union(self, other):
+        """Returns the smallest Rect that covers this Rect and another."""
+        top, left = min(self.top, other.top), min(self.left, other.left)
+        bottom = max(self.bottom, other.bottom)
+        right = max(self.right, other.right)
+        return Rect((top, left), (bottom - top, right - left))
+
+    def subtract(self, other):
+        """Returns a list of the Rects (at most four) that cover the part of
+        this Rect outside of another."""
+        if not self.intersects(other):
+            return [] if self.is_empty() else [self]
+        inner = self.intersection(other)
+        pieces = [
+            Rect((self.top, self.left), (inner.top - self.top, self.size.col)),
+            Rect((inner.bottom, self.left),
+                 (self.bottom - inner.bottom, self.size.col)),
+            Rect((inner.top, self.left), (inner.size.row,
+                                          inner.left - self.left)),
+            Rect((inner.top, inner.right), (inner.size.row,
+                                            self.right - inner.right)),
+        ]
+        return [piece for piece in pieces if not piece.is_empty()]
+
+    def area(self):
+        """Returns the number of cells in the Rect."""
+        return max(self.size.row, 0) * max(self.size.col, 0)
+
+
+class Region(object):
+    """A Region is a collection of Rects that are merged as they are added.
+
+    Rects are merged into their bounding Rect whenever that does not cover
+    more cells than the two did apart (for instance, when one contains the
+    other or they share a full edge)."""
+    def __init__(self, rects=()):
+        """Initializes the Region with optional Rects."""
+        self.rects = []
+        for rect in rects:
+            self.add(rect)
+
+    def __iter__(self):
+        """Generator that yields the Rects of the Region."""
+        for rect in self.rects:
+            yield rect
+
+    def __len__(self):
+        """Returns the number of Rects in the Region."""
+        return len(self.rects)
+
+    def __bool__(self):
+        """A Region is True if it is not empty."""
+        return bool(self.rects)
+
+    __nonzero__ = __bool__
+
+    def add(self, rect):
+        """Adds a Rect to the Region, merging it with any Rects it can be
+        merged with."""
+        if rect.is_empty():
+            return
+        merged = True
+        while merged:
+            merged = False
+            for existing in self.rects:
+                if not existing.touches(rect):
+                    continue
+                union = existing.union(rect)
+                if union.area() <= existing.area() + rect.area():
+                    self.rects.remove(existing)
+                    rect = union
+                    merged = True
+                    break
+        self.rects.append(rect)
+
+    def clear(self):
+        """Empties the Region."""
+        self.rects = []
+
+    def intersects(self, rect):
+        """Returns True if any Rect in the Region overlaps rect."""
+        return any(existing.intersects(rect) for existing in self.rects)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             backend.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+nwid.terminal.backend
+~~~~~~~~~~~~~~~~~~~~~
+
+This module contains the output backends that terminal output is written to.
+
+    TTYBackend      - writes directly to a file descriptor (a tty).
+    FileBackend     - writes to a file object, such as a file or a pipe. This is
+                      the default and writes to sys.stdout.
+    HeadlessBackend - feeds a VirtualTerminal, so nothing needs a real
+                      terminal.
+
+Use nwid.terminal.output.set_backend() to choose one. Every backend counts the
+writes and bytes it has been given, which is useful for measuring the output of
+each frame.
+"""
+
+from __future__ import absolute_import
+
+import codecs
+import os
+import sys
+
+
+class OutputBackend(object):
+    """The interface for an output backend.
+
+    Subclasses implement _write(data), which must write all of the bytes it is
+    given.
+    """
+
+    encoding = 'utf-8'
+
+    def __init__(self):
+        """Initializes the write counters."""
+        self.writes = 0
+        self.bytes_written = 0
+
+    def write(self, data):
+        """Writes a bytes-like object."""
+        self.writes += 1
+        self.bytes_written += len(data)
+        self._write(data)
+
+    def write_text(self, string):
+        """Writes a string."""
+        self.write(string.encode(self.encoding))
+
+    def _write(self, data):
+        """Writes a bytes-like object. Must be implemented by subclasses."""
+        raise NotImplementedError('Method must be implemented by subclass \
+                                  of OutputBackend.')
+
+
+class TTYBackend(OutputBackend):
+    """Writes straight to a file descriptor with os.write."""
+
+    def __init__(self, fd=None):
+        """Initializes the backend with a file descriptor (by default, the
+        file descriptor of stdout)."""
+        super(TTYBackend, self).__init__()
+        self.fd = sys.stdout.fileno() if fd is None else fd
+
+    def _write(self, data):
+        """Writes all of the data, even if it takes more than one call."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.fd, view):]
+
+
+class FileBackend(OutputBackend):
+    """Writes to a file object, such as a file or a pipe.
+
+    Bytes are written straight to the file's descriptor (after flushing the
+    file object) when it has one. Otherwise they are written to the file object.
+    Strings are written to text files as-is and flushed.
+    """
+
+    def __init__(self, file=None):
+        """Initializes the backend with a file object. If None, sys.stdout (at
+        the time of writing) is used."""
+        super(FileBackend, self).__init__()
+        self._file = file
+
+    @property
+    def file(self):
+        """The file object being written to."""
+        return self._file if self._file is not None else sys.stdout
+
+    @property
+    def encoding(self):
+        """The encoding of the file (utf-8 if it has none)."""
+        return getattr(self.file, 'encoding', None) or 'utf-8'
+
+    def write_text(self, string):
+        """Writes a string and flushes the file."""
+        if _is_binary(self.file):
+            return super(FileBackend, self).write_text(string)
+        self.writes += 1
+        self.bytes_written += len(string.encode(self.encoding))
+        self.file.write(string)
+        self.file.flush()
+
+    def _write(self, data):
+        """Writes the data in as few calls as possible."""
+        file = self.file
+        try:
+            fd = file.fileno()
+        except (AttributeError, ValueError, OSError):
+            # Not backed by a real file (captured or redirected in-process)
+            if _is_binary(file):
+                file.write(bytes(data))
+            else:
+                file.write(bytes(data).decode(self.encoding))
+            file.flush()
+            return
+
+        file.flush()  # Anything written earlier must come first
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+
+class HeadlessBackend(OutputBackend):
+    """Feeds all output to an in-memory VirtualTerminal."""
+
+    def __init__(self, screen_size=None):
+        """Initializes the backend with a VirtualTerminal of the given
+        Size."""
+        from .headless import VirtualTerminal  # headless imports output
+        super(HeadlessBackend, self).__init__()
+        self.terminal = VirtualTerminal(screen_size)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)('replace')
+
+    def _write(self, data):
+        """Feeds the data to the VirtualTerminal."""
+        self.terminal.feed(self._decoder.decode(bytes(data)))
+
+
+## Backend Helper Functions ##
+
+def _is_binary(file):
+    """Returns True if a file object takes bytes rather than strings."""
+    return 'b' in getattr(file, 'mode', '') or not hasattr(file, 'encoding')
@@ -20,13 +20,21 @@ pseudoterminal.
 
 from __future__ import absolute_import
 
-from sys import modules, stdout
+from sys import modules
+
+from . import output
 
 
 # Terminal code object #
 
 class TerminalCode(object):
-    """A terminal code object containing its name, value, and group"""
+    """A terminal code object containing its name, value, and group
+
+    The value is compiled into a template when it is set, and the sequences
+    made from it with using() are cached (up to cache_size distinct sets of
+    arguments)."""
+
+    cache_size = 256
 
     def __init__(self, name, value, group=None):
         """Initializes a TerminalCode with a name, value, and optional
@@ -35,6 +43,19 @@ class TerminalCode(object):
         self.value = value
         self.group = group
 
+    @property
+    def value(self):
+        """The value of the code, which may contain '{}' placeholders."""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        """Sets the value and compiles its template."""
+        self._value = value
+        self._placeholders = value.count('{}')
+        self._template = value.replace('%', '%%').replace('{}', '%s')
+        self._using_cache = {}
+
     def __str__(self):
         """Returns the string representation of the TerminalCode, replacing any
         placeholder with '1'."""
@@ -55,12 +76,29 @@ class TerminalCode(object):
 
     def __call__(self, *args):
         """Outputs (executes) an escape sequence."""
-        stdout.write(self.using(*args))
-        stdout.flush()
+        output.write(self.using(*args))
 
     def using(self, *args):
         """Replaces any placeholders ('{}') with *args."""
-        return self.value.format(*args)
+        if not self._placeholders:
+            return self._value
+        try:
+            return self._using_cache[args]
+        except KeyError:
+            pass
+        if len(args) < self._placeholders:
+            raise IndexError('{} requires {} arguments.'.format(
+                self.name, self._placeholders))
+        sequence = self._template % args[:self._placeholders]
+        if len(self._using_cache) >= self.cache_size:
+            self._using_cache.clear()
+        self._using_cache[args] = sequence
+        return sequence
+
+    def encode(self, *args):
+        """Returns the sequence (with placeholders replaced by *args) as
+        bytes."""
+        return self.using(*args).encode('ascii')
 
 
 # Terminal codes initialization #
@@ -122,7 +160,7 @@ _codes = {
         'ENABLE_LINE_WRAP':  CSI + '7h',
         'DISABLE_LINE_WRAP': CSI + '7l',
         'SET_SCROLL_ALL':    CSI + 'r',
-        'SET_SCROLL':        CSI + '0;0r',
+        'SET_SCROLL':        CSI + '{};{}r', # NOTE: {} are the top and bottom rows.
         'SCROLL_UP':         ESC + 'D',
         'SCROLL_DOWN':       ESC + 'M',
     },
@@ -140,6 +178,14 @@ _codes = {
         'CONCEAL':      '8',
     },
 
+    'style_off': {
+        'BOLD_OFF':      '22',
+        'UNDERLINE_OFF': '24',
+        'BLINK_OFF':     '25',
+        'REVERSE_OFF':   '27',
+        'CONCEAL_OFF':   '28',
+    },
+
     'fg_color': {
         'BLACK':        '30',
         'RED':          '31',
@@ -149,7 +195,16 @@ _codes = {
         'MAGENTA':      '35',
         'CYAN':         '36',
         'WHITE':        '37',
-        'EXTENDED':     '38',
+        'EXTENDED':     '38',   # NOTE: see nwid.terminal.palette
+        'FG_DEFAULT':   '39',
+        'BRIGHT_BLACK':   '90',
+        'BRIGHT_RED':     '91',
+        'BRIGHT_GREEN':   '92',
+        'BRIGHT_YELLOW':  '93',
+        'BRIGHT_BLUE':    '94',
+        'BRIGHT_MAGENTA': '95',
+        'BRIGHT_CYAN':    '96',
+        'BRIGHT_WHITE':   '97',
     },
 
     'bg_color': {
@@ -161,13 +216,25 @@ _codes = {
         'BG_MAGENTA':   '45',
         'BG_CYAN':      '46',
         'BG_WHITE':     '47',
-        'BG_EXTENDED':  '48',
+        'BG_EXTENDED':  '48',   # NOTE: see nwid.terminal.palette
+        'BG_DEFAULT':   '49',
+        'BG_BRIGHT_BLACK':   '100',
+        'BG_BRIGHT_RED':     '101',
+        'BG_BRIGHT_GREEN':   '102',
+        'BG_BRIGHT_YELLOW':  '103',
+        'BG_BRIGHT_BLUE':    '104',
+        'BG_BRIGHT_MAGENTA': '105',
+        'BG_BRIGHT_CYAN':    '106',
+        'BG_BRIGHT_WHITE':   '107',
     }
 }
 
 
 # Initialize the TerminalCode object and make it available in this
-# (nwid.terminal.codes) namespace:
+# (nwid.terminal.codes) namespace, and in groups by its group:
+groups = {}
 for _group, _codes in _codes.items():
     for _name, _value in _codes.items():
-        setattr(modules[__name__], _name, TerminalCode(_name, _value, _group))
+        _code = TerminalCode(_name, _value, _group)
+        setattr(modules[__name__], _name, _code)
+        groups.setdefault(_group, []).append(_code)
@@ -11,429 +11,395 @@
 nwid.terminal.colors
 ~~~~~~~~~~~~~~~~~~~~
 
-Functions for creating and combining terminal text effects and colors using
+Styles for creating and combining terminal text effects and colors using
 code escape sequences.
 
-They return the modified string with the appropriate escape sequences.
+Each Style is called like a function and returns the modified string with the
+appropriate escape sequences. Given StyledText, it returns StyledText with the
+styles merged into its runs.
 """
 
 from __future__ import absolute_import
 
+from functools import lru_cache
+
 from . import codes as code
+from . import palette
 from . import sgr
+from .styled import StyledText
 
 
-def _combine(string, attribute, *funcs, **additional):
-    """Recursively Combines multiple sgr attributes into one string using
-    sgr.wrap.
+class Style(object):
+    """A precompiled combination of SGR attributes that styles strings.
 
-    This is called by individual attribute functions and allows either chaining
-    multiple functions or passing attribute functions as arguments of other
-    attribute functions.
+    Each text effect and color of this module is a Style. Calling one with a
+    string wraps the string in the SGR escape sequence of its attributes. Its
+    prefix (the escape sequence) and suffix (the reset) are created once, with
+    the Style, so styling a string is a concatenation.
 
-    :param string: the string around which to wrap the SGR codes.
-    :param attribute: the code attribute to be used and combined with optional
-        additional attributes.
-    :param *funcs: optional attribute functions to be applied.
-    :param **additional: additional attributes to be combined with attribute.
-        This parameter is intended for internal use for recursion.
-        In **additional is additional['attributes'] which is a tuple of
-        attributes to be ultimately combined with sgr_wrap.
+    Other Styles may be passed after the string to combine their attributes.
+    Each combination is resolved into a new Style once and cached, so
+    bold(string, red, on_white) costs the same as a single Style.
+
+    If the string contains resets, the attributes are set again after each one,
+    which allows for unlimited nesting (see sgr.wrap()). Given StyledText,
+    the attributes are merged into the styles of its runs instead.
+
+    Styles are immutable, and two Styles with the same attributes are equal.
 
     Usage::
-        >>> print(bold('The important string.' red, on_white))
+        >>> print(bold('The important string.', red, on_white))
         The important string.
         >>> print(bold(red(on_white('The important string.'))))
         The important string.
-
     """
-    _attributes = additional['attributes'] + (attribute,) \
-        if 'attributes' in additional else (attribute,)
-    if funcs:
-        _additional = {'attributes' : _attributes}
-        _next_func, _funcs = funcs[0], funcs[1:]
-        return _next_func(string, *_funcs, **_additional)
-    else:
-        return sgr.wrap(string, *_attributes)
 
+    def __init__(self, *attributes, **kwargs):
+        """Initializes the Style with SGR attributes and an optional doc."""
+        for name, value in (('attributes', attributes),
+                            ('prefix', sgr.create(*attributes)),
+                            ('suffix', sgr.reset()),
+                            ('__doc__', kwargs.get('doc'))):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_separator', self.suffix + self.prefix)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Style is immutable.')
+
+    def __repr__(self):
+        return 'Style({0})'.format(', '.join(
+            repr(attribute) for attribute in self.attributes))
+
+    def __eq__(self, other):
+        return isinstance(other, Style) and self.attributes == other.attributes
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.attributes)
+
+    def __call__(self, string, *funcs, **additional):
+        """Styles a string with this Style combined with any Styles given.
+
+        :param string: the string around which to wrap the SGR codes.
+        :param *funcs: optional Styles (or functions that take the same
+            arguments) to be combined with this one.
+        :param **additional: additional['attributes'] is a tuple of
+            attributes to be combined before this Style's. This parameter is
+            intended for internal use when chaining.
+        """
+        if not funcs and 'attributes' not in additional:
+            return self.apply(string)
+        style, funcs = _chain(self, additional.get('attributes', ()), funcs)
+        if funcs:
+            # Only a function that is not a Style is left to be called
+            return funcs[0](string, *funcs[1:], attributes=style.attributes)
+        return style.apply(string)
+
+    def apply(self, string):
+        """Returns a string wrapped in this Style's SGR escape sequence. This
+        is equivalent to sgr.wrap(string, *attributes)."""
+        if isinstance(string, StyledText):
+            return string.style(*self.attributes)
+        if not isinstance(string, str):
+            return sgr.wrap(string, *self.attributes)
+        suffix = self.suffix
+        if suffix not in string:
+            return self.prefix + string + suffix
+        if string.endswith(suffix):
+            string = string[:-len(suffix)]
+        return self.prefix + self._separator.join(string.split(suffix)) + \
+            suffix
 
-# Text effects
 
-def normal(string, *funcs, **additional):
-    """Text effect - normal. (see _combine())."""
-    return _combine(string, code.RESET, *funcs, **additional)
-
-def underline(string, *funcs, **additional):
-    """Text effect - underline. (see _combine())."""
-    return _combine(string, code.UNDERLINE, *funcs, **additional)
-
-def bold(string, *funcs, **additional):
-    """Text effect - bold. (see _combine())."""
-    return _combine(string, code.BOLD, *funcs, **additional)
+def _combine(string, attribute, *funcs, **additional):
+    """Combines an sgr attribute with optional attribute functions and wraps
+    them around a string. (see Style)
 
-def blink(string, *funcs, **additional):
-    """Text effect - blink. (see _combine())."""
-    return _combine(string, code.BLINK, *funcs, **additional)
+    :param string: the string around which to wrap the SGR codes.
+    :param attribute: the code attribute to be used and combined with optional
+        additional attributes.
+    :param *funcs: optional attribute functions to be applied.
+    :param **additional: additional attributes to be combined with attribute.
+        This parameter is intended for internal use for recursion.
+        In **additional is additional['attributes'] which is a tuple of
+        attributes to be combined before attribute.
+    """
+    return _style(attribute)(string, *funcs, **additional)
+
+@lru_cache(maxsize=256)
+def _style(*attributes):
+    """Builds (and caches) the Style of attributes."""
+    return Style(*attributes)
+
+@lru_cache(maxsize=1024)
+def _chain(style, inherited, funcs):
+    """Resolves (and caches) a Style combined with inherited attributes and
+    a chain of Styles into one Style. Returns it and the rest of the chain,
+    starting with the first function that is not a Style."""
+    attributes = inherited + style.attributes
+    for index, func in enumerate(funcs):
+        if not isinstance(func, Style):
+            return _style(*attributes), funcs[index:]
+        attributes += func.attributes
+    return _style(*attributes), ()
 
-def rblink(string, *funcs, **additional):
-    """Text effect - rblink. (see _combine())."""
-    return _combine(string, code.RBLINK, *funcs, **additional)
 
-def reverse(string, *funcs, **additional):
-    """Text effect - reverse. (see _combine())."""
-    return _combine(string, code.REVERSE, *funcs, **additional)
+# Text effects
 
-def conceal(string, *funcs, **additional):
-    """Text effect - conceal. (see _combine())."""
-    return _combine(string, code.CONCEAL, *funcs, **additional)
+normal = Style(code.RESET, doc='Text effect - normal.')
+underline = Style(code.UNDERLINE, doc='Text effect - underline.')
+bold = Style(code.BOLD, doc='Text effect - bold.')
+blink = Style(code.BLINK, doc='Text effect - blink.')
+rblink = Style(code.RBLINK, doc='Text effect - rblink.')
+reverse = Style(code.REVERSE, doc='Text effect - reverse.')
+conceal = Style(code.CONCEAL, doc='Text effect - conceal.')
 
 
 # Basic colors
 
-def black(string, *funcs, **additional):
-    """Text color - black. (see _combine())."""
-    return _combine(string, code.BLACK, *funcs, **additional)
-
-def red(string, *funcs, **additional):
-    """Text color - red. (see _combine())."""
-    return _combine(string, code.RED, *funcs, **additional)
-
-def green(string, *funcs, **additional):
-    """Text color - green. (see _combine())."""
-    return _combine(string, code.GREEN, *funcs, **additional)
-
-def yellow(string, *funcs, **additional):
-    """Text color - yellow. (see _combine())."""
-    return _combine(string, code.YELLOW, *funcs, **additional)
-
-def blue(string, *funcs, **additional):
-    """Text color - blue. (see _combine())."""
-    return _combine(string, code.BLUE, *funcs, **additional)
-
-def magenta(string, *funcs, **additional):
-    """Text color - magenta. (see _combine())."""
-    return _combine(string, code.MAGENTA, *funcs, **additional)
-
-def cyan(string, *funcs, **additional):
-    """Text color - cyan. (see _combine())."""
-    return _combine(string, code.CYAN, *funcs, **additional)
-
-def white(string, *funcs, **additional):
-    """Text color - white. (see _combine())."""
-    return _combine(string, code.WHITE, *funcs, **additional)
+black = Style(code.BLACK, doc='Text color - black.')
+red = Style(code.RED, doc='Text color - red.')
+green = Style(code.GREEN, doc='Text color - green.')
+yellow = Style(code.YELLOW, doc='Text color - yellow.')
+blue = Style(code.BLUE, doc='Text color - blue.')
+magenta = Style(code.MAGENTA, doc='Text color - magenta.')
+cyan = Style(code.CYAN, doc='Text color - cyan.')
+white = Style(code.WHITE, doc='Text color - white.')
 
 
 # Basic background colors
 
-def bg_black(string, *funcs, **additional):
-    """Text background color - black. (see _combine())."""
-    return _combine(string, code.BG_BLACK, *funcs, **additional)
-
-def bg_red(string, *funcs, **additional):
-    """Text background color - red. (see _combine())."""
-    return _combine(string, code.BG_RED, *funcs, **additional)
-
-def bg_green(string, *funcs, **additional):
-    """Text background color - green. (see _combine())."""
-    return _combine(string, code.BG_GREEN, *funcs, **additional)
-
-def bg_yellow(string, *funcs, **additional):
-    """Text background color - yellow. (see _combine())."""
-    return _combine(string, code.BG_YELLOW, *funcs, **additional)
-
-def bg_blue(string, *funcs, **additional):
-    """Text background color - blue. (see _combine())."""
-    return _combine(string, code.BG_BLUE, *funcs, **additional)
-
-def bg_magenta(string, *funcs, **additional):
-    """Text background color - magenta. (see _combine())."""
-    return _combine(string, code.BG_MAGENTA, *funcs, **additional)
-
-def bg_cyan(string, *funcs, **additional):
-    """Text background color - cyan. (see _combine())."""
-    return _combine(string, code.BG_CYAN, *funcs, **additional)
-
-def bg_white(string, *funcs, **additional):
-    """Text background color - white. (see _combine())."""
-    return _combine(string, code.BG_WHITE, *funcs, **additional)
-
-
-
-def on_black(string, *funcs, **additional):
-    """Text background color - black. (see _combine())."""
-    return bg_black(string, *funcs, **additional)
-
-def on_red(string, *funcs, **additional):
-    """Text background color - red. (see _combine())."""
-    return bg_red(string, *funcs, **additional)
-
-def on_green(string, *funcs, **additional):
-    """Text background color - green. (see _combine())."""
-    return bg_green(string, *funcs, **additional)
-
-def on_yellow(string, *funcs, **additional):
-    """Text background color - yellow. (see _combine())."""
-    return bg_yellow(string, *funcs, **additional)
-
-def on_blue(string, *funcs, **additional):
-    """Text background color - blue. (see _combine())."""
-    return bg_blue(string, *funcs, **additional)
-
-def on_magenta(string, *funcs, **additional):
-    """Text background color - magenta. (see _combine())."""
-    return bg_magenta(string, *funcs, **additional)
-
-def on_cyan(string, *funcs, **additional):
-    """Text background color - cyan. (see _combine())."""
-    return bg_cyan(string, *funcs, **additional)
-
-def on_white(string, *funcs, **additional):
-    """Text background color - white. (see _combine())."""
-    return bg_white(string, *funcs, **additional)
+bg_black = Style(code.BG_BLACK, doc='Text background color - black.')
+bg_red = Style(code.BG_RED, doc='Text background color - red.')
+bg_green = Style(code.BG_GREEN, doc='Text background color - green.')
+bg_yellow = Style(code.BG_YELLOW, doc='Text background color - yellow.')
+bg_blue = Style(code.BG_BLUE, doc='Text background color - blue.')
+bg_magenta = Style(code.BG_MAGENTA, doc='Text background color - magenta.')
+bg_cyan = Style(code.BG_CYAN, doc='Text background color - cyan.')
+bg_white = Style(code.BG_WHITE, doc='Text background color - white.')
+on_black = Style(code.BG_BLACK, doc='Text background color - black.')
+on_red = Style(code.BG_RED, doc='Text background color - red.')
+on_green = Style(code.BG_GREEN, doc='Text background color - green.')
+on_yellow = Style(code.BG_YELLOW, doc='Text background color - yellow.')
+on_blue = Style(code.BG_BLUE, doc='Text background color - blue.')
+on_magenta = Style(code.BG_MAGENTA, doc='Text background color - magenta.')
+on_cyan = Style(code.BG_CYAN, doc='Text background color - cyan.')
+on_white = Style(code.BG_WHITE, doc='Text background color - white.')
 
 
 # Colors on a black background
-def red_on_black(string, *funcs, **additional):
-    """Text color - red on background color - black. (see _combine())."""
-    return _combine(string, code.RED, *funcs, attributes=(code.BG_BLACK,))
-
-def green_on_black(string, *funcs, **additional):
-    """Text color - green on background color - black. (see _combine())."""
-    return _combine(string, code.GREEN, *funcs, attributes=(code.BG_BLACK,))
-
-def yellow_on_black(string, *funcs, **additional):
-    """Text color - yellow on background color - black. (see _combine())."""
-    return _combine(string, code.YELLOW, *funcs, attributes=(code.BG_BLACK,))
-
-def blue_on_black(string, *funcs, **additional):
-    """Text color - blue on background color - black. (see _combine())."""
-    return _combine(string, code.BLUE, *funcs, attributes=(code.BG_BLACK,))
-
-def magenta_on_black(string, *funcs, **additional):
-    """Text color - magenta on background color - black. (see _combine())."""
-    return _combine(string, code.MAGENTA, *funcs, attributes=(code.BG_BLACK,))
-
-def cyan_on_black(string, *funcs, **additional):
-    """Text color - cyan on background color - black. (see _combine())."""
-    return _combine(string, code.CYAN, *funcs, attributes=(code.BG_BLACK,))
-
-def white_on_black(string, *funcs, **additional):
-    """Text color - white on background color - black. (see _combine())."""
-    return _combine(string, code.WHITE, *funcs, attributes=(code.BG_BLACK,))
+red_on_black = Style(
+    code.BG_BLACK, code.RED,
+    doc='Text color - red on background color - black.')
+green_on_black = Style(
+    code.BG_BLACK, code.GREEN,
+    doc='Text color - green on background color - black.')
+yellow_on_black = Style(
+    code.BG_BLACK, code.YELLOW,
+    doc='Text color - yellow on background color - black.')
+blue_on_black = Style(
+    code.BG_BLACK, code.BLUE,
+    doc='Text color - blue on background color - black.')
+magenta_on_black = Style(
+    code.BG_BLACK, code.MAGENTA,
+    doc='Text color - magenta on background color - black.')
+cyan_on_black = Style(
+    code.BG_BLACK, code.CYAN,
+    doc='Text color - cyan on background color - black.')
+white_on_black = Style(
+    code.BG_BLACK, code.WHITE,
+    doc='Text color - white on background color - black.')
 
 
 # Colors on a red background
 
-def black_on_red(string, *funcs, **additional):
-    """Text color - black on background color - red. (see _combine())."""
-    return _combine(string, code.BLACK, *funcs, attributes=(code.BG_RED,))
-
-def green_on_red(string, *funcs, **additional):
-    """Text color - green on background color - red. (see _combine())."""
-    return _combine(string, code.GREEN, *funcs, attributes=(code.BG_RED,))
-
-def yellow_on_red(string, *funcs, **additional):
-    """Text color - yellow on background color - red. (see _combine())."""
-    return _combine(string, code.YELLOW, *funcs, attributes=(code.BG_RED,))
-
-def blue_on_red(string, *funcs, **additional):
-    """Text color - blue on background color - red. (see _combine())."""
-    return _combine(string, code.BLUE, *funcs, attributes=(code.BG_RED,))
-
-def magenta_on_red(string, *funcs, **additional):
-    """Text color - magenta on background color - red. (see _combine())."""
-    return _combine(string, code.MAGENTA, *funcs, attributes=(code.BG_RED,))
-
-def cyan_on_red(string, *funcs, **additional):
-    """Text color - cyan on background color - red. (see _combine())."""
-    return _combine(string, code.CYAN, *funcs, attributes=(code.BG_RED,))
-
-def white_on_red(string, *funcs, **additional):
-    """Text color - white on background color - red. (see _combine())."""
-    return _combine(string, code.WHITE, *funcs, attributes=(code.BG_RED,))
+black_on_red = Style(
+    code.BG_RED, code.BLACK,
+    doc='Text color - black on background color - red.')
+green_on_red = Style(
+    code.BG_RED, code.GREEN,
+    doc='Text color - green on background color - red.')
+yellow_on_red = Style(
+    code.BG_RED, code.YELLOW,
+    doc='Text color - yellow on background color - red.')
+blue_on_red = Style(
+    code.BG_RED, code.BLUE,
+    doc='Text color - blue on background color - red.')
+magenta_on_red = Style(
+    code.BG_RED, code.MAGENTA,
+    doc='Text color - magenta on background color - red.')
+cyan_on_red = Style(
+    code.BG_RED, code.CYAN,
+    doc='Text color - cyan on background color - red.')
+white_on_red = Style(
+    code.BG_RED, code.WHITE,
+    doc='Text color - white on background color - red.')
 
 
 # Colors on a green background
 
-def black_on_green(string, *funcs, **additional):
-    """Text color - black on background color - green. (see _combine())."""
-    return _combine(string, code.BLACK, *funcs, attributes=(code.BG_GREEN,))
-
-def red_on_green(string, *funcs, **additional):
-    """Text color - red on background color - green. (see _combine())."""
-    return _combine(string, code.RED, *funcs, attributes=(code.BG_GREEN,))
-
-def yellow_on_green(string, *funcs, **additional):
-    """Text color - yellow on background color - green. (see _combine())."""
-    return _combine(string, code.YELLOW, *funcs, attributes=(code.BG_GREEN,))
-
-def blue_on_green(string, *funcs, **additional):
-    """Text color - blue on background color - green. (see _combine())."""
-    return _combine(string, code.BLUE, *funcs, attributes=(code.BG_GREEN,))
-
-def magenta_on_green(string, *funcs, **additional):
-    """Text color - magenta on background color - green. (see _combine())."""
-    return _combine(string, code.MAGENTA, *funcs, attributes=(code.BG_GREEN,))
-
-def cyan_on_green(string, *funcs, **additional):
-    """Text color - cyan on background color - green. (see _combine())."""
-    return _combine(string, code.CYAN, *funcs, attributes=(code.BG_GREEN,))
-
-def white_on_green(string, *funcs, **additional):
-    """Text color - white on background color - green. (see _combine())."""
-    return _combine(string, code.WHITE, *funcs, attributes=(code.BG_GREEN,))
+black_on_green = Style(
+    code.BG_GREEN, code.BLACK,
+    doc='Text color - black on background color - green.')
+red_on_green = Style(
+    code.BG_GREEN, code.RED,
+    doc='Text color - red on background color - green.')
+yellow_on_green = Style(
+    code.BG_GREEN, code.YELLOW,
+    doc='Text color - yellow on background color - green.')
+blue_on_green = Style(
+    code.BG_GREEN, code.BLUE,
+    doc='Text color - blue on background color - green.')
+magenta_on_green = Style(
+    code.BG_GREEN, code.MAGENTA,
+    doc='Text color - magenta on background color - green.')
+cyan_on_green = Style(
+    code.BG_GREEN, code.CYAN,
+    doc='Text color - cyan on background color - green.')
+white_on_green = Style(
+    code.BG_GREEN, code.WHITE,
+    doc='Text color - white on background color - green.')
 
 
 # Colors on a yellow background
 
-def black_on_yellow(string, *func, **additional):
-    """Text color - black on background color - yellow. (see _combine())."""
-    return _combine(string, code.BLACK, *func, attributes=(code.BG_YELLOW,))
-
-def red_on_yellow(string, *funcs, **additional):
-    """Text color - red on background color - yellow. (see _combine())."""
-    return _combine(string, code.RED, *funcs, attributes=(code.BG_YELLOW,))
-
-def green_on_yellow(string, *funcs, **additional):
-    """Text color - green on background color - yellow. (see _combine())."""
-    return _combine(string, code.GREEN, *funcs, attributes=(code.BG_YELLOW,))
-
-def blue_on_yellow(string, *funcs, **additional):
-    """Text color - blue on background color - yellow. (see _combine())."""
-    return _combine(string, code.BLUE, *funcs, attributes=(code.BG_YELLOW,))
-
-def magenta_on_yellow(string, *funcs, **additional):
-    """Text color - magenta on background color - yellow. (see _combine())."""
-    return _combine(string, code.MAGENTA, *funcs, attributes=(code.BG_YELLOW,))
-
-def cyan_on_yellow(string, *funcs, **additional):
-    """Text color - cyan on background color - yellow. (see _combine())."""
-    return _combine(string, code.CYAN, *funcs, attributes=(code.BG_YELLOW,))
-
-def white_on_yellow(string, *funcs, **additional):
-    """Text color - white on background color - yellow. (see _combine())."""
-    return _combine(string, code.WHITE, *funcs, attributes=(code.BG_YELLOW,))
+black_on_yellow = Style(
+    code.BG_YELLOW, code.BLACK,
+    doc='Text color - black on background color - yellow.')
+red_on_yellow = Style(
+    code.BG_YELLOW, code.RED,
+    doc='Text color - red on background color - yellow.')
+green_on_yellow = Style(
+    code.BG_YELLOW, code.GREEN,
+    doc='Text color - green on background color - yellow.')
+blue_on_yellow = Style(
+    code.BG_YELLOW, code.BLUE,
+    doc='Text color - blue on background color - yellow.')
+magenta_on_yellow = Style(
+    code.BG_YELLOW, code.MAGENTA,
+    doc='Text color - magenta on background color - yellow.')
+cyan_on_yellow = Style(
+    code.BG_YELLOW, code.CYAN,
+    doc='Text color - cyan on background color - yellow.')
+white_on_yellow = Style(
+    code.BG_YELLOW, code.WHITE,
+    doc='Text color - white on background color - yellow.')
 
 
 # Colors on a blue background
 
-def black_on_blue(string, *funcs, **additional):
-    """Text color - black on background color - blue. (see _combine())."""
-    return _combine(string, code.BLACK, *funcs, attributes=(code.BG_BLUE,))
-
-def red_on_blue(string, *funcs, **additional):
-    """Text color - red on background color - blue. (see _combine())."""
-    return _combine(string, code.RED, *funcs, attributes=(code.BG_BLUE,))
-
-def green_on_blue(string, *funcs, **additional):
-    """Text color - green on background color - blue. (see _combine())."""
-    return _combine(string, code.GREEN, *funcs, attributes=(code.BG_BLUE,))
-
-def yellow_on_blue(string, *funcs, **additional):
-    """Text color - yellow on background color - blue. (see _combine())."""
-    return _combine(string, code.YELLOW, *funcs, attributes=(code.BG_BLUE,))
-
-def magenta_on_blue(string, *funcs, **additional):
-    """Text color - magenta on background color - blue. (see _combine())."""
-    return _combine(string, code.MAGENTA, *funcs, attributes=(code.BG_BLUE,))
-
-def cyan_on_blue(string, *funcs, **additional):
-    """Text color - cyan on background color - blue. (see _combine())."""
-    return _combine(string, code.CYAN, *funcs, attributes=(code.BG_BLUE,))
-
-def white_on_blue(string, *funcs, **additional):
-    """Text color - white on background color - blue. (see _combine())."""
-    return _combine(string, code.WHITE, *funcs, attributes=(code.BG_BLUE,))
+black_on_blue = Style(
+    code.BG_BLUE, code.BLACK,
+    doc='Text color - black on background color - blue.')
+red_on_blue = Style(
+    code.BG_BLUE, code.RED,
+    doc='Text color - red on background color - blue.')
+green_on_blue = Style(
+    code.BG_BLUE, code.GREEN,
+    doc='Text color - green on background color - blue.')
+yellow_on_blue = Style(
+    code.BG_BLUE, code.YELLOW,
+    doc='Text color - yellow on background color - blue.')
+magenta_on_blue = Style(
+    code.BG_BLUE, code.MAGENTA,
+    doc='Text color - magenta on background color - blue.')
+cyan_on_blue = Style(
+    code.BG_BLUE, code.CYAN,
+    doc='Text color - cyan on background color - blue.')
+white_on_blue = Style(
+    code.BG_BLUE, code.WHITE,
+    doc='Text color - white on background color - blue.')
 
 
 # Colors on a magenta background
 
-def black_on_magenta(string, *funcs, **additional):
-    """Text color - black on background color - magenta. (see _combine())."""
-    return _combine(string, code.BLACK, *funcs, attributes=(code.BG_MAGENTA,))
-
-def red_on_magenta(string, *funcs, **additional):
-    """Text color - red on background color - magenta. (see _combine())."""
-    return _combine(string, code.RED, *funcs, attributes=(code.BG_MAGENTA,))
-
-def green_on_magenta(string, *funcs, **additional):
-    """Text color - green on background color - magenta. (see _combine())."""
-    return _combine(string, code.GREEN, *funcs, attributes=(code.BG_MAGENTA,))
-
-def yellow_on_magenta(string, *funcs, **additional):
-    """Text color - yellow on background color - magenta. (see _combine())."""
-    return _combine(string, code.YELLOW, *funcs, attributes=(code.BG_MAGENTA,))
-
-def blue_on_magenta(string, *funcs, **additional):
-    """Text color - blue on background color - magenta. (see _combine())."""
-    return _combine(string, code.BLUE, *funcs, attributes=(code.BG_MAGENTA,))
-
-def cyan_on_magenta(string, *funcs, **additional):
-    """Text color - cyan on background color - magenta. (see _combine())."""
-    return _combine(string, code.CYAN, *funcs, attributes=(code.BG_MAGENTA,))
-
-def white_on_magenta(string, *funcs, **additional):
-    """Text color - white on background color - magenta. (see _combine())."""
-    return _combine(string, code.WHITE, *funcs, attributes=(code.BG_MAGENTA,))
+black_on_magenta = Style(
+    code.BG_MAGENTA, code.BLACK,
+    doc='Text color - black on background color - magenta.')
+red_on_magenta = Style(
+    code.BG_MAGENTA, code.RED,
+    doc='Text color - red on background color - magenta.')
+green_on_magenta = Style(
+    code.BG_MAGENTA, code.GREEN,
+    doc='Text color - green on background color - magenta.')
+yellow_on_magenta = Style(
+    code.BG_MAGENTA, code.YELLOW,
+    doc='Text color - yellow on background color - magenta.')
+blue_on_magenta = Style(
+    code.BG_MAGENTA, code.BLUE,
+    doc='Text color - blue on background color - magenta.')
+cyan_on_magenta = Style(
+    code.BG_MAGENTA, code.CYAN,
+    doc='Text color - cyan on background color - magenta.')
+white_on_magenta = Style(
+    code.BG_MAGENTA, code.WHITE,
+    doc='Text color - white on background color - magenta.')
 
 
 # Colors on a cyan background
 
-def black_on_cyan(string, *funcs, **additional):
-    """Text color - black on background color - cyan. (see _combine())."""
-    return _combine(string, code.BLACK, *funcs, attributes=(code.BG_CYAN,))
-
-def red_on_cyan(string, *funcs, **additional):
-    """Text color - red on background color - cyan. (see _combine())."""
-    return _combine(string, code.RED, *funcs, attributes=(code.BG_CYAN,))
-
-def green_on_cyan(string, *funcs, **additional):
-    """Text color - green on background color - cyan. (see _combine())."""
-    return _combine(string, code.GREEN, *funcs, attributes=(code.BG_CYAN,))
-
-def yellow_on_cyan(string, *funcs, **additional):
-    """Text color - yellow on background color - cyan. (see _combine())."""
-    return _combine(string, code.YELLOW, *funcs, attributes=(code.BG_CYAN,))
-
-def blue_on_cyan(string, *funcs, **additional):
-    """Text color - blue on background color - cyan. (see _combine())."""
-    return _combine(string, code.BLUE, *funcs, attributes=(code.BG_CYAN,))
-
-def magenta_on_cyan(string, *funcs, **additional):
-    """Text color - magenta on background color - cyan. (see _combine())."""
-    return _combine(string, code.MAGENTA, *funcs, attributes=(code.BG_CYAN,))
-
-def white_on_cyan(string, *funcs, **additional):
-    """Text color - white on background color - cyan. (see _combine())."""
-    return _combine(string, code.WHITE, *funcs, attributes=(code.BG_CYAN,))
+black_on_cyan = Style(
+    code.BG_CYAN, code.BLACK,
+    doc='Text color - black on background color - cyan.')
+red_on_cyan = Style(
+    code.BG_CYAN, code.RED,
+    doc='Text color - red on background color - cyan.')
+green_on_cyan = Style(
+    code.BG_CYAN, code.GREEN,
+    doc='Text color - green on background color - cyan.')
+yellow_on_cyan = Style(
+    code.BG_CYAN, code.YELLOW,
+    doc='Text color - yellow on background color - cyan.')
+blue_on_cyan = Style(
+    code.BG_CYAN, code.BLUE,
+    doc='Text color - blue on background color - cyan.')
+magenta_on_cyan = Style(
+    code.BG_CYAN, code.MAGENTA,
+    doc='Text color - magenta on background color - cyan.')
+white_on_cyan = Style(
+    code.BG_CYAN, code.WHITE,
+    doc='Text color - white on background color - cyan.')
 
 
 # Colors on a white background
 
-def black_on_white(string, *funcs, **additional):
-    """Text color - black on background color - white. (see _combine())."""
-    return _combine(string, code.BLACK, *funcs, attributes=(code.BG_WHITE,))
+black_on_white = Style(
+    code.BG_WHITE, code.BLACK,
+    doc='Text color - black on background color - white.')
+red_on_white = Style(
+    code.BG_WHITE, code.RED,
+    doc='Text color - red on background color - white.')
+green_on_white = Style(
+    code.BG_WHITE, code.GREEN,
+    doc='Text color - green on background color - white.')
+yellow_on_white = Style(
+    code.BG_WHITE, code.YELLOW,
+    doc='Text color - yellow on background color - white.')
+blue_on_white = Style(
+    code.BG_WHITE, code.BLUE,
+    doc='Text color - blue on background color - white.')
+magenta_on_white = Style(
+    code.BG_WHITE, code.MAGENTA,
+    doc='Text color - magenta on background color - white.')
+cyan_on_white = Style(
+    code.BG_WHITE, code.CYAN,
+    doc='Text color - cyan on background color - white.')
+
+
+# Extended (256 and RGB) colors
+
+def color(*value):
+    """Returns the text color Style for a 256 color index or an RGB color.
+    (see palette.color() and Style).
 
-def red_on_white(string, *funcs, **additional):
-    """Text color - red on background color - white. (see _combine())."""
-    return _combine(string, code.RED, *funcs, attributes=(code.BG_WHITE,))
-
-def green_on_white(string, *funcs, **additional):
-    """Text color - green on background color - white. (see _combine())."""
-    return _combine(string, code.GREEN, *funcs, attributes=(code.BG_WHITE,))
-
-def yellow_on_white(string, *funcs, **additional):
-    """Text color - yellow on background color - white. (see _combine())."""
-    return _combine(string, code.YELLOW, *funcs, attributes=(code.BG_WHITE,))
-
-def blue_on_white(string, *funcs, **additional):
-    """Text color - blue on background color - white. (see _combine())."""
-    return _combine(string, code.BLUE, *funcs, attributes=(code.BG_WHITE,))
-
-def magenta_on_white(string, *funcs, **additional):
-    """Text color - magenta on background color - white. (see _combine())."""
-    return _combine(string, code.MAGENTA, *funcs, attributes=(code.BG_WHITE,))
+    Usage::
+        >>> print(color(255, 135, 0)('Orange text.', bold))
+    """
+    return _style(palette.color(*value))
 
-def cyan_on_white(string, *funcs, **additional):
-    """Text color - cyan on background color - white. (see _combine())."""
-    return _combine(string, code.CYAN, *funcs, attributes=(code.BG_WHITE,))
+def on_color(*value):
+    """Returns the text background color Style for a 256 color index or an
+    RGB color. (see palette.on_color() and Style)."""
+    return _style(palette.on_color(*value))
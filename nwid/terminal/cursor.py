@@ -12,12 +12,14 @@ nwid.terminal.cursor
 ~~~~~~~~~~~~~~~~~~~~
 
 This module contains functions responsible for moving and manipulating the
-cursor.
+cursor, and the CursorTracker object that plans the cheapest way to move it.
 """
 
 from __future__ import absolute_import
 
+from nwid import Point
 from . import codes as code
+from . import output
 
 
 def hide():
@@ -31,43 +33,60 @@ def show():
 def move_up(n=1):
     """Moves your cursor up 'n' rows."""
     # TODO: is math correct here ?
+    tracker.forget()
     code.CURSOR_UP(n)
 
 def move_down(n=1):
     """Moves your cursor down 'n' rows."""
+    tracker.forget()
     code.CURSOR_DOWN(n)
 
 def move_left(n=1):
     """Moves your cursor left (backward) 'n' characters."""
+    tracker.forget()
     code.CURSOR_LEFT(n)
 
 def move_right(n=1):
     """Moves your cursor right (forward) 'n' characters."""
+    tracker.forget()
     code.CURSOR_RIGHT(n)
 
 def next_line(n=1):
     """Moves your cursor (up) to the start of the next 'n'th line."""
+    tracker.forget()
     code.CURSOR_NEXT_LINE(n)
 
 def previous_line(n=1):
     """Moves your cursor (down) to the start of the previous 'n'th line."""
+    tracker.forget()
     code.CURSOR_PREVIOUS_LINE(n)
 
 def horizontal_absolute(n=1):
     """Moves your cursor to the 'n' column."""
     # TODO: not completely clear on this one...
+    tracker.forget()
     code.CURSOR_HORIZONTAL_ABSOLUTE(n)
 
 def set_position(row=0, col=0):
     """Moves cursor to position (row, col)."""
+    # The terminal treats 0 the same as 1 (the first row or column)
+    tracker.position = Point(max(row, 1) - 1, max(col, 1) - 1)
     code.CURSOR_SET_POSITION(row, col)
 
+def move_to(row, col):
+    """Moves the cursor to the zero-based position (row, col) using the
+    fewest bytes possible from the tracked cursor position."""
+    sequence = tracker.move_to(row, col)
+    if sequence:
+        output.write(sequence)
+
 def save_position():
     """Save the current cursor position."""
     code.CURSOR_SAVE_POSITION()
 
 def restore_position():
     """Restore the last saved cursor position."""
+    tracker.forget()
     code.CURSOR_RESTORE_POSITION()
 
 def get_position():
@@ -87,3 +106,112 @@ def col():
     """Returns the cursor's current column."""
     row, col = get_position()
     return col()
+
+
+# Cursor tracking #
+
+class CursorTracker(object):
+    """Keeps track of where the terminal cursor is and plans the cheapest
+    sequence to move it somewhere else.
+
+    Positions are zero-based. A position of None means the cursor's position is
+    not known; the next move will then use an absolute position.
+
+    The relative moves assume the terminal is in raw mode (no output
+    post-processing) so that a linefeed moves straight down.
+    """
+
+    def __init__(self, position=None, width=None):
+        """Initializes the tracker with an optional known position and the
+        width of the screen (used to detect a pending line wrap)."""
+        self.position = position
+        self.width = width
+
+    def forget(self):
+        """Marks the cursor position as unknown."""
+        self.position = None
+
+    def move_to(self, row, col):
+        """Returns the cheapest sequence to move the cursor to (row, col) and
+        records the new position."""
+        if self.position is None:
+            sequence = _absolute(row, col)
+        else:
+            sequence = plan_move(self.position.row, self.position.col, row, col)
+        self.position = Point(row, col)
+        return sequence
+
+    def advance(self, cols=1):
+        """Records that cols characters were written at the cursor position."""
+        if self.position is None:
+            return
+        self.position.col += cols
+        if self.width is not None and self.position.col >= self.width:
+            # The terminal is pending a wrap which terminals handle differently
+            self.position = None
+
+
+tracker = CursorTracker()
+
+
+def cache_positions(screen_size):
+    """Sizes the cache of cursor position sequences so that it can hold every
+    position on a screen of screen_size."""
+    code.CURSOR_SET_POSITION.cache_size = max(
+        screen_size.row * screen_size.col, code.TerminalCode.cache_size)
+
+
+def plan_move(from_row, from_col, to_row, to_col):
+    """Returns the shortest sequence that moves the cursor from one zero-based
+    position to another.
+
+    The candidates are an absolute move (CUP) and combinations of carriage
+    return, linefeed, backspace, the relative CSI moves, next/previous line,
+    and horizontal absolute (CHA). This is the same idea as curses' mvcur.
+    """
+    rows = to_row - from_row
+    candidates = [
+        _vertical(rows) + _horizontal(from_col, to_col),
+        _absolute(to_row, to_col),
+    ]
+    if to_col < from_col:
+        candidates.append(code.CR + _vertical(rows) + _horizontal(0, to_col))
+    if rows > 0:
+        candidates.append(code.CURSOR_NEXT_LINE.using(rows) +
+                          _horizontal(0, to_col))
+    elif rows < 0:
+        candidates.append(code.CURSOR_PREVIOUS_LINE.using(-rows) +
+                          _horizontal(0, to_col))
+    return min(candidates, key=len)
+
+
+## Cursor Helper Functions ##
+
+def _absolute(row, col):
+    """Returns the sequence to move to a zero-based position (row, col)."""
+    return code.CURSOR_SET_POSITION.using(row + 1, col + 1)
+
+def _vertical(rows):
+    """Returns the shortest sequence that moves the cursor 'rows' rows down
+    (or up if negative) without changing its column."""
+    if rows > 0:
+        return min(code.LF * rows, code.CURSOR_DOWN.using(rows), key=len)
+    if rows < 0:
+        return code.CURSOR_UP.using(-rows)
+    return ''
+
+def _horizontal(from_col, to_col):
+    """Returns the shortest sequence that moves the cursor from one column to
+    another without changing its row."""
+    cols = to_col - from_col
+    if cols == 0:
+        return ''
+    if to_col == 0:
+        return code.CR
+    if cols > 0:
+        candidates = [code.CURSOR_RIGHT.using(cols)]
+    else:
+        candidates = [code.BS * -cols, code.CURSOR_LEFT.using(-cols),
+                      code.CR + code.CURSOR_RIGHT.using(to_col)]
+    candidates.append(code.CURSOR_HORIZONTAL_ABSOLUTE.using(to_col + 1))
+    return min(candidates, key=len)
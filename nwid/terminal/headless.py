@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             headless.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+nwid.terminal.headless
+~~~~~~~~~~~~~~~~~~~~~~
+
+This module contains the VirtualTerminal object, an in-memory terminal that
+interprets the escape sequences nwid emits into a grid of cells.
+
+It is used to render without a real terminal (for instance, in tests or CI) and
+to inspect exactly what ends up on the screen.
+
+@see: https://vt100.net/docs/vt100-ug/chapter3.html
+"""
+
+from __future__ import absolute_import
+
+import re
+
+from nwid import Point, Size
+from . import codes as code
+from . import sgr
+from .screen import Cell
+
+
+_SEQUENCE = re.compile(
+    r'\x1b\[([0-?]*)([ -/]*)([@-~])'        # CSI sequence
+    r'|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)'   # OSC string (ignored)
+    r'|\x1b([ -/]*[0-Z\\^-~])'              # Other escape sequences
+    r'|([\x00-\x1a\x1c-\x1f\x7f])'          # Control characters
+    r'|\x1b'                                # A stray ESC (ignored)
+)
+
+# An escape sequence cut off at the end of the output
+_INCOMPLETE = re.compile(
+    r'\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*\x1b?|[ -/]*)\Z')
+
+class VirtualTerminal(object):
+    """An in-memory terminal of a fixed size.
+
+    Feeding it output updates its cells, cursor, and scroll region the way a
+    VT100/xterm compatible terminal in raw mode would. Rows and columns are
+    zero-based. Each cell is a Cell whose style is an sgr.Rendition.
+    """
+
+    # The longest incomplete escape sequence kept between two feeds
+    max_pending = 4096
+
+    def __init__(self, screen_size=None):
+        """Initializes a blank terminal of the given Size (default 25x80)."""
+        self.size = Size(*screen_size) if screen_size else Size(25, 80)
+        self.reset()
+
+    def reset(self):
+        """Resets the terminal to its initial state."""
+        self.rendition = sgr.DEFAULT
+        self.cells = [self._blank_line() for _ in range(self.size.row)]
+        self.cursor = Point(0, 0)
+        self.cursor_visible = True
+        self.line_wrap = True
+        self.scroll_top = 0
+        self.scroll_bottom = self.size.row
+        self._saved_cursor = Point(0, 0)
+        self._pending_wrap = False
+        self._pending = ''
+
+    ## Inspecting the screen ##
+
+    def cell(self, row, col):
+        """Returns the Cell at (row, col)."""
+        return self.cells[row][col]
+
+    def line(self, row):
+        """Returns the text of a row (without trailing spaces)."""
+        return ''.join(cell.char for cell in self.cells[row]).rstrip()
+
+    @property
+    def display(self):
+        """A list of the text of every row (without trailing spaces)."""
+        return [self.line(row) for row in range(self.size.row)]
+
+    ## Feeding output ##
+
+    def feed(self, string):
+        """Interprets a string of output. An escape sequence split between two
+        calls is completed by the second."""
+        string = self._pending + string
+        self._pending = ''
+        incomplete = _INCOMPLETE.search(string)
+        if incomplete:
+            # Wait for the rest of the sequence
+            self._pending = string[incomplete.start():][:self.max_pending]
+            string = string[:incomplete.start()]
+        index = 0
+        for match in _SEQUENCE.finditer(string):
+            if match.start() > index:
+                self._print(string[index:match.start()])
+            index = match.end()
+            params, intermediates, final, escape, control = match.groups()
+            if final is not None:
+                self._csi(params, intermediates, final)
+            elif escape is not None:
+                self._escape(escape)
+            elif control is not None:
+                self._control(control)
+        if index < len(string):
+            self._print(string[index:])
+
+    def _print(self, text):
+        """Prints text at the cursor."""
+        for char in text:
+            if self._pending_wrap:
+                self._pending_wrap = False
+                self.cursor.col = 0
+                self._linefeed()
+            self.cells[self.cursor.row][self.cursor.col] = \
+                Cell(char, self.rendition)
+            if self.cursor.col + 1 < self.size.col:
+                self.cursor.col += 1
+            elif self.line_wrap:
+                self._pending_wrap = True
+
+    def _control(self, char):
+        """Handles a control character."""
+        if char == code.CR:
+            self._move(self.cursor.row, 0)
+        elif char == code.LF or char == code.VT or char == code.FF:
+            self._pending_wrap = False
+            self._linefeed()
+        elif char == code.BS:
+            self._move(self.cursor.row, self.cursor.col - 1)
+        elif char == code.HT:
+            self._move(self.cursor.row, (self.cursor.col // 8 + 1) * 8)
+
+    def _escape(self, sequence):
+        """Handles a (non-CSI) escape sequence."""
+        if sequence == 'D':                     # SCROLL_UP (index)
+            self._pending_wrap = False
+            self._linefeed()
+        elif sequence == 'M':                   # SCROLL_DOWN (reverse index)
+            self._pending_wrap = False
+            if self.cursor.row == self.scroll_top:
+                self._scroll(-1)
+            else:
+                self._move(self.cursor.row - 1, self.cursor.col)
+        elif sequence == 'E':                   # Next line
+            self._move(self.cursor.row, 0)
+            self._linefeed()
+        elif sequence == '7':
+            self._saved_cursor = Point(self.cursor.row, self.cursor.col)
+        elif sequence == '8':
+            self._move(self._saved_cursor.row, self._saved_cursor.col)
+        elif sequence == 'c':                   # RESET_TERMINAL
+            self.reset()
+
+    def _csi(self, params, intermediates, final):
+        """Handles a CSI sequence."""
+        if params.startswith('?'):
+            self._private_mode(params[1:], final)
+            return
+        args = [int(arg) if arg.isdigit() else None
+                for arg in params.split(';')] if params else []
+
+        def arg(index=0, default=1):
+            """Returns the argument at index (0 means default)."""
+            if index < len(args) and args[index]:
+                return args[index]
+            return default
+
+        row, col = self.cursor.row, self.cursor.col
+        if final == 'A':
+            self._move(row - arg(), col)
+        elif final == 'B':
+            self._move(row + arg(), col)
+        elif final == 'C':
+            self._move(row, col + arg())
+        elif final == 'D':
+            self._move(row, col - arg())
+        elif final == 'E':
+            self._move(row + arg(), 0)
+        elif final == 'F':
+            self._move(row - arg(), 0)
+        elif final == 'G':
+            self._move(row, arg() - 1)
+        elif final in 'Hf':
+            self._move(arg(0) - 1, arg(1) - 1)
+        elif final == 'J':
+            self._erase_display(arg(0, 0))
+        elif final == 'K':
+            self._erase_line(arg(0, 0))
+        elif final == 'm':
+            self._select_graphic_rendition(params)
+        elif final == 'r':
+            top, bottom = arg(0) - 1, min(arg(1, self.size.row), self.size.row)
+            if top < bottom - 1:
+                self.scroll_top, self.scroll_bottom = top, bottom
+                self._move(0, 0)
+        elif final == 'S':
+            self._scroll(arg())
+        elif final == 'T':
+            self._scroll(-arg())
+        elif final == 's':
+            self._saved_cursor = Point(row, col)
+        elif final == 'u':
+            self._move(self._saved_cursor.row, self._saved_cursor.col)
+        elif final == 'h' and params == '7':
+            self.line_wrap = True
+        elif final == 'l' and params == '7':
+            self.line_wrap = False
+
+    def _private_mode(self, params, final):
+        """Handles a private mode (CSI ?) sequence."""
+        if params == '25':
+            self.cursor_visible = (final == 'h')
+        elif params == '7':
+            self.line_wrap = (final == 'h')
+
+    def _select_graphic_rendition(self, params):
+        """Applies the SGR parameters to the current rendition."""
+        self.rendition = sgr.parse(params, self.rendition)
+
+    ## Screen Helper Functions ##
+
+    def _move(self, row, col):
+        """Moves the cursor, keeping it on the screen."""
+        self._pending_wrap = False
+        self.cursor = Point(min(max(row, 0), self.size.row - 1),
+                            min(max(col, 0), self.size.col - 1))
+
+    def _linefeed(self):
+        """Moves the cursor down a row, scrolling at the bottom margin."""
+        if self.cursor.row == self.scroll_bottom - 1:
+            self._scroll(1)
+        elif self.cursor.row < self.size.row - 1:
+            self.cursor.row += 1
+
+    def _scroll(self, rows):
+        """Scrolls the scroll region's content up (or down if negative)."""
+        top, bottom = self.scroll_top, self.scroll_bottom
+        rows = max(min(rows, bottom - top), top - bottom)
+        blank = [self._blank_line() for _ in range(abs(rows))]
+        if rows > 0:
+            self.cells[top:bottom] = self.cells[top + rows:bottom] + blank
+        elif rows < 0:
+            self.cells[top:bottom] = blank + self.cells[top:bottom + rows]
+
+    def _erase_display(self, mode):
+        """Erases part of the display (CLEAR_DOWN, CLEAR_UP, CLEAR_SCREEN)."""
+        row = self.cursor.row
+        if mode == 0:
+            self._erase_line(0)
+            rows = range(row + 1, self.size.row)
+        elif mode == 1:
+            self._erase_line(1)
+            rows = range(0, row)
+        else:
+            rows = range(self.size.row)
+        for _row in rows:
+            self.cells[_row] = self._blank_line()
+
+    def _erase_line(self, mode):
+        """Erases part of the cursor's line (CLEAR_LINE_FORWARD,
+        CLEAR_LINE_BACKWARD, CLEAR_LINE)."""
+        line, col = self.cells[self.cursor.row], self.cursor.col
+        start, stop = {0: (col, self.size.col), 1: (0, col + 1)}.get(
+            mode, (0, self.size.col))
+        line[start:stop] = self._blank_line()[start:stop]
+
+    def _blank_line(self):
+        """Returns a row of blank cells in the current background color."""
+        blank = Cell(' ', sgr.Rendition(frozenset(), None,
+                                        self.rendition.bg_color))
+        return [blank] * self.size.col
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             output.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+nwid.terminal.output
+~~~~~~~~~~~~~~~~~~~~
+
+This module contains the functions responsible for writing to the terminal.
+
+Outside of a frame, everything is written to the output backend (stdout by
+default) immediately. Inside of a frame, output is collected into one buffer
+and sent to the backend with a single write when the outermost frame is
+committed.
+
+Usage::
+    >>> with frame():
+    ...     cursor.set_position(1, 1)
+    ...     write('Hello')
+    ...     screen.clear_line_forward()
+"""
+
+from __future__ import absolute_import
+
+from contextlib import contextmanager
+
+from .backend import FileBackend
+
+
+_backend = FileBackend()
+_frame_buffer = None
+_frame_depth = 0
+
+
+def set_backend(backend):
+    """Sets the OutputBackend that output is written to. Returns the previous
+    backend."""
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
+
+def get_backend():
+    """Returns the OutputBackend that output is written to."""
+    return _backend
+
+def write(string):
+    """Writes a string to the terminal, or to the current frame's buffer if a
+    frame is open."""
+    if _frame_buffer is not None:
+        _frame_buffer.extend(string.encode(_backend.encoding))
+        return
+    _backend.write_text(string)
+
+@contextmanager
+def frame():
+    """A context manager that collects all output written inside of it and
+    commits it to the terminal in one write.
+
+    Frames may be nested; only the outermost frame commits. If an exception
+    is raised inside the frame, the collected output is discarded.
+    """
+    global _frame_buffer, _frame_depth
+    if _frame_depth == 0:
+        _frame_buffer = bytearray()
+    _frame_depth += 1
+    try:
+        yield
+    except BaseException:
+        if _frame_depth == 1:
+            _frame_buffer = None
+        raise
+    finally:
+        _frame_depth -= 1
+    if _frame_depth == 0:
+        data, _frame_buffer = _frame_buffer, None
+        commit(data)
+
+def in_frame():
+    """Returns True if output is currently being collected by a frame."""
+    return _frame_buffer is not None
+
+def commit(data):
+    """Writes a bytes-like object to the backend in one write."""
+    if data:
+        _backend.write(data)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             palette.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+nwid.terminal.palette
+~~~~~~~~~~~~~~~~~~~~~
+
+This module contains the extended (256 color and 24-bit truecolor) SGR colors
+and the functions that downsample them for terminals that support fewer
+colors.
+
+Downsampling never searches the palette: the nearest color of every channel
+value, gray level, and 256 color index is precomputed into lookup tables when
+this module is loaded, so converting a color is a few table lookups.
+
+Usage::
+    >>> sgr.create(palette.color(255, 135, 0), palette.on_color(236))
+    >>> palette.downsample(palette.color(255, 135, 0), 256)
+"""
+
+from __future__ import absolute_import
+
+from functools import lru_cache
+import os
+
+from . import codes as code
+from . import sgr
+
+
+# The number of colors a terminal can display
+COLORS_16 = 16
+COLORS_256 = 256
+TRUECOLOR = 1 << 24
+
+
+## Extended colors ##
+
+class ExtendedColor(code.TerminalCode):
+    """An SGR color that uses the EXTENDED (38) or BG_EXTENDED (48) code: one
+    of the 256 indexed colors, or a 24-bit RGB color.
+
+    Two ExtendedColors with the same value are equal, so they can be used
+    interchangeably in Renditions and StyleTables.
+    """
+
+    def __init__(self, color, background=False):
+        """Initializes the color with a 256 color index or an (r, g, b) tuple.
+        """
+        if isinstance(color, int):
+            if not 0 <= color < 256:
+                raise ValueError('A 256 color index must be from 0 to 255.')
+            self.index, self.rgb = color, PALETTE[color]
+            parameters = '5;{0}'.format(color)
+        else:
+            color = tuple(color)
+            if len(color) != 3 or not all(0 <= value < 256 for value in color):
+                raise ValueError('An RGB color must be three values from 0 to '
+                                 '255.')
+            self.index, self.rgb = None, color
+            parameters = '2;{0};{1};{2}'.format(*color)
+        self.background = background
+        extended = code.BG_EXTENDED if background else code.EXTENDED
+        super(ExtendedColor, self).__init__(
+            ('BG_' if background else '') + 'COLOR_' + parameters[2:],
+            extended.value + code.DELIMITER + parameters,
+            'bg_color' if background else 'fg_color')
+
+    def __eq__(self, other):
+        return isinstance(other, ExtendedColor) and self.value == other.value
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return 'ExtendedColor({0!r}, background={1!r})'.format(
+            self.rgb if self.index is None else self.index, self.background)
+
+
+def color(*value):
+    """Returns the text color for a 256 color index or an RGB color.
+
+    Usage::
+        >>> palette.color(208)
+        >>> palette.color(255, 135, 0)
+    """
+    return _extended_color(value, False)
+
+def on_color(*value):
+    """Returns the background color for a 256 color index or an RGB color."""
+    return _extended_color(value, True)
+
+@lru_cache(maxsize=4096)
+def _extended_color(value, background):
+    """Builds (and caches) an ExtendedColor."""
+    return ExtendedColor(value[0] if len(value) == 1 else value, background)
+
+
+## Downsampling ##
+
+def detect():
+    """Returns the number of colors the terminal supports, as advertised by
+    the COLORTERM and TERM environment variables."""
+    if os.environ.get('COLORTERM', '').lower() in ('truecolor', '24bit'):
+        return TRUECOLOR
+    if '256color' in os.environ.get('TERM', ''):
+        return COLORS_256
+    return COLORS_16
+
+def rgb_to_256(r, g, b):
+    """Returns the index of the 256 color palette closest to an RGB color.
+
+    The closest color cube entry and the closest gray ramp entry are read from
+    lookup tables; the nearer of the two is returned."""
+    cr, cg, cb = _CUBE_LEVEL[r], _CUBE_LEVEL[g], _CUBE_LEVEL[b]
+    gray = _GRAY_LEVEL[(r + g + b) // 3]
+    dr, dg, db = _CUBE[cr] - r, _CUBE[cg] - g, _CUBE[cb] - b
+    level = _GRAY[gray]
+    if (level - r) ** 2 + (level - g) ** 2 + (level - b) ** 2 < \
+            dr * dr + dg * dg + db * db:
+        return 232 + gray
+    return 16 + 36 * cr + 6 * cg + cb
+
+def rgb_to_16(r, g, b):
+    """Returns the index (0-15) of the basic color closest to an RGB color."""
+    return _NEAREST_16[rgb_to_256(r, g, b)]
+
+def downsample(attribute, colors):
+    """Returns an SGR attribute that the terminal can display with the given
+    number of colors (COLORS_16, COLORS_256, or TRUECOLOR). Attributes that
+    are not ExtendedColors are returned as they are."""
+    if not isinstance(attribute, ExtendedColor) or colors >= TRUECOLOR:
+        return attribute
+    return _downsample(attribute, colors >= COLORS_256)
+
+@lru_cache(maxsize=4096)
+def _downsample(attribute, has_256_colors):
+    """Converts (and caches) an ExtendedColor to 256 or 16 colors."""
+    index = attribute.index
+    if index is None:
+        index = rgb_to_256(*attribute.rgb)
+    if has_256_colors:
+        return _extended_color((index,), attribute.background)
+    basic = _BG_BASIC if attribute.background else _FG_BASIC
+    return basic[_NEAREST_16[index]]
+
+def downsample_rendition(rendition, colors):
+    """Returns a Rendition with its colors downsampled (see downsample())."""
+    if colors >= TRUECOLOR:
+        return rendition
+    return _downsample_rendition(rendition, colors)
+
+@lru_cache(maxsize=1024)
+def _downsample_rendition(rendition, colors):
+    """Builds (and caches) a downsampled Rendition."""
+    styles, fg_color, bg_color = rendition
+    return sgr.Rendition(
+        styles,
+        fg_color if fg_color is None else downsample(fg_color, colors),
+        bg_color if bg_color is None else downsample(bg_color, colors))
+
+
+## Palette Helper Functions ##
+
+def _distance(rgb, other):
+    """Returns the squared distance between two RGB colors."""
+    return sum((a - b) * (a - b) for a, b in zip(rgb, other))
+
+def _nearest(value, levels):
+    """Returns the index of the level nearest to value."""
+    return min(range(len(levels)), key=lambda index: abs(levels[index] - value))
+
+
+# The xterm 256 color palette: 16 basic colors, a 6x6x6 color cube, and a
+# 24 step gray ramp.
+_BASIC = [
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+    (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+]
+_CUBE = (0, 95, 135, 175, 215, 255)
+_GRAY = tuple(8 + 10 * step for step in range(24))
+
+PALETTE = tuple(_BASIC + [(r, g, b) for r in _CUBE for g in _CUBE for b in _CUBE]
+                + [(gray, gray, gray) for gray in _GRAY])
+
+# The nearest color cube level and gray ramp step of every channel value
+_CUBE_LEVEL = bytes(_nearest(value, _CUBE) for value in range(256))
+_GRAY_LEVEL = bytes(_nearest(value, _GRAY) for value in range(256))
+
+# The nearest basic color of every 256 color index
+_NEAREST_16 = bytes(
+    index if index < 16 else
+    min(range(16), key=lambda basic: _distance(_BASIC[basic], PALETTE[index]))
+    for index in range(256))
+
+# The SGR codes of the 16 basic colors
+_FG_BASIC = (code.BLACK, code.RED, code.GREEN, code.YELLOW,
+             code.BLUE, code.MAGENTA, code.CYAN, code.WHITE,
+             code.BRIGHT_BLACK, code.BRIGHT_RED, code.BRIGHT_GREEN,
+             code.BRIGHT_YELLOW, code.BRIGHT_BLUE, code.BRIGHT_MAGENTA,
+             code.BRIGHT_CYAN, code.BRIGHT_WHITE)
+_BG_BASIC = (code.BG_BLACK, code.BG_RED, code.BG_GREEN, code.BG_YELLOW,
+             code.BG_BLUE, code.BG_MAGENTA, code.BG_CYAN, code.BG_WHITE,
+             code.BG_BRIGHT_BLACK, code.BG_BRIGHT_RED, code.BG_BRIGHT_GREEN,
+             code.BG_BRIGHT_YELLOW, code.BG_BRIGHT_BLUE,
+             code.BG_BRIGHT_MAGENTA, code.BG_BRIGHT_CYAN,
+             code.BG_BRIGHT_WHITE)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             parser.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+nwid.terminal.parser
+~~~~~~~~~~~~~~~~~~~~
+
+This module contains StreamParser, an incremental parser of terminal output.
+
+It is fed output in chunks of any size (bytes or str), such as reads from a
+pipe or a socket, and yields the text and control sequences of each chunk as
+soon as they are complete. A multi-byte character or an escape sequence split
+between two chunks is completed by the next one, so output never has to be
+buffered into lines first.
+
+Usage::
+    >>> parser = StreamParser()
+    >>> for item in parser.feed(os.read(fd, 4096)):
+    ...     if isinstance(item, ControlSequence):
+    ...         handle(item)
+    ...     else:
+    ...         print_text(item)
+
+@see: http://www.ecma-international.org/publications/files/ECMA-ST/Ecma-048.pdf
+"""
+
+from __future__ import absolute_import
+
+from collections import namedtuple
+import codecs
+import re
+
+
+# A parsed control sequence:
+#   kind            - 'CSI', 'OSC', 'DCS', 'SOS', 'PM', 'APC' (control
+#                     strings), 'ESC' (other escape sequences), or 'control'
+#                     (a single control character).
+#   parameters      - the parameter bytes of a CSI or the body of a control
+#                     string ('' for the others).
+#   intermediates   - the intermediate bytes of a CSI or an escape sequence.
+#   final           - the final byte of a CSI or an escape sequence, or the
+#                     control character.
+#   string          - the entire sequence as it appeared in the output.
+ControlSequence = namedtuple(
+    'ControlSequence',
+    ['kind', 'parameters', 'intermediates', 'final', 'string'])
+
+# The kind of control string of each introducer (7-bit and 8-bit)
+_CONTROL_STRINGS = {
+    ']': 'OSC', 'P': 'DCS', 'X': 'SOS', '^': 'PM', '_': 'APC',
+    '\x9d': 'OSC', '\x90': 'DCS', '\x98': 'SOS', '\x9e': 'PM', '\x9f': 'APC',
+}
+
+# Every complete control sequence. Whitespace (tab, newline, carriage return,
+# etc.) is left in the text.
+_SEQUENCE = re.compile(
+    r'(?:\x1b\[|\x9b)([0-?]*)([ -/]*)([@-~])'                   # CSI
+    r'|(?:\x1b([\]PX^_])|([\x90\x98\x9d\x9e\x9f]))'             # Control string
+    r'([^\x07\x1b\x9c]*)(?:\x07|\x1b\\|\x9c)'
+    r'|\x1b([ -/]*)([0-OQ-WYZ\\`-~])'                           # Escape sequence
+    r'|([\x00-\x08\x0e-\x1f\x7f-\x9f])'                         # Control character
+)
+
+# A control sequence cut off at the end of a chunk
+_INCOMPLETE = re.compile(
+    r'(?:\x1b(?:\[[0-?]*[ -/]*|[\]PX^_][^\x07\x1b\x9c]*\x1b?|[ -/]*)'
+    r'|\x9b[0-?]*[ -/]*|[\x90\x98\x9d\x9e\x9f][^\x07\x1b\x9c]*\x1b?)\Z')
+
+# What ends a control sequence that was too long to keep
+_CONTROL_STRING_END = re.compile(r'\x07|\x1b\\|\x9c')
+_SEQUENCE_END = re.compile(r'[^ -?]')
+
+
+class StreamParser(object):
+    """Parses terminal output incrementally.
+
+    feed() takes a chunk of output and returns a generator yielding, in order,
+    each run of text (a str) and each ControlSequence in it. Only an
+    incomplete sequence at the end of a chunk (and an incomplete multi-byte
+    character of a bytes chunk) is kept for the next one.
+
+    Memory is bounded: a sequence that grows longer than max_pending is
+    discarded, up to and including its end.
+    """
+
+    # The longest incomplete control sequence kept between two chunks
+    max_pending = 4096
+
+    def __init__(self, encoding='utf-8'):
+        """Initializes the parser. Bytes chunks are decoded with encoding
+        (undecodable bytes are replaced)."""
+        self.encoding = encoding
+        self.reset()
+
+    def reset(self):
+        """Forgets any incomplete sequence or character."""
+        self._decoder = codecs.getincrementaldecoder(self.encoding)('replace')
+        self._pending = ''
+        self._discard_until = None
+
+    def feed(self, chunk):
+        """Returns a generator yielding the text runs and ControlSequences
+        completed by a chunk of output (bytes or str)."""
+        if not isinstance(chunk, str):
+            chunk = self._decoder.decode(bytes(chunk))
+        return self._parse(chunk)
+
+    def close(self):
+        """Returns a generator yielding what is left at the end of the
+        output. An incomplete control sequence is dropped."""
+        string = self._decoder.decode(b'', final=True)
+        self.reset()
+        return self._parse(string)
+
+    def _parse(self, string):
+        """Returns a generator yielding the text runs and ControlSequences of
+        the pending output followed by string. What is left pending is
+        decided right away, so chunks may be fed before the generator of the
+        previous one is used up."""
+        if self._discard_until is not None:
+            string = self._discard(string)
+        string, self._pending = self._pending + string, ''
+        incomplete = _INCOMPLETE.search(string)
+        if incomplete:
+            # Wait for the rest of the sequence
+            self._pending = string[incomplete.start():]
+            string = string[:incomplete.start()]
+            if len(self._pending) > self.max_pending:
+                self._overflow()
+        return _items(string)
+
+    def _overflow(self):
+        """Discards the pending sequence, which is too long, and anything
+        more of it until it ends."""
+        pending, self._pending = self._pending, ''
+        introducer = pending[1] if pending[0] == '\x1b' else pending[0]
+        if introducer in _CONTROL_STRINGS:
+            self._discard_until = _CONTROL_STRING_END
+            if pending[-1] == '\x1b':
+                self._pending = '\x1b'  # May be the start of ST
+        else:
+            self._discard_until = _SEQUENCE_END
+
+    def _discard(self, string):
+        """Returns what follows the end of the sequence being discarded from
+        string, or '' if it has not ended yet."""
+        if self._pending:
+            string, self._pending = self._pending + string, ''
+        end = self._discard_until.search(string)
+        if end is None:
+            if string.endswith('\x1b'):
+                self._pending = '\x1b'
+            return ''
+        self._discard_until = None
+        if end.re is _SEQUENCE_END and not '@' <= end.group() <= '~':
+            return string[end.start():]  # Not a final byte; keep it
+        return string[end.end():]
+
+
+## Parser Helper Functions ##
+
+def _items(string):
+    """Yields the text runs and ControlSequences of a string."""
+    index = 0
+    for match in _SEQUENCE.finditer(string):
+        if match.start() > index:
+            yield string[index:match.start()]
+        index = match.end()
+        yield _sequence(match)
+    if index < len(string):
+        yield string[index:]
+
+def _sequence(match):
+    """Returns the ControlSequence of a _SEQUENCE match."""
+    (parameters, intermediates, final, introducer, introducer_8bit, body,
+     escape_intermediates, escape_final, control) = match.groups()
+    if final is not None:
+        return ControlSequence('CSI', parameters, intermediates, final,
+                               match.group())
+    if body is not None:
+        kind = _CONTROL_STRINGS[introducer or introducer_8bit]
+        return ControlSequence(kind, body, '', '', match.group())
+    if escape_final is not None:
+        return ControlSequence('ESC', '', escape_intermediates, escape_final,
+                               match.group())
+    return ControlSequence('control', '', '', control, control)
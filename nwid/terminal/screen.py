@@ -12,13 +12,25 @@ nwid.terminal.screen
 ~~~~~~~~~~~~~~~~~~~~
 
 This module contains functions responsible for clearing the screen and getting
-its size.
+its size, and the ScreenBuffer object that widgets draw into.
 """
 
 from __future__ import absolute_import
 
+from array import array
+from collections import namedtuple
+
 from . import codes as code
-from nwid import Size
+from . import output
+from . import palette
+from .cursor import CursorTracker, cache_positions
+from . import sgr
+from nwid import Point, Size
+
+
+Cell = namedtuple('Cell', ['char', 'style'])
+
+BLANK = Cell(' ', sgr.DEFAULT)
 
 
 def size():
@@ -72,3 +84,219 @@ def reset():
     """Clears the entire screen and places cursor at top left corner."""
     code.CLEAR_SCREEN()
     code.CURSOR_SET_POSITION(0, 0)
+
+def frame():
+    """Returns a context manager that collects all output written inside of it
+    and sends it to the terminal in one write. (see output.frame())."""
+    return output.frame()
+
+
+# Screen buffer #
+
+class ScreenBuffer(object):
+    """A double-buffered grid of cells representing the terminal screen.
+
+    Widgets draw into the back buffer. Calling flush() compares the back
+    buffer with the front buffer (what is currently on the terminal) and
+    writes only the runs of cells that have changed.
+
+    Each buffer is stored as parallel compact arrays, one of each per row: an
+    array('I') of character codepoints and an array('H') of style IDs from
+    the screen's own sgr.StyleTable. That is six bytes per cell, and comparing two cells is two
+    integer compares. get() returns a cell as a Cell namedtuple of its
+    character and sgr.Rendition. Rows and columns are zero-based.
+
+    The buffer tracks the cursor and the graphic rendition between flushes to
+    emit the fewest bytes, so it assumes nothing else moves the cursor or
+    changes the rendition in between. Call invalidate() if something does.
+    """
+
+    # Unchanged cells between two changed runs on the same row are rewritten
+    # rather than moving the cursor when the gap is this small.
+    merge_gap = 4
+
+    # The number of colors the terminal supports (see palette.detect()).
+    # Extended colors are downsampled to fit when rendered.
+    colors = palette.TRUECOLOR
+
+    def __init__(self, screen_size=None):
+        """Initializes the buffers to the given Size (or the terminal size)."""
+        self.styles = sgr.StyleTable()
+        self.resize(screen_size or size())
+
+    def resize(self, screen_size):
+        """Resizes the buffers, discarding their contents. The next flush
+        repaints the entire screen."""
+        self.size = Size(screen_size.row, screen_size.col)
+        cache_positions(self.size)
+        self.cursor = CursorTracker(width=self.size.col)
+        self.sgr = sgr.SGRState()
+        self.clear()
+        self.invalidate()
+
+    def invalidate(self):
+        """Forgets what is on the terminal so that the next flush repaints
+        every cell."""
+        self.cursor.forget()
+        self.sgr.forget()
+        self.front_chars = self._lines(ord(' '))
+        self.front_styles = self._lines(sgr.StyleTable.UNKNOWN, 'H')
+
+    def clear(self, style=()):
+        """Blanks the back buffer."""
+        self.back_chars = self._lines(ord(' '))
+        self.back_styles = self._lines(self._intern(*style), 'H')
+
+    def write(self, row, col, string, *attributes):
+        """Draws a string into the back buffer at (row, col) using the SGR
+        attributes given. Anything that falls outside of the screen is
+        clipped."""
+        self._write(row, col, string, self._intern(*attributes))
+
+    def write_styled(self, row, col, styled):
+        """Draws StyledText into the back buffer at (row, col), one run at a
+        time, with the style of each run."""
+        for style, text in styled:
+            self._write(row, col, text, self._intern_rendition(style))
+            col += len(text)
+
+    def _intern(self, *attributes):
+        """Returns the style ID of SGR attributes (applied from the
+        default)."""
+        if self.styles.full:
+            return self._intern_rendition(sgr.rendition(*attributes))
+        return self.styles.intern(*attributes)
+
+    def _intern_rendition(self, style):
+        """Returns the style ID of a Rendition. If the screen's StyleTable is
+        full, the styles no longer on the screen are dropped first."""
+        if self.styles.full and style not in self.styles:
+            self._compact_styles()
+        return self.styles.intern_rendition(style)
+
+    def _compact_styles(self):
+        """Reclaims the IDs of the styles that are no longer in either
+        buffer."""
+        self.styles.compact(self.back_styles + self.front_styles)
+
+    def _write(self, row, col, string, style_id):
+        """Draws a string into the back buffer with a style ID."""
+        if row < 0 or row >= self.size.row:
+            return
+        if col < 0:
+            string, col = string[-col:], 0
+        string = string[:self.size.col - col]
+        if not string:
+            return
+        stop = col + len(string)
+        self.back_chars[row][col:stop] = array('I', map(ord, string))
+        self.back_styles[row][col:stop] = array('H', [style_id]) * len(string)
+
+    def fill(self, row, col, height, width, char=' ', *attributes):
+        """Fills a rectangle of the back buffer with a character."""
+        for _row in range(row, row + height):
+            self.write(_row, col, char * width, *attributes)
+
+    def scroll(self, top, bottom, rows):
+        """Scrolls the lines from top up to (but not including) bottom by rows
+        using the terminal's scroll region (DECSTBM). Positive rows move the
+        content up, negative rows move it down.
+
+        Both buffers are shifted to match, and the exposed lines are left
+        blank, so only those lines need to be drawn again. Returns False (and
+        does nothing) if the scroll would expose the entire region.
+        """
+        height = bottom - top
+        if rows == 0 or abs(rows) >= height:
+            return False
+
+        sequences = [self.sgr.change_to(sgr.DEFAULT),  # Blank with default bg
+                     code.SET_SCROLL.using(top + 1, bottom)]
+        self.cursor.position = Point(0, 0)  # Setting the region homes the cursor
+        if rows > 0:
+            sequences.append(self.cursor.move_to(bottom - 1, 0))
+            sequences.append(code.SCROLL_UP.value * rows)
+        else:
+            sequences.append(self.cursor.move_to(top, 0))
+            sequences.append(code.SCROLL_DOWN.value * -rows)
+        sequences.append(code.SET_SCROLL_ALL.value)
+        self.cursor.position = Point(0, 0)
+        output.write(''.join(sequences))
+
+        for lines, value, typecode in ((self.back_chars, ord(' '), 'I'),
+                                       (self.back_styles, 0, 'H'),
+                                       (self.front_chars, ord(' '), 'I'),
+                                       (self.front_styles, 0, 'H')):
+            blank = self._lines(value, typecode, abs(rows))
+            if rows > 0:
+                lines[top:bottom] = lines[top + rows:bottom] + blank
+            else:
+                lines[top:bottom] = blank + lines[top:bottom + rows]
+        return True
+
+    def get(self, row, col):
+        """Returns the Cell at (row, col) of the back buffer."""
+        return Cell(chr(self.back_chars[row][col]),
+                    self.styles.lookup(self.back_styles[row][col]))
+
+    def changed_runs(self):
+        """A generator yielding (row, start, stop) for each run of columns in
+        the back buffer that differs from the front buffer."""
+        merge_gap = self.merge_gap
+        rows = zip(self.back_chars, self.back_styles,
+                   self.front_chars, self.front_styles)
+        for row, (chars, styles, front_chars, front_styles) in enumerate(rows):
+            if chars == front_chars and styles == front_styles:
+                continue
+            start = stop = None
+            for col in range(len(chars)):
+                if chars[col] == front_chars[col] and \
+                        styles[col] == front_styles[col]:
+                    continue
+                if start is not None and col - stop > merge_gap:
+                    yield row, start, stop
+                    start = None
+                if start is None:
+                    start = col
+                stop = col + 1
+            if start is not None:
+                yield row, start, stop
+
+    def render(self):
+        """Returns the escape sequences and text needed to bring the terminal
+        from the front buffer to the back buffer, and marks the back buffer as
+        being on the terminal."""
+        lookup = self.styles.lookup
+        if self.colors < palette.TRUECOLOR:
+            lookup = lambda style: palette.downsample_rendition(
+                self.styles.lookup(style), self.colors)
+        rendered = []
+        style = None
+        for row, start, stop in self.changed_runs():
+            rendered.append(self.cursor.move_to(row, start))
+            chars, styles = self.back_chars[row], self.back_styles[row]
+            run = start
+            for col in range(start, stop):
+                if styles[col] != style:
+                    rendered.append(''.join(map(chr, chars[run:col])))
+                    style, run = styles[col], col
+                    rendered.append(self.sgr.change_to(lookup(style)))
+            rendered.append(''.join(map(chr, chars[run:stop])))
+            self.cursor.advance(stop - start)
+        if style is not None:
+            rendered.append(self.sgr.change_to(sgr.DEFAULT))
+        self.front_chars = [line[:] for line in self.back_chars]
+        self.front_styles = [line[:] for line in self.back_styles]
+        return ''.join(rendered)
+
+    def flush(self):
+        """Writes the changed cells to the terminal."""
+        rendered = self.render()
+        if rendered:
+            output.write(rendered)
+
+    def _lines(self, value, typecode='I', rows=None):
+        """Returns a list of rows (every row by default) of a typecode array
+        filled with value."""
+        line = array(typecode, [value]) * self.size.col
+        return [line[:] for _ in range(self.size.row if rows is None else rows)]
@@ -12,11 +12,17 @@ nwid.terminal.sgr
 ~~~~~~~~~~~~~~~~~
 
 This module contains functions for creating SGR (Select Graphic Rendition)
-escape sequences.
+escape sequences, the SGRState object for emitting only the changes
+between one rendition and the next, and the StyleTable that interns
+renditions as small integer style IDs.
 """
 
 from __future__ import absolute_import
 
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
 from nwid.terminal import codes as code
 
 ## SGR Exceptions ##
@@ -30,10 +36,26 @@ class SGRError(Exception):
 
 def create(*args):
     """Returns an SGR (Select Graphic Rendition) escape sequence given one or
-    more attributes."""
+    more attributes. Sequences are cached by their attributes."""
     if not args:
         return ''
-    return code.CSI + _combine_sgr_codes(*args) + 'm'
+    return _create(args)
+
+@lru_cache(maxsize=1024)
+def _create(attributes):
+    """Builds (and caches) the SGR escape sequence for a tuple of
+    attributes."""
+    return code.CSI + _combine_sgr_codes(*attributes) + 'm'
+
+def clear_cache():
+    """Clears the cached SGR sequences and renditions. This must be called if
+    the value of an SGR code is changed."""
+    _create.cache_clear()
+    _rendition.cache_clear()
+    _parse.cache_clear()
+    _transition.cache_clear()
+    _CODES.clear()
+    _CODES.update(_codes_by_value())
 
 def reset():
     """Returns the escape sequence to reset the terminal to default."""
@@ -63,6 +85,283 @@ def wrap(string, *args):
     return _string
 
 
+## SGR Rendition ##
+
+# A Rendition is the complete set of graphic attributes in effect: a frozenset
+# of 'style' codes and the fg_color and bg_color codes (None is the default).
+Rendition = namedtuple('Rendition', ['styles', 'fg_color', 'bg_color'])
+
+DEFAULT = Rendition(frozenset(), None, None)
+
+# The 'style_off' code that turns off each style.
+_STYLE_OFF = {
+    code.BOLD:      code.BOLD_OFF,
+    code.UNDERLINE: code.UNDERLINE_OFF,
+    code.BLINK:     code.BLINK_OFF,
+    code.RBLINK:    code.BLINK_OFF,
+    code.REVERSE:   code.REVERSE_OFF,
+    code.CONCEAL:   code.CONCEAL_OFF,
+}
+
+# The SGR code of each parameter value (see parse()).
+def _codes_by_value():
+    """Returns a dict of every SGR code by its value."""
+    return dict((attribute.value, attribute)
+                for group in ('style', 'style_off', 'fg_color', 'bg_color')
+                for attribute in code.groups[group])
+
+_CODES = _codes_by_value()
+
+# The styles that each 'style_off' code turns off.
+_STYLES_TURNED_OFF = {}
+for _style, _style_off in _STYLE_OFF.items():
+    _STYLES_TURNED_OFF.setdefault(_style_off, set()).add(_style)
+
+
+def rendition(*attributes, **kwargs):
+    """Returns the Rendition that results from applying SGR attributes, in
+    order, to a base Rendition (the default rendition unless base is given).
+    """
+    return _rendition(attributes, kwargs.get('base', DEFAULT))
+
+@lru_cache(maxsize=1024)
+def _rendition(attributes, base):
+    """Builds (and caches) the Rendition of attributes applied to base."""
+    styles, fg_color, bg_color = base
+    styles = set(styles)
+    for attribute in attributes:
+        if attribute.group == 'style':
+            if attribute is code.RESET:
+                styles, fg_color, bg_color = set(), None, None
+            else:
+                styles.add(attribute)
+        elif attribute.group == 'style_off':
+            styles.difference_update(_STYLES_TURNED_OFF[attribute])
+        elif attribute.group == 'fg_color':
+            fg_color = None if attribute is code.FG_DEFAULT else attribute
+        elif attribute.group == 'bg_color':
+            bg_color = None if attribute is code.BG_DEFAULT else attribute
+        else:
+            raise SGRError('Not an SGR code.')
+    return Rendition(frozenset(styles), fg_color, bg_color)
+
+def parse(parameters, base=DEFAULT):
+    """Returns the Rendition that results from applying the parameters of an
+    SGR escape sequence (such as '1;31' of '\\033[1;31m') to a base
+    Rendition. Extended colors (38;5;n and 38;2;r;g;b) are understood, and
+    unknown parameters are ignored."""
+    return _parse(parameters, base)
+
+@lru_cache(maxsize=1024)
+def _parse(parameters, base):
+    """Builds (and caches) the Rendition of SGR parameters applied to
+    base."""
+    from . import palette  # palette imports sgr
+
+    params = [str(int(param)) if param.isdigit() else '0'
+              for param in (parameters or '0').split(code.DELIMITER)]
+    attributes = []
+    index = 0
+    while index < len(params):
+        param = params[index]
+        if param in (code.EXTENDED.value, code.BG_EXTENDED.value):
+            # 38;5;n or 38;2;r;g;b (48 for the background)
+            count = 1 if params[index + 1:index + 2] == ['5'] else 3
+            values = [int(value)
+                      for value in params[index + 2:index + 2 + count]]
+            if len(values) == count and all(value < 256 for value in values):
+                extended = palette.on_color \
+                    if param == code.BG_EXTENDED.value else palette.color
+                attributes.append(extended(*values))
+            index += 2 + count
+            continue
+        if param in _CODES:
+            attributes.append(_CODES[param])
+        index += 1
+    return rendition(*attributes, base=base)
+
+def transition(current, target):
+    """Returns the shortest SGR escape sequence that changes the terminal from
+    the current Rendition to the target Rendition.
+
+    If the current Rendition is None (unknown), the sequence starts with a
+    reset.
+    """
+    if current == target:
+        return ''
+    return _transition(current, target)
+
+@lru_cache(maxsize=1024)
+def _transition(current, target):
+    """Builds (and caches) the transition between two different
+    Renditions."""
+
+    # Everything from a clean slate
+    full = [code.RESET] + _sorted(target.styles)
+    if target.fg_color is not None:
+        full.append(target.fg_color)
+    if target.bg_color is not None:
+        full.append(target.bg_color)
+    if current is None:
+        return create(*full)
+
+    # Only what changed
+    delta = []
+    surviving = set(current.styles)
+    for style in _sorted(current.styles - target.styles):
+        style_off = _STYLE_OFF[style]
+        if style_off not in delta:
+            delta.append(style_off)
+            surviving.difference_update(_STYLES_TURNED_OFF[style_off])
+    delta.extend(_sorted(target.styles - surviving))
+    if target.fg_color != current.fg_color:
+        delta.append(target.fg_color or code.FG_DEFAULT)
+    if target.bg_color != current.bg_color:
+        delta.append(target.bg_color or code.BG_DEFAULT)
+
+    return min(create(*delta), create(*full), key=len)
+
+def render(runs):
+    """Returns the text of an iterable of (string, attributes) runs with the
+    fewest SGR escape sequences needed between them. The result always ends
+    with the default rendition.
+
+    :param runs: an iterable of (string, attributes) tuples where attributes
+        is a tuple of SGR codes (as passed to create()).
+    """
+    state = SGRState(DEFAULT)
+    output = []
+    for string, attributes in runs:
+        output.append(state.update(*attributes))
+        output.append(string)
+    output.append(state.change_to(DEFAULT))
+    return ''.join(output)
+
+
+class SGRState(object):
+    """Tracks the Rendition currently in effect on the terminal so that only
+    the changes need to be emitted when moving to the next one.
+
+    A rendition of None means the state of the terminal is unknown.
+    """
+
+    def __init__(self, rendition=None):
+        """Initializes the state with a known Rendition or None."""
+        self.rendition = rendition
+
+    def forget(self):
+        """Marks the terminal's rendition as unknown."""
+        self.rendition = None
+
+    def change_to(self, target):
+        """Returns the escape sequence that changes the terminal to the target
+        Rendition and records it as current."""
+        sequence = transition(self.rendition, target)
+        self.rendition = target
+        return sequence
+
+    def update(self, *attributes):
+        """Returns the escape sequence that changes the terminal to the
+        rendition given by SGR attributes (applied from the default) and
+        records it as current."""
+        return self.change_to(rendition(*attributes))
+
+
+## SGR Style Table ##
+
+class StyleTable(object):
+    """Interns Renditions as small integer style IDs.
+
+    Storing a style ID instead of a Rendition lets a screen keep its styles in
+    a compact array('H') and compare two styles with an integer compare. The
+    default rendition is always style ID 0, and every single code of the
+    'style', 'fg_color', and 'bg_color' groups is interned up front.
+
+    A table that is full can be compacted: the styles its owner no longer uses
+    are dropped and their IDs reused.
+    """
+
+    # Style IDs must fit in an unsigned short. The largest one is reserved to
+    # mean "unknown".
+    max_styles = 0xFFFF
+    UNKNOWN = 0xFFFF
+
+    def __init__(self):
+        """Initializes the table with the default and single code styles."""
+        self._renditions = []
+        self._ids = {}
+        self._attributes = {}
+        self.intern_rendition(DEFAULT)
+        for group in ('style', 'fg_color', 'bg_color'):
+            for attribute in _sorted(code.groups[group]):
+                if attribute not in (code.EXTENDED, code.BG_EXTENDED):
+                    self.intern(attribute)
+        self._fixed = len(self._renditions)
+
+    def __len__(self):
+        """Returns the number of styles in the table."""
+        return len(self._renditions)
+
+    def __contains__(self, target):
+        """Returns True if a Rendition is in the table."""
+        return target in self._ids
+
+    @property
+    def full(self):
+        """True if no more styles can be added to the table."""
+        return len(self._renditions) >= self.max_styles
+
+    def intern(self, *attributes):
+        """Returns the style ID of the rendition given by SGR attributes
+        (applied from the default)."""
+        try:
+            return self._attributes[attributes]
+        except KeyError:
+            style_id = self.intern_rendition(rendition(*attributes))
+            self._attributes[attributes] = style_id
+            return style_id
+
+    def intern_rendition(self, target):
+        """Returns the style ID of a Rendition, adding it to the table if it
+        is new."""
+        try:
+            return self._ids[target]
+        except KeyError:
+            if len(self._renditions) >= self.max_styles:
+                raise SGRError('Too many styles.')
+            self._ids[target] = style_id = len(self._renditions)
+            self._renditions.append(target)
+            return style_id
+
+    def lookup(self, style_id):
+        """Returns the Rendition of a style ID."""
+        return self._renditions[style_id]
+
+    def compact(self, lines):
+        """Drops every style that is not used in lines (arrays of style IDs)
+        and renumbers the rest, rewriting lines in place. The default and
+        single code styles keep their IDs, as does UNKNOWN."""
+        used = set().union(*lines)
+        used.discard(self.UNKNOWN)
+        renditions = self._renditions[:self._fixed]
+        renumbered = list(range(self._fixed))
+        renumbered.extend([self.UNKNOWN] * (self.UNKNOWN + 1 - self._fixed))
+        for style_id in sorted(used):
+            if style_id >= self._fixed:
+                renumbered[style_id] = len(renditions)
+                renditions.append(self._renditions[style_id])
+
+        self._renditions = renditions
+        self._ids = dict((target, style_id)
+                         for style_id, target in enumerate(renditions))
+        self._attributes = dict(
+            (attributes, renumbered[style_id])
+            for attributes, style_id in self._attributes.items()
+            if renumbered[style_id] != self.UNKNOWN)
+        for line in lines:
+            line[:] = array('H', map(renumbered.__getitem__, line))
+
+
 ## SGR Helper Functions  ##
 
 def _combine_sgr_codes(*codes):
@@ -70,11 +369,15 @@ def _combine_sgr_codes(*codes):
     # Error checking:
     for code in codes:
         # Must be in one of these groups:
-        if code.group not in [ 'style', 'fg_color', 'bg_color']:
+        if code.group not in [ 'style', 'style_off', 'fg_color', 'bg_color']:
             raise SGRError('Not an SGR code.')
 
     return _combine_attributes(*codes)
 
 def _combine_attributes(*attributes):
     """Returns multiple attributes concatenated and separated by DELIMITER."""
-    return reduce(lambda a, b: str(a) + code.DELIMITER + str(b), attributes)
+    return code.DELIMITER.join(str(attribute) for attribute in attributes)
+
+def _sorted(codes):
+    """Returns the SGR codes in a stable order."""
+    return sorted(codes, key=lambda attribute: attribute.value)
@@ -11,8 +11,11 @@
 nwid.terminal.terminal_string
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-TODO: Write logic in TerminalString to recognize other kinds of escape
-sequences.
+TerminalString recognizes the escape sequences of ECMA-48: control sequences
+(CSI, with parameter and intermediate bytes), control strings (OSC, DCS, SOS,
+PM, and APC, ended by BEL or ST), other escape sequences (ESC with optional
+intermediate bytes and a final byte), both the 7-bit and 8-bit (C1) forms,
+and any other control characters.
 
 @see: https://en.wikipedia.org/wiki/ANSI_escape_code
       http://www.ecma-international.org/publications/files/ECMA-ST/Ecma-048.pdf
@@ -20,20 +23,67 @@ sequences.
 
 from __future__ import absolute_import
 
+from bisect import bisect_left, bisect_right
 from collections import namedtuple
-from nwid.terminal import sgr
-import string
+from nwid.terminal import sgr, width
+import re
 
 
 EscapeMarker = namedtuple('EscapeMarker', ['start', 'stop'])
 
+# Every escape sequence and non-printable character of a string, found in a
+# single pass. Whitespace (tab, newline, etc.) is not marked. Every match
+# starts with a control character (so the re module can skip straight to the
+# next one), and what follows it depends on which control character it is.
+_ESCAPE_SEQUENCE = re.compile(
+    r'[\x00-\x08\x0e-\x1f\x7f-\x9f]'
+    r'(?:(?<=\x1b)(?:'
+    r'\[[0-?]*[ -/]*[@-~]'                          # Control sequence (CSI)
+    r'|[\]PX^_][^\x07\x1b\x9c]*(?:\x07|\x1b\\|\x9c)'  # Control string (OSC...)
+    r'|(?:\[[0-?]*[ -/]*|[\]PX^_][^\x07\x1b\x9c]*\x1b?|[ -/]*)\Z'  # Cut off
+    r'|[ -/]*[0-~])'                                # Other escape sequence
+    r'|(?<=\x9b)[0-?]*[ -/]*(?:[@-~]|\Z)'           # 8-bit CSI
+    # 8-bit control string
+    r'|(?<=[\x90\x98\x9d\x9e\x9f])[^\x07\x1b\x9c]*(?:\x07|\x1b\\|\x9c|\x1b?\Z))?'
+)
+
+# An escape sequence that was cut off by the end of the string (and would be
+# continued by whatever is added to it)
+_CUT_OFF_SEQUENCE = re.compile(
+    r'\x1b(?:\[[0-?]*[ -/]*|[\]PX^_][^\x07\x1b\x9c]*\x1b?|[ -/]*)'
+    r'|\x9b[0-?]*[ -/]*|[\x90\x98\x9d\x9e\x9f][^\x07\x1b\x9c]*\x1b?'
+)
+_CUT_OFF_END = re.compile('(?:' + _CUT_OFF_SEQUENCE.pattern + r')\Z')
+
+# An SGR escape sequence (and its parameters)
+_SGR_SEQUENCE = re.compile(r'(?:\x1b\[|\x9b)([0-9;]*)m\Z')
+
+# The index of the columns of a TerminalString. For each grapheme cluster of
+# the visible string: its first column, the column after it, and its start
+# and stop offsets in the string. Each list is sorted, so a column is found
+# with bisect.
+ColumnIndex = namedtuple('ColumnIndex',
+                         ['columns', 'column_stops', 'starts', 'stops'])
+
 
 class TerminalString(object):
-    """A TerminalString is a special string that can contain CSI escape
-    sequences for terminal attributes such as color and bold.
+    """A TerminalString is a special string that can contain escape sequences
+    for terminal attributes such as color and bold.
 
     These escape sequences are ignored for functions like len() and are handled
-    intelligently when splicing the string."""
+    intelligently when splicing the string. Lengths and positions are measured
+    in terminal columns (see nwid.terminal.width): a wide character counts as
+    two and a combining mark as none.
+
+    Nothing is parsed until it is needed: the escape markers are found the
+    first time they are used, and the length is measured once and cached. A
+    string that is only created and written is never parsed.
+
+    Adding TerminalStrings does not copy or parse anything: the result is a
+    rope that links the two pieces. It is joined into one string once, when
+    its string is first needed (usually when it is written), and its escape
+    markers are the markers of its pieces shifted to their new offsets.
+    Pieces that have been parsed are never scanned again."""
 
     def __init__(self, string=''):
         self.set(string)
@@ -46,50 +96,167 @@ class TerminalString(object):
 
     def set(self, string):
         self.string = string
-        self.parse_escape_markers()
+
+    @property
+    def string(self):
+        """The string, including its escape sequences."""
+        if self._string is None:
+            self._flatten()
+        return self._string
+
+    @string.setter
+    def string(self, string):
+        """Sets the string and forgets anything parsed from the old one."""
+        self._string = string
+        self._pieces = None
+        self._escape_markers = None
+        self._length = None
+        self._column_index = None
+        self._renditions = None
+
+    @property
+    def escape_markers(self):
+        """The list of EscapeMarkers of the string (parsed on first use)."""
+        if self._escape_markers is None:
+            if self._pieces is not None:
+                self._join_escape_markers()
+            else:
+                self.parse_escape_markers()
+        return self._escape_markers
 
     def parse_escape_markers(self):
-        """Parses self.string for any CSI escape sequences or other
-        non-printable characters."""
-        sequence_start = None
-        self.escape_markers = []
-        for index, char in enumerate(self.string):
-            # Mark the stop of an escape sequence
-            if sequence_start is not None and char in string.letters:
-                self.escape_markers.append(EscapeMarker(sequence_start, index))
-                sequence_start = None  # Reset start sequence 
-
-            # Mark the beginning of an escape sequence
-            elif char == '\033' and self.string[index+1] == '[':
-                sequence_start = index
-
-            # Mark other non-printable characters
-            elif char not in string.printable:
-                self.escape_markers.append(EscapeMarker(index, index))
+        """Parses self.string for any escape sequences or other non-printable
+        characters."""
+        self._escape_markers = [
+            EscapeMarker(match.start(), match.end() - 1)
+            for match in _ESCAPE_SEQUENCE.finditer(self.string)]
 
     def __len__(self):
-        length = len(self.string)
-        for escape_marker in self.escape_markers:
-            length = length - (escape_marker.stop - escape_marker.start + 1)
-        return length
+        """Returns the number of columns the string takes up, ignoring escape
+        sequences."""
+        if self._length is None:
+            leaves = list(self._leaves()) if self._pieces is not None else []
+            if leaves and not any(
+                    width.is_joining(piece.string) for piece in leaves) and \
+                    not any(_CUT_OFF_END.search(piece.string)
+                            for piece in leaves[:-1]):
+                # Nothing can join or continue across two pieces
+                self._length = sum(len(piece) for piece in leaves)
+            else:
+                self._length = width.width(self.visible())
+        return self._length
+
+    def visible(self):
+        """Returns the string without its escape sequences."""
+        if self._escape_markers is None:
+            # Faster than parsing the markers, which may never be needed
+            return _ESCAPE_SEQUENCE.sub('', self.string)
+        if not self._escape_markers:
+            return self.string
+        text, index = [], 0
+        for marker in self.escape_markers:
+            text.append(self.string[index:marker.start])
+            index = marker.stop + 1
+        text.append(self.string[index:])
+        return ''.join(text)
+
+    def clusters(self):
+        """A generator yielding (column, start, stop, cluster) for each
+        grapheme cluster of the visible string, where start and stop are its
+        offsets in self.string."""
+        column = index = 0
+        stops = [marker.start for marker in self.escape_markers]
+        resumes = [marker.stop + 1 for marker in self.escape_markers]
+        for stop, resume in zip(stops + [len(self.string)],
+                                [0] + resumes):
+            index = resume
+            for cluster in width.clusters(self.string[index:stop]):
+                yield column, index, index + len(cluster), cluster
+                column += width.cluster_width(cluster)
+                index += len(cluster)
 
     def __add__(self, other):
-        try:
-            return TerminalString(self.string + other.string)
-        except AttributeError:
-            return TerminalString(self.string + other)
+        if not isinstance(other, TerminalString):
+            other = TerminalString(str(other))
+        return TerminalString._rope(self, other)
 
     def __radd__(self, other):
-        try:
-            return TerminalString(other.string + self.string)
-        except AttributeError:
-            return TerminalString(other + self.string)
+        if not isinstance(other, TerminalString):
+            other = TerminalString(str(other))
+        return TerminalString._rope(other, self)
+
+    @classmethod
+    def _rope(cls, left, right):
+        """Returns a TerminalString linking two TerminalStrings."""
+        rope = cls()
+        rope._string = None
+        rope._pieces = (left, right)
+        return rope
+
+    def _leaves(self):
+        """A generator yielding the flat TerminalStrings a rope is made of, in
+        order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._pieces is None:
+                yield node
+            else:
+                stack.extend(reversed(node._pieces))
+
+    def _flatten(self):
+        """Joins the pieces of a rope into one string."""
+        leaves = list(self._leaves())
+        self._string = ''.join(leaf.string for leaf in leaves)
+        if self._escape_markers is None and \
+                all(leaf._escape_markers is not None for leaf in leaves):
+            self._join_escape_markers(leaves)
+        self._pieces = None
+
+    def _join_escape_markers(self, leaves=None):
+        """Sets the escape markers of a rope from the markers of its pieces,
+        shifted to their offsets. Only an escape sequence that may continue
+        across two pieces is scanned again."""
+        leaves = list(self._leaves()) if leaves is None else leaves
+        string = self.string
+        markers = []
+        offset = 0
+        for leaf in leaves:
+            end = offset + len(leaf.string)
+            if markers and markers[-1].stop == offset - 1 and \
+                    _CUT_OFF_SEQUENCE.fullmatch(string, markers[-1].start,
+                                                offset):
+                # A sequence that ends where this piece starts may be cut off
+                start = markers.pop().start
+                markers.extend(
+                    EscapeMarker(match.start(), match.end() - 1)
+                    for match in _ESCAPE_SEQUENCE.finditer(string, start, end))
+            else:
+                markers.extend(EscapeMarker(marker.start + offset,
+                                            marker.stop + offset)
+                               for marker in leaf.escape_markers)
+            offset = end
+        self._escape_markers = markers
 
     def upper(self):
-        return TerminalString(self.string.upper())
+        return self._changed_case(self.string.upper())
 
     def lower(self):
-        return TerminalString(self.string.lower())
+        return self._changed_case(self.string.lower())
+
+    def _changed_case(self, string):
+        """Returns a TerminalString of this string with its case changed.
+
+        Changing the case of text without escape sequences cannot add any, so
+        the result is known to have none. If the original text is also ASCII,
+        its length cannot change either (but 'ß' becomes 'SS')."""
+        changed = TerminalString(string)
+        if self._escape_markers == [] or (self._escape_markers is None and
+                                          self.string.isprintable()):
+            changed._escape_markers = []
+            if self._length is not None and width.is_ascii(self.string):
+                changed._length = self._length
+        return changed
 
     def count(self, *args):
         return TerminalString(self.string.count(*args))
@@ -106,47 +273,91 @@ class TerminalString(object):
     def vformat(self, *args, **kwargs):
         return TerminalString(self.string.vformat(*args, **kwargs))
 
-    def __getitem__(self, key):
-        """Retrieves the string based on an index or a slice.
-        Ignores the escape sequences, but returns them in a slice."""
-        try:  
-            string = ''
-            reset = ''
-
-            start = key.start
-            stop = key.stop
-
-            print(stop)
-
+    @property
+    def column_index(self):
+        """The ColumnIndex of the string (built on first use)."""
+        if self._column_index is None:
+            index = ColumnIndex([], [], [], [])
+            for column, start, stop, cluster in self.clusters():
+                index.columns.append(column)
+                index.column_stops.append(
+                    column + width.cluster_width(cluster))
+                index.starts.append(start)
+                index.stops.append(stop)
+            self._column_index = index
+        return self._column_index
+
+    def rendition_at(self, offset):
+        """Returns the sgr.Rendition in effect at an offset of the string."""
+        if self._renditions is None:
+            offsets, renditions = [], []
+            rendition = sgr.DEFAULT
             for marker in self.escape_markers:
-                # Stop when there are no markers before key.stop
-                if stop <= marker.start: break
+                match = _SGR_SEQUENCE.match(
+                    self.string, marker.start, marker.stop + 1)
+                if match:
+                    rendition = sgr.parse(match.group(1), rendition)
+                    offsets.append(marker.stop + 1)
+                    renditions.append(rendition)
+            self._renditions = (offsets, renditions)
+        offsets, renditions = self._renditions
+        index = bisect_right(offsets, offset)
+        return renditions[index - 1] if index else sgr.DEFAULT
 
-                # Increment the key.start for every escape sequence before it
-                # and add these to the front of the string we will return.
-                if start > marker.start:
-                    start = start + (marker.stop - marker.start + 1)
-                    string = string + self.string[marker.start:marker.stop+1]
-
-                # Increment the key.stop for every escape sequence before it
-                stop = stop + (marker.stop - marker.start + 1)
-
-            # Add all escape sequences prior to splice and the splice (including
-            # sequences inside the splice).
-            string = string + self.string[slice(start, stop)]
-
-            # Add a reset at the end if there are escapes in this string
-            if self.escape_markers != []:
-                string = string + sgr.reset()
-
-            return string
-
-        except AttributeError:
-            for marker in self.escape_markers:
-                if key < marker.start: break
-                key = key + (marker.stop - marker.start + 1)
-
-            return self.string[key]
+    def __getitem__(self, key):
+        """Retrieves the string based on a column index or a slice of columns.
+        Ignores the escape sequences, but keeps their effect in a slice: a
+        slice starts with the SGR sequence of the rendition in effect at its
+        start and ends with a reset (if the string has escape sequences).
+
+        A wide character is only included in a slice if both of its columns
+        are. Columns are found with bisect on the column_index."""
+        index = self.column_index
+        if not isinstance(key, slice):
+            if key < 0:
+                key += len(self)
+            cluster = bisect_right(index.columns, key) - 1
+            if cluster < 0 or key >= index.column_stops[cluster]:
+                raise IndexError('TerminalString index out of range')
+            return self.string[index.starts[cluster]:index.stops[cluster]]
+
+        start_column, stop_column, step = key.indices(len(self))
+        if step != 1:
+            return self._step_slice(start_column, stop_column, step)
+
+        first = bisect_left(index.columns, start_column)
+        last = bisect_right(index.column_stops, stop_column)
+        if first < last:
+            start, stop = index.starts[first], index.stops[last - 1]
+        else:
+            start = stop = len(self.string)
+
+        string = sgr.transition(sgr.DEFAULT, self.rendition_at(start)) + \
+            self.string[start:stop]
+
+        # Add a reset at the end if there are escapes in this string
+        if self.escape_markers != []:
+            string = string + sgr.reset()
+
+        return string
+
+    def _step_slice(self, start_column, stop_column, step):
+        """Returns a slice with a step: each cluster starting at one of the
+        columns of the slice, in order, with the SGR sequences needed between
+        them."""
+        index = self.column_index
+        state = sgr.SGRState(sgr.DEFAULT)
+        string = []
+        for column in range(start_column, stop_column, step):
+            cluster = bisect_right(index.columns, column) - 1
+            if cluster < 0 or index.columns[cluster] != column:
+                continue
+            start = index.starts[cluster]
+            string.append(state.change_to(self.rendition_at(start)))
+            string.append(self.string[start:index.stops[cluster]])
+        if self.escape_markers != []:
+            string.append(sgr.reset())
+        return ''.join(string)
 
     def __getslice__(self, i, j):
         return self.__getitem__(slice(i, j))
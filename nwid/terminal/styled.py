@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             styled.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+nwid.terminal.styled
+~~~~~~~~~~~~~~~~~~~~
+
+This module contains StyledText, text stored as a list of (style, text) runs
+rather than as a string with escape sequences in it.
+
+Styling StyledText merges Renditions instead of wrapping escape sequences
+around escape sequences, so nesting styles costs one merge per run and never
+makes the text longer. Escape sequences are only created when the text is
+rendered, with the fewest SGR sequences needed between its runs.
+
+Usage::
+    >>> text = StyledText('Hello ', code.BOLD) + StyledText('world', code.RED)
+    >>> text = text.style(code.UNDERLINE)
+    >>> output.write(text.render())
+"""
+
+from __future__ import absolute_import
+
+from collections import namedtuple
+from functools import lru_cache
+
+from . import sgr, width
+from .string import TerminalString, _SGR_SEQUENCE
+
+
+# A run of text and the sgr.Rendition it is displayed with
+Run = namedtuple('Run', ['style', 'text'])
+
+
+class StyledText(object):
+    """Text made of runs of (style, text), where each style is an
+    sgr.Rendition.
+
+    Adjacent runs with the same style are always merged, and runs are never
+    empty. StyledText is immutable: styling or adding returns a new one.
+    Lengths are measured in terminal columns (see nwid.terminal.width).
+
+    Like TerminalString, adding StyledText links the two as a rope, so
+    building text piece by piece is linear. Their runs are only joined (and
+    merged where they meet) when the runs are needed.
+    """
+
+    def __init__(self, text='', *attributes):
+        """Initializes the text with a single run styled by SGR attributes
+        (applied from the default)."""
+        self._runs = [Run(sgr.rendition(*attributes), text)] if text else []
+        self._pieces = None
+
+    @classmethod
+    def from_runs(cls, runs):
+        """Returns StyledText made of an iterable of (style, text) runs."""
+        styled = cls()
+        styled._runs = _merged(Run(*run) for run in runs)
+        return styled
+
+    @property
+    def runs(self):
+        """The list of the text's (style, text) Runs."""
+        if self._runs is None:
+            self._flatten()
+        return self._runs
+
+    @classmethod
+    def from_string(cls, string):
+        """Returns StyledText of a string (or TerminalString) with SGR escape
+        sequences. Other escape sequences and control characters are
+        dropped."""
+        if isinstance(string, StyledText):
+            return string
+        if not isinstance(string, TerminalString):
+            string = TerminalString(string)
+        text = string.string
+        runs = []
+        style, index = sgr.DEFAULT, 0
+        for marker in string.escape_markers:
+            runs.append(Run(style, text[index:marker.start]))
+            match = _SGR_SEQUENCE.match(text, marker.start, marker.stop + 1)
+            if match:
+                style = sgr.parse(match.group(1), style)
+            index = marker.stop + 1
+        runs.append(Run(style, text[index:]))
+        return cls.from_runs(runs)
+
+    def __repr__(self):
+        return 'StyledText.from_runs({0!r})'.format(self.runs)
+
+    def __str__(self):
+        return self.render()
+
+    def __eq__(self, other):
+        return isinstance(other, StyledText) and self.runs == other.runs
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(tuple(self.runs))
+
+    def __iter__(self):
+        return iter(self.runs)
+
+    def __bool__(self):
+        return bool(self.runs)
+
+    def __len__(self):
+        """Returns the number of columns the text takes up."""
+        return width.width(self.plain)
+
+    @property
+    def plain(self):
+        """The text without any styles."""
+        return ''.join(run.text for run in self.runs)
+
+    def style(self, *attributes):
+        """Returns this text with SGR attributes applied under the style of
+        each run: the run's own style takes precedence, just as an inner
+        style does when colors functions are nested."""
+        outer = sgr.rendition(*attributes)
+        return self.from_runs(Run(_merge(outer, run.style), run.text)
+                              for run in self.runs)
+
+    def __add__(self, other):
+        return StyledText._rope(self, _as_styled(other))
+
+    def __radd__(self, other):
+        return StyledText._rope(_as_styled(other), self)
+
+    @classmethod
+    def _rope(cls, left, right):
+        """Returns StyledText linking two StyledTexts."""
+        rope = cls()
+        rope._runs = None
+        rope._pieces = (left, right)
+        return rope
+
+    def _leaves(self):
+        """A generator yielding the flat StyledTexts a rope is made of, in
+        order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._pieces is None:
+                yield node
+            else:
+                stack.extend(reversed(node._pieces))
+
+    def _flatten(self):
+        """Joins the runs of a rope's pieces. Each piece's runs are already
+        merged, so only runs where two pieces meet can merge."""
+        self._runs = _merged(run for leaf in self._leaves()
+                             for run in leaf._runs)
+        self._pieces = None
+
+    @classmethod
+    def join(cls, items, separator=''):
+        """Returns the StyledText of items (StyledText, strings, or
+        TerminalStrings) joined by a separator."""
+        separator = _as_styled(separator).runs
+        runs = []
+        for item in items:
+            if runs:
+                runs.extend(separator)
+            runs.extend(_as_styled(item).runs)
+        return cls.from_runs(runs)
+
+    def render(self, state=None):
+        """Returns the text with the SGR escape sequences needed between its
+        runs, ending with the default rendition.
+
+        :param state: an optional sgr.SGRState of the terminal, used (and
+            updated) so that only changes from it are emitted.
+        """
+        state = sgr.SGRState(sgr.DEFAULT) if state is None else state
+        rendered = []
+        for run in self.runs:
+            rendered.append(state.change_to(run.style))
+            rendered.append(run.text)
+        rendered.append(state.change_to(sgr.DEFAULT))
+        return ''.join(rendered)
+
+    def to_terminal_string(self):
+        """Returns the rendered text as a TerminalString."""
+        return TerminalString(self.render())
+
+
+## Styled Helper Functions ##
+
+def _as_styled(value):
+    """Returns a value (StyledText, string, or TerminalString) as
+    StyledText."""
+    if isinstance(value, StyledText):
+        return value
+    return StyledText.from_string(value)
+
+def _merged(runs):
+    """Returns a list of runs with empty runs removed and adjacent runs of
+    the same style joined."""
+    merged = []
+    texts = []
+    for style, text in runs:
+        if not text:
+            continue
+        if merged and merged[-1] == style:
+            texts[-1].append(text)
+        else:
+            merged.append(style)
+            texts.append([text])
+    return [Run(style, ''.join(text)) for style, text in zip(merged, texts)]
+
+@lru_cache(maxsize=1024)
+def _merge(outer, inner):
+    """Returns the Rendition of an inner Rendition applied over an outer
+    one."""
+    return sgr.Rendition(
+        outer.styles | inner.styles,
+        outer.fg_color if inner.fg_color is None else inner.fg_color,
+        outer.bg_color if inner.bg_color is None else inner.bg_color)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             wrap.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+nwid.terminal.wrap
+~~~~~~~~~~~~~~~~~~
+
+This module contains the functions that word wrap and truncate text that may
+contain escape sequences, measured in terminal columns.
+
+Text may be a string or TerminalString with SGR escape sequences, StyledText,
+or any iterable of (style, text) runs. Lines are returned as StyledText, so
+the style in effect where a line is broken carries on to the next line.
+
+Wrapping is lazy: wrap() is a generator that reads only as much of the text as
+the lines taken from it need, so only the rows a viewport shows have to be
+wrapped.
+
+Usage::
+    >>> for line in itertools.islice(wrap.wrap(text, 80), top, top + rows):
+    ...     screen.write_styled(row, 0, line)
+    >>> wrap.truncate(colors.bold('A long title'), 8)
+"""
+
+from __future__ import absolute_import
+
+import re
+
+from . import sgr, width
+from .string import TerminalString, _ESCAPE_SEQUENCE, _SGR_SEQUENCE
+from .styled import Run, StyledText
+
+
+# A line break, a run of other whitespace, or a run of anything else
+_TOKEN = re.compile(r'(\n)|([^\S\n]+)|(\S+)')
+
+
+def runs(text):
+    """Returns an iterator of the (style, text) runs of text (a string,
+    TerminalString, StyledText, or iterable of runs). The escape sequences of
+    a string are parsed as the runs are taken."""
+    if isinstance(text, StyledText):
+        return iter(text.runs)
+    if isinstance(text, (str, TerminalString)):
+        return _string_runs(str(text))
+    return iter(text)
+
+def wrap(text, columns):
+    """A generator yielding each line of text word wrapped to a number of
+    columns, as StyledText.
+
+    Lines are broken at whitespace, and the whitespace at a break is dropped.
+    A word longer than a line is broken between grapheme clusters. Each line
+    break of the text ends a line.
+    """
+    if columns < 1:
+        raise ValueError('Lines must be at least one column wide.')
+    wrapper = _Wrapper(columns)
+    for style, string in runs(text):
+        for match in _TOKEN.finditer(string):
+            newline, space, word = match.groups()
+            if word is not None:
+                wrapper.add_word(style, word)
+            elif space is not None:
+                wrapper.add_space(style, space)
+            else:
+                wrapper.newline()
+            if wrapper.lines:
+                yield from wrapper.lines
+                del wrapper.lines[:]
+    wrapper.finish()
+    yield from wrapper.lines
+
+def truncate(text, columns, ellipsis=u'…'):
+    """Returns text, as StyledText, cut to fit in a number of columns. If it
+    has to be cut, it ends with the ellipsis (a string, in the style where
+    the text is cut, or StyledText).
+
+    Only as much of the text as fits is read."""
+    kept, used = [], 0
+    for run in runs(text):
+        run = Run(*run)
+        used += width.width(run.text)
+        kept.append(run)
+        if used > columns:
+            break
+    else:
+        return StyledText.from_runs(kept)
+
+    if not isinstance(ellipsis, StyledText):
+        ellipsis = StyledText.from_runs([(_last_style(kept), ellipsis)])
+    if len(ellipsis) > columns:
+        return StyledText.from_runs(_take(ellipsis, columns))
+    return StyledText.from_runs(_take(kept, columns - len(ellipsis))) + \
+        ellipsis
+
+
+class _Wrapper(object):
+    """Builds the lines of wrap() one word at a time.
+
+    Completed lines are appended to lines. A word is kept until the
+    whitespace or line break after it, since it may continue in the next
+    run, and the whitespace before it is only added to the line if the word
+    fits on the line too.
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.lines = []
+        self.line, self.line_width = [], 0
+        self.space, self.space_width = [], 0
+        self.word, self.word_width = [], 0
+        self.continued = False  # The line continues a wrapped one
+        self.started = False    # Anything has been added since a line break
+
+    def add_word(self, style, string):
+        """Adds (part of) a word."""
+        self.word.append(Run(style, string))
+        self.word_width += width.width(string)
+        self.started = True
+
+    def add_space(self, style, string):
+        """Adds whitespace. Whitespace at the start of a wrapped line is
+        dropped."""
+        self.end_word()
+        self.started = True
+        if self.line or not self.continued:
+            self.space.append(Run(style, string))
+            self.space_width += width.width(string)
+
+    def newline(self):
+        """Ends the line at a line break of the text."""
+        self.end_word()
+        self.end_line()
+        self.continued = self.started = False
+
+    def finish(self):
+        """Ends the last line (if anything has been added to it)."""
+        self.end_word()
+        if self.started:
+            self.end_line()
+
+    def end_word(self):
+        """Adds the word to the line, or starts a new line with it if it does
+        not fit."""
+        if not self.word:
+            return
+        word, word_width = self.word, self.word_width
+        self.word, self.word_width = [], 0
+        if self.line_width + self.space_width + word_width <= self.columns:
+            self.line.extend(self.space)
+            self.line.extend(word)
+            self.line_width += self.space_width + word_width
+            self.space, self.space_width = [], 0
+            return
+
+        if self.line:
+            self.end_line()
+        self.space, self.space_width = [], 0
+        self.continued = True
+        if word_width <= self.columns:
+            self.line, self.line_width = word, word_width
+            return
+
+        # Break a word that is too long for a line between its clusters
+        for style, string in word:
+            for cluster in width.clusters(string):
+                cluster_width = width.cluster_width(cluster)
+                if self.line_width and \
+                        self.line_width + cluster_width > self.columns:
+                    self.end_line()
+                self.line.append(Run(style, cluster))
+                self.line_width += cluster_width
+
+    def end_line(self):
+        """Adds the line to lines (without the whitespace at its end) and
+        starts a new one."""
+        self.lines.append(StyledText.from_runs(self.line))
+        self.line, self.line_width = [], 0
+        self.space, self.space_width = [], 0
+
+
+## Wrap Helper Functions ##
+
+def _string_runs(string):
+    """Yields the (style, text) runs of a string with SGR escape sequences.
+    Other escape sequences and control characters are dropped."""
+    style, index = sgr.DEFAULT, 0
+    for match in _ESCAPE_SEQUENCE.finditer(string):
+        if match.start() > index:
+            yield Run(style, string[index:match.start()])
+        sequence = _SGR_SEQUENCE.match(string, match.start(), match.end())
+        if sequence:
+            style = sgr.parse(sequence.group(1), style)
+        index = match.end()
+    if index < len(string):
+        yield Run(style, string[index:])
+
+def _take(runs, columns):
+    """Returns the runs cut to fit in a number of columns (between grapheme
+    clusters)."""
+    taken, used = [], 0
+    for style, string in runs:
+        string_width = width.width(string)
+        if used + string_width <= columns:
+            taken.append(Run(style, string))
+            used += string_width
+            continue
+        clusters = []
+        for cluster in width.clusters(string):
+            used += width.cluster_width(cluster)
+            if used > columns:
+                break
+            clusters.append(cluster)
+        taken.append(Run(style, ''.join(clusters)))
+        break
+    return taken
+
+def _last_style(runs):
+    """Returns the style of the last run with text (or the default)."""
+    for style, string in reversed(runs):
+        if string:
+            return style
+    return sgr.DEFAULT
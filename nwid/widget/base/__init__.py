@@ -12,3 +12,4 @@ from __future__ import absolute_import
 
 from .widget import BaseWidget
 from .scrollable import Scrollable
+from .viewport import Viewport
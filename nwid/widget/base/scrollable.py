@@ -36,10 +36,21 @@ Assumptions:
 
         Note: The viewport can be larger, smaller, or exactly the same size as the
         LineBuffer.
+
+    Optionally, they may also have:
+
+        self.screen - The ScreenBuffer the object draws onto. If the viewport
+            spans the full width of the screen, vertical scrolling uses the
+            terminal's scroll region so only the newly exposed lines need to be
+            drawn.
+        self.invalidate(rect) - Called with the part of the object (relative
+            to self.rect) that needs to be drawn after scrolling.
 """
 
 from __future__ import absolute_import
 
+from nwid import Rect
+
 
 class Scrollable(object):
     """Scrollable is a mixin that allows scrolling a LineBuffer's Viewport by
@@ -83,22 +94,26 @@ class Scrollable(object):
         if not self.vertical_scroll:
             return
 
+        previous_row = self.offset.row
         if self.offset.row - rows <= self.highest_offset:
             # Don't overscroll, just scroll to the top
             self.offset.row = self.highest_offset
         else:
             self.offset.row -= rows
+        self._scroll_viewport(self.offset.row - previous_row)
 
     def scroll_down(self, rows=1):
         """Scrolls down."""
         if not self.vertical_scroll:
             return
 
+        previous_row = self.offset.row
         if self.offset.row + rows >= self.lowest_offset:
             # Don't overscroll, just scroll to the bottom
             self.offset.row = self.lowest_offset
         else:
             self.offset.row += rows
+        self._scroll_viewport(self.offset.row - previous_row)
 
     def scroll_left(self, cols=1):
         """Scrolls left."""
@@ -110,6 +125,7 @@ class Scrollable(object):
             self.offset.col = self.leftmost_offset
         else:
             self.offset.col -= cols
+        self._invalidate_viewport()
 
     def scroll_right(self, cols=1):
         """Scrolls right."""
@@ -121,6 +137,46 @@ class Scrollable(object):
             self.offset.col = self.rightmost_offset
         else:
             self.offset.col += cols
+        self._invalidate_viewport()
+
+    def _scroll_viewport(self, rows):
+        """Updates the viewport after scrolling vertically by rows (positive
+        when scrolling down).
+
+        If the object has a screen and its viewport spans the full width of the
+        screen, the terminal moves the lines that are still visible and only
+        the newly exposed lines are invalidated. Otherwise, the entire viewport
+        is invalidated."""
+        if rows == 0:
+            return
+        try:
+            rect = self.viewport.rect
+        except AttributeError:
+            return
+
+        screen = getattr(self, 'screen', None)
+        if screen is None or rect.left != 0 or \
+                rect.size.width != screen.size.width or \
+                not screen.scroll(rect.top, rect.bottom, rows):
+            self._invalidate_viewport()
+        elif rows > 0:
+            self._invalidate_viewport(Rect((rect.bottom - rows, rect.left),
+                                           (rows, rect.size.width)))
+        else:
+            self._invalidate_viewport(Rect((rect.top, rect.left),
+                                           (-rows, rect.size.width)))
+
+    def _invalidate_viewport(self, rect=None):
+        """Invalidates part of the viewport (a Rect in screen coordinates), or
+        all of it by default."""
+        invalidate = getattr(self, 'invalidate', None)
+        try:
+            rect = rect or self.viewport.rect
+            position = self.rect.position
+        except AttributeError:
+            return
+        if invalidate is not None:
+            invalidate(Rect(rect.position - position, rect.size))
 
     @property
     def highest_offset(self):
@@ -16,6 +16,19 @@ This module contains the Viewport object for representing a terminal viewport.
 
 from __future__ import absolute_import
 
+from nwid import Point, Rect, Size
+
 
 class Viewport(object):
-    """TODO"""
+    """A Viewport is the area of the screen through which a (possibly larger)
+    buffer is seen. Its position is in screen coordinates."""
+
+    def __init__(self, position=None, size=None):
+        """Initializes the viewport's position and size."""
+        self.position = Point(*position) if position else Point()
+        self.size = Size(*size) if size else Size()
+
+    @property
+    def rect(self):
+        """The Rect the viewport occupies on the screen."""
+        return Rect(self.position, self.size)
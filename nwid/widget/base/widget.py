@@ -16,6 +16,139 @@ This module contains the BaseWidget class.
 
 from __future__ import absolute_import
 
+from nwid import Point, Rect, Region, Size
+
 
 class BaseWidget(object):
-    """A base class for nwid widgets."""
+    """A base class for nwid widgets.
+
+    A widget occupies a rectangle on the screen given by its position (relative
+    to its parent) and its size. Widgets form a tree; the root widget collects
+    the damaged (invalidated) regions of the whole tree so that repaint() only
+    draws the widgets that need it.
+
+    If the root widget has a render_scheduler (see nwid.event.EventLoop),
+    invalidating any widget in the tree schedules a frame instead of drawing
+    right away.
+    """
+
+    fill = ' '
+    render_scheduler = None
+
+    def __init__(self, position=None, size=None):
+        """Initializes the widget's position, size, and children."""
+        self.position = Point(*position) if position else Point()
+        self.size = Size(*size) if size else Size()
+        self.children = []
+        self.damage = Region()
+        self._parent = None
+        self.invalidate()
+
+    @property
+    def parent(self):
+        """The widget containing this widget (or None)."""
+        return self._parent
+
+    @property
+    def root(self):
+        """The top-most widget of the tree containing this widget."""
+        widget = self
+        while widget._parent is not None:
+            widget = widget._parent
+        return widget
+
+    @property
+    def rect(self):
+        """The Rect this widget occupies in screen coordinates."""
+        position = self.position
+        widget = self._parent
+        while widget is not None:
+            position = position + widget.position
+            widget = widget._parent
+        return Rect(position, self.size)
+
+    def add_child(self, child):
+        """Adds a child widget and marks it as needing to be painted."""
+        if child._parent is not None:
+            child._parent.remove_child(child)
+        child._parent = self
+        child.damage.clear()  # Only the root's damage is used
+        self.children.append(child)
+        child.invalidate()
+
+    def remove_child(self, child):
+        """Removes a child widget and marks the area it uncovered as needing to
+        be painted."""
+        rect = child.rect
+        self.children.remove(child)
+        child._parent = None
+        self.root.damage.add(rect.intersection(self.rect))
+
+    def invalidate(self, rect=None):
+        """Marks part of the widget as needing to be painted.
+
+        :param rect: a Rect relative to the widget's top left corner. By
+            default, the entire widget is invalidated.
+        """
+        own_rect = self.rect
+        if rect is None:
+            damaged = own_rect
+        else:
+            damaged = Rect(own_rect.position + rect.position, rect.size)
+        root = self.root
+        root.damage.add(damaged.intersection(own_rect))
+        if root.render_scheduler is not None:
+            root.render_scheduler.schedule(root)
+
+    def redraw(self):
+        """Asks for the entire widget to be drawn again in the next frame."""
+        self.invalidate()
+
+    def repaint(self, screen):
+        """Paints every widget of the tree that intersects the damaged region
+        and clears the damage. Returns the list of widgets painted.
+
+        A widget is painted only if some damage falls on it outside of all of
+        its children, and then only that part of it is drawn. The damage on
+        its children is left to them. Children are assumed to be opaque.
+
+        :param screen: the ScreenBuffer to paint onto.
+        """
+        root = self.root
+        painted = []
+        if root.damage:
+            root._repaint(root.damage, screen, painted)
+            root.damage.clear()
+        return painted
+
+    def draw(self, screen, clip):
+        """Draws the part of the widget (but not its children) inside clip
+        onto a ScreenBuffer.
+
+        By default, this fills the area with the widget's fill character.
+        Subclasses should override this to draw their contents.
+
+        :param screen: the ScreenBuffer to draw onto.
+        :param clip: the Rect (in screen coordinates) that needs drawing.
+        """
+        screen.fill(clip.top, clip.left, clip.size.height, clip.size.width,
+                    self.fill)
+
+    def _repaint(self, damage, screen, painted):
+        """Recursively paints the widgets that need it (see repaint())."""
+        own_rect = self.rect
+        damaged = [rect.intersection(own_rect) for rect in damage
+                   if rect.intersects(own_rect)]
+        if not damaged:
+            return
+        uncovered = damaged
+        for child in self.children:
+            child_rect = child.rect
+            uncovered = [piece for rect in uncovered
+                         for piece in rect.subtract(child_rect)]
+        if uncovered:
+            for rect in uncovered:
+                self.draw(screen, rect)
+            painted.append(self)
+        for child in self.children:
+            child._repaint(damaged, screen, painted)
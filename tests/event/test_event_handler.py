@@ -275,3 +275,135 @@ def test_EventHandler_by_default_has_no_parent():
     assert event_handler.has_parent() == False
     with pytest.raises(NotImplementedError):
         event_handler.parent
+
+def test_EventHandler_handlers_can_change_the_handlers_while_running():
+    """A handler that registers or unregisters handlers for the event being
+    run does not change which handlers run for it."""
+    event_handler = EventHandler()
+    callback = MockCallback()
+
+    def unregister_c2(event):
+        callback.order.append(0)
+        event_handler.unregister('event', callback.c2)
+        event_handler.register('event', callback.c3, 0, method=EVENT_CAPTURE)
+
+    event_handler.register('event', unregister_c2, 0, method=EVENT_CAPTURE)
+    event_handler.register('event', callback.c2, method=EVENT_CAPTURE)
+    event_handler.run_handlers('event', EVENT_CAPTURE)
+    assert callback.order == [0, 2]
+    event_handler.run_handlers('event', EVENT_CAPTURE)
+    assert callback.order == [0, 2, 0, 3]
+
+def test_EventHandler_caches_its_propagation_paths():
+    """An EventHandler caches the path down to its focused leaf and up to its
+    root until a focused child or parent changes."""
+    eh_parent = MockEventHandlerWidget()
+    eh_child = MockEventHandlerWidget()
+    eh_parent._focused_child = eh_child
+    eh_child._parent = eh_parent
+
+    focus_path = eh_parent.focus_path
+    assert focus_path == (eh_parent, eh_child)
+    assert eh_parent.focus_path is focus_path
+    assert eh_child.parent_path == (eh_child, eh_parent)
+
+    eh_grandchild = MockEventHandlerWidget()
+    eh_child._focused_child = eh_grandchild
+    eh_grandchild._parent = eh_child
+    assert eh_parent.focus_path == (eh_parent, eh_child, eh_grandchild)
+    assert eh_grandchild.parent_path == (eh_grandchild, eh_child, eh_parent)
+
+def test_EventHandler_path_changed_invalidates_the_cached_paths():
+    """A subclass that changes focus without setting _focused_child calls
+    path_changed() to invalidate the cached paths."""
+    class ListWidget(MockEventHandlerWidget):
+        items = []
+        index = 0
+
+        @property
+        def focused_child(self):
+            return self.items[self.index]
+
+        def has_child(self):
+            return bool(self.items)
+
+    widget = ListWidget()
+    widget.items = [MockEventHandlerWidget(), MockEventHandlerWidget()]
+    assert widget.focus_path == (widget, widget.items[0])
+    widget.index = 1
+    widget.path_changed()
+    assert widget.focus_path == (widget, widget.items[1])
+
+def test_EventHandler_counts_the_listeners_of_its_subtree():
+    """An EventHandler knows if a handler for an event is registered on it or
+    anywhere below it, as handlers are registered and unregistered."""
+    eh_parent = MockEventHandlerWidget()
+    eh_child = MockEventHandlerWidget()
+    eh_parent._focused_child = eh_child
+    eh_child._parent = eh_parent
+
+    eh_child.register('event', mock_callback)
+    eh_child.register('event', mock_alt_callback)
+    assert eh_parent.has_listeners('event')
+    assert eh_child.has_listeners('event')
+    assert not eh_parent.has_listeners('other')
+
+    eh_child.unregister('event', mock_callback)
+    assert eh_parent.has_listeners('event')
+    eh_child.unregister('event')
+    assert not eh_parent.has_listeners('event')
+    assert not eh_child.has_listeners('event')
+
+def test_EventHandler_listener_counts_move_with_a_subtree():
+    """Setting the parent of an EventHandler moves the listener counts of
+    its subtree to its new parents."""
+    eh_old_parent = MockEventHandlerWidget()
+    eh_new_parent = MockEventHandlerWidget()
+    eh_child = MockEventHandlerWidget()
+    eh_grandchild = MockEventHandlerWidget()
+    eh_child._parent = eh_old_parent
+    eh_grandchild._parent = eh_child
+    eh_grandchild.register('event', mock_callback)
+    assert eh_old_parent.has_listeners('event')
+
+    eh_child._parent = eh_new_parent
+    assert not eh_old_parent.has_listeners('event')
+    assert eh_new_parent.has_listeners('event')
+
+def test_EventHandler_recounts_listeners_after_path_changed():
+    """A subclass that links its parent some other way and calls
+    path_changed() still gets the events its handlers listen for."""
+    class OwnedWidget(MockEventHandlerWidget):
+        owner = None
+
+        @property
+        def parent(self):
+            return self.owner
+
+        def has_parent(self):
+            return self.owner is not None
+
+    eh_root = MockEventHandlerWidget()
+    eh_leaf = OwnedWidget()
+    eh_leaf.register('event', mock_callback)
+    eh_leaf.owner = eh_root
+    eh_root._focused_child = eh_leaf
+    EventHandler.path_changed()
+    assert eh_root.has_listeners('event')
+
+    Mock_reset()
+    eh_root.trigger('event')
+    assert Mock.mock_callback_was_called
+
+def test_EventHandler_drops_events_nothing_listens_for():
+    """An event that nothing in the tree listens for is dropped without
+    walking the tree."""
+    class UnwalkableWidget(MockEventHandlerWidget):
+        def has_child(self):
+            raise AssertionError('The tree should not be walked.')
+
+    eh_parent = MockEventHandlerWidget()
+    eh_child = UnwalkableWidget()
+    eh_child._parent = eh_parent
+    eh_parent.register('other', mock_callback)
+    eh_child.trigger('event')
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_event_loop.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.event.event_loop module.
+"""
+
+from __future__ import absolute_import
+
+from mock import patch
+
+from nwid.event import EventLoop
+
+
+## Mock Functions/Classes ##
+
+class MockEventLoop(EventLoop):
+    """An EventLoop that reads its input from a list of chunks."""
+    def __init__(self, chunks):
+        super(MockEventLoop, self).__init__()
+        self.chunks = list(chunks)
+
+    def getch(self):
+        return self.chunks.pop(0)
+
+
+class MockSelect(object):
+    """A select() that reports input ready while there are chunks left to
+    read (as long as ready is True) and records each timeout."""
+    def __init__(self, event_loop):
+        self.event_loop = event_loop
+        self.ready = True
+        self.timeouts = []
+
+    def __call__(self, read, write, error, timeout=None):
+        self.timeouts.append(timeout)
+        if self.ready and self.event_loop.chunks:
+            return read, [], []
+        return [], [], []
+
+
+def names(fired_events):
+    return [fired.name for fired in fired_events]
+
+
+## Test EventLoop ##
+
+@patch('time.monotonic')
+def test_EventLoop_get_events_decodes_keys(mock_clock):
+    """get_events() returns each key of the input read as a FiredEvent."""
+    mock_clock.return_value = 0
+    event_loop = MockEventLoop([b'a\x1b[A'])
+    with patch('nwid.event.event_loop.select', MockSelect(event_loop)):
+        assert names(event_loop.get_events()) == ['a', 'KEY_UP']
+
+@patch('time.monotonic')
+def test_EventLoop_waits_out_the_key_timeout_across_frames(mock_clock):
+    """A frame due before the key timeout returns early without flushing a
+    pending ESC, so a sequence split after the ESC is still one key."""
+    mock_clock.return_value = 0
+    event_loop = MockEventLoop([b'\x1b', b'[A'])
+    select = MockSelect(event_loop)
+    with patch('nwid.event.event_loop.select', select):
+        assert event_loop.get_events(1) == []
+        timeout = event_loop.keyboard.timeout
+        frame_timeout = timeout / 4
+
+        select.ready = False
+        mock_clock.return_value = frame_timeout
+        assert event_loop.get_events(frame_timeout) == []
+        assert select.timeouts[-1] == frame_timeout
+        assert event_loop.keyboard.pending
+
+        select.ready = True
+        mock_clock.return_value = 2 * frame_timeout
+        assert names(event_loop.get_events(frame_timeout)) == ['KEY_UP']
+
+@patch('time.monotonic')
+def test_EventLoop_flushes_a_lone_escape_after_its_deadline(mock_clock):
+    """A lone ESC is the escape key once the key timeout has passed."""
+    mock_clock.return_value = 0
+    event_loop = MockEventLoop([b'\x1b'])
+    select = MockSelect(event_loop)
+    with patch('nwid.event.event_loop.select', select):
+        event_loop.get_events()
+        deadline = event_loop.keyboard.deadline
+        assert event_loop.get_events() == []  # Clock not yet past it
+        assert select.timeouts[-1] == deadline
+        mock_clock.return_value = deadline
+        assert names(event_loop.get_events()) == ['KEY_ESCAPE']
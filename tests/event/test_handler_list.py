@@ -206,3 +206,68 @@ def test_HandlerList_can_test_for_existance_of_function():
     assert mock_alt_callback not in handler_list
     handler_list.add(mock_alt_callback, 1, 'abc')
     assert mock_alt_callback in handler_list
+
+def test_HandlerList_keeps_each_propagation_method_in_order():
+    """A HandlerList keeps the handlers of each propagation method ordered by
+    priority, then by the order in which they were added."""
+    handler_list = HandlerList()
+    handler_list.add(mock_alt_callback, 5, method=EVENT_CAPTURE)
+    handler_list.add(mock_callback, 5, method=EVENT_CAPTURE)
+    handler_list.add(mock_callback, 1, method=EVENT_BUBBLE)
+    handler_list.add(mock_callback, 1, method=EVENT_CAPTURE)
+    assert handler_list._methods[EVENT_CAPTURE][1] == \
+        [mock_callback, mock_alt_callback, mock_callback]
+    assert handler_list._methods[EVENT_BUBBLE][1] == [mock_callback]
+
+def test_HandlerList_remove_updates_every_index():
+    """Removing an item from a HandlerList by its identifier also removes it
+    from its method's list and the index of its callback."""
+    handler_list = HandlerList()
+    handler_list.add(mock_callback, 1, 'id', EVENT_CAPTURE)
+    handler_list.add(mock_alt_callback, 2, 'alt', EVENT_CAPTURE)
+    handler_list.remove('id')
+    assert 'id' not in handler_list
+    assert mock_callback not in handler_list
+    assert list(handler_list.with_method(EVENT_CAPTURE)) == [mock_alt_callback]
+    assert handler_list._list == [HandlerListItem(mock_alt_callback, 2, 'alt',
+                                                  EVENT_CAPTURE)]
+
+def test_HandlerList_index_keeps_the_keys_of_each_id_sorted():
+    """The keys indexed for a callback stay sorted, however the items were
+    added, so each one is found with bisect."""
+    handler_list = HandlerList()
+    handler_list.add(mock_callback, 70, 'late')
+    handler_list.add(mock_callback, 10, 'early')
+    handler_list.add(mock_callback, 40, 'middle')
+    keys = handler_list._index[mock_callback]
+    assert keys == sorted(keys)
+    handler_list.remove('middle')
+    assert [key[0] for key in handler_list._index[mock_callback]] == [10, 70]
+    handler_list.remove('early')
+    assert 'late' in handler_list
+    assert [item.identifier for item in handler_list._list] == ['late']
+
+def test_HandlerList_remove_by_callback_removes_every_occurrence():
+    """Removing a callback removes every item of it, and only those."""
+    handler_list = HandlerList()
+    handler_list.add(mock_callback, 1, 'first')
+    handler_list.add(mock_alt_callback, 1)
+    handler_list.add(mock_callback, 3)
+    handler_list.remove(mock_callback)
+    assert len(handler_list) == 1
+    assert 'first' not in handler_list
+    assert handler_list[0] == mock_alt_callback
+
+def test_HandlerList_snapshot_is_only_rebuilt_when_the_list_changes():
+    """A HandlerList returns the same snapshot tuple until it changes."""
+    handler_list = HandlerList(mock_callback, 1, method=EVENT_CAPTURE)
+    snapshot = handler_list.snapshot(EVENT_CAPTURE)
+    assert snapshot == (mock_callback,)
+    assert handler_list.snapshot(EVENT_CAPTURE) is snapshot
+    handler_list.add(mock_alt_callback, 2, method=EVENT_BUBBLE)
+    assert handler_list.snapshot(EVENT_CAPTURE) is snapshot
+    handler_list.add(mock_alt_callback, 0, method=EVENT_CAPTURE)
+    assert handler_list.snapshot(EVENT_CAPTURE) == (mock_alt_callback,
+                                                    mock_callback)
+    assert snapshot == (mock_callback,)
+    assert handler_list.snapshot('unknown') == ()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_keyboard.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.event.keyboard module.
+"""
+
+from __future__ import absolute_import
+
+from nwid.event import Event, event, KeyDecoder
+
+
+def names(events):
+    return [e.name for e in events]
+
+
+## Test the keyboard events ##
+
+def test_keyboard_events_have_unique_sequences():
+    values = [e.value for e in event.values()
+              if e.type == 'keyboard' and e.value]
+    assert len(values) == len(set(values))
+
+def test_keyboard_events_include_modified_keys():
+    assert event['KEY_CTRL_UP'].value == '\x1b[1;5A'
+    assert event['KEY_ALT_SHIFT_F5'].value == '\x1b[15;4~'
+    assert event['KEY_CTRL_A'].value == '\x01'
+
+
+## Test KeyDecoder ##
+
+def test_KeyDecoder_decodes_printable_characters():
+    decoder = KeyDecoder()
+    assert decoder.feed('aé') == [Event('a', 'a', 'printable'),
+                                  Event('é', 'é', 'printable')]
+
+def test_KeyDecoder_decodes_many_keys_in_one_read():
+    decoder = KeyDecoder()
+    events = decoder.feed(b'\x1b[Ax\x1b[1;5C\r\x7f\x1bOP')
+    assert names(events) == ['KEY_UP', 'x', 'KEY_CTRL_RIGHT', 'KEY_RETURN',
+                             'KEY_BACKSPACE', 'KEY_F1']
+    assert events[2] == Event('KEY_CTRL_RIGHT', '\x1b[1;5C', 'keyboard')
+
+def test_KeyDecoder_decodes_alternate_sequences():
+    decoder = KeyDecoder()
+    assert names(decoder.feed('\x1bOA\x1b[1~\x1b[11~')) == \
+        ['KEY_UP', 'KEY_HOME', 'KEY_F1']
+
+def test_KeyDecoder_alternate_sequences_never_shadow_named_keys():
+    """A sequence that has its own key name decodes as that key, even if
+    some terminals send it for another key."""
+    decoder = KeyDecoder()
+    assert names(decoder.feed('\n\x08\r\x7f')) == \
+        ['KEY_CTRL_J', 'KEY_CTRL_H', 'KEY_RETURN', 'KEY_BACKSPACE']
+
+def test_KeyDecoder_completes_a_sequence_split_between_reads():
+    decoder = KeyDecoder()
+    assert decoder.feed('a\x1b[1', now=0) == [Event('a', 'a', 'printable')]
+    assert decoder.pending
+    assert names(decoder.feed(';2B', now=0.001)) == ['KEY_SHIFT_DOWN']
+    assert not decoder.pending
+
+def test_KeyDecoder_completes_a_character_split_between_reads():
+    decoder = KeyDecoder()
+    data = 'é'.encode('utf-8')
+    assert decoder.feed(data[:1]) == []
+    assert names(decoder.feed(data[1:])) == ['é']
+
+def test_KeyDecoder_keeps_a_lone_escape_until_flushed():
+    decoder = KeyDecoder()
+    assert decoder.feed('\x1b') == []
+    assert decoder.pending
+    assert decoder.timeout == KeyDecoder.min_timeout
+    assert names(decoder.flush()) == ['KEY_ESCAPE']
+    assert not decoder.pending
+    assert decoder.timeout is None
+
+def test_KeyDecoder_decodes_escape_followed_by_a_character_as_alt():
+    decoder = KeyDecoder()
+    assert decoder.feed('\x1bx') == [Event('KEY_ALT_x', '\x1bx', 'keyboard')]
+    assert names(decoder.feed('\x1b\x1b')) == ['KEY_ESCAPE']
+    assert names(decoder.flush()) == ['KEY_ESCAPE']
+
+def test_KeyDecoder_decodes_unknown_sequences():
+    decoder = KeyDecoder()
+    assert decoder.feed('\x1b[99~a') == [
+        Event('KEY_UNKNOWN', '\x1b[99~', 'keyboard'),
+        Event('a', 'a', 'printable')]
+
+def test_KeyDecoder_adapts_its_timeout_to_split_sequences():
+    decoder = KeyDecoder()
+    decoder.feed('\x1b[', now=0)
+    decoder.feed('A', now=0.05)
+    decoder.feed('\x1b', now=1)
+    assert decoder.timeout == 0.05 * KeyDecoder.timeout_factor
+    decoder.feed('[', now=10)
+    assert decoder.timeout == KeyDecoder.max_timeout
+
+def test_KeyDecoder_decodes_a_bracketed_paste():
+    decoder = KeyDecoder()
+    events = decoder.feed('a\x1b[200~\x1b[Ahello\r')
+    assert events == [Event('a', 'a', 'printable')]
+    assert decoder.feed('world\x1b[20') == []
+    assert decoder.feed('1~b') == [
+        Event('PASTE', '\x1b[Ahello\rworld', 'paste'),
+        Event('b', 'b', 'printable')]
+    assert not decoder.pending
+
+def test_KeyDecoder_keeps_a_stalled_paste_open():
+    """A paste that stalls is not timed out: it is kept open until its end
+    arrives, and none of it is decoded as keys."""
+    decoder = KeyDecoder()
+    assert decoder.feed(b'\x1b[200~rm -rf') == []
+    assert decoder.pasting
+    assert not decoder.pending
+    assert decoder.timeout is None
+    assert decoder.flush() == []
+    assert decoder.feed(b' /tmp/x\r\x1b[201~') == [
+        Event('PASTE', 'rm -rf /tmp/x\r', 'paste')]
+    assert not decoder.pasting
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_render_scheduler.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.event.render_scheduler module.
+"""
+
+from __future__ import absolute_import
+
+from nwid.event import RenderScheduler
+
+
+## Mock Functions/Classes ##
+
+class MockClock(object):
+    """A clock that only moves when told to."""
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class MockRenderer(object):
+    """Records each frame rendered."""
+    def __init__(self):
+        self.frames = []
+
+    def __call__(self, widgets):
+        self.frames.append(widgets)
+
+
+## Test RenderScheduler ##
+
+def test_RenderScheduler_does_nothing_without_requests():
+    """A RenderScheduler renders nothing if no redraw was requested."""
+    renderer = MockRenderer()
+    scheduler = RenderScheduler(renderer, clock=MockClock())
+    assert scheduler.timeout() is None
+    assert not scheduler.run()
+    assert renderer.frames == []
+
+def test_RenderScheduler_coalesces_redraws_into_one_frame():
+    """Many redraw requests before a frame result in one render."""
+    renderer = MockRenderer()
+    scheduler = RenderScheduler(renderer, clock=MockClock())
+    widget_1, widget_2 = object(), object()
+    for _ in range(100):
+        scheduler.schedule(widget_1)
+    scheduler.schedule(widget_2)
+    assert len(scheduler) == 2
+    assert scheduler.timeout() == 0.0
+    assert scheduler.run()
+    assert renderer.frames == [[widget_1, widget_2]]
+    assert not scheduler.pending
+
+def test_RenderScheduler_respects_max_fps():
+    """A RenderScheduler skips frames that come too soon after the last."""
+    clock = MockClock()
+    renderer = MockRenderer()
+    scheduler = RenderScheduler(renderer, max_fps=10, clock=clock)
+    widget = object()
+
+    scheduler.schedule(widget)
+    assert scheduler.run()
+
+    clock.now += 0.04
+    scheduler.schedule(widget)
+    assert abs(scheduler.timeout() - 0.06) < 1e-9
+    assert not scheduler.run()
+    assert scheduler.frames_skipped == 1
+    scheduler.schedule(widget)
+
+    clock.now += 0.06
+    assert scheduler.timeout() == 0.0
+    assert scheduler.run()
+    assert renderer.frames == [[widget], [widget]]
+    assert scheduler.frames_rendered == 2
+
+def test_RenderScheduler_can_run_without_a_frame_limit():
+    """A RenderScheduler with no max_fps renders every batch."""
+    renderer = MockRenderer()
+    scheduler = RenderScheduler(renderer, max_fps=None, clock=MockClock())
+    for _ in range(3):
+        scheduler.schedule()
+        assert scheduler.run()
+    assert len(renderer.frames) == 3
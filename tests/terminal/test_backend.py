@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_backend.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.terminal.backend module.
+"""
+
+from __future__ import absolute_import
+
+import io
+
+from mock import patch
+from nwid import Size
+from nwid.terminal import output, screen
+from nwid.terminal.backend import FileBackend, HeadlessBackend, TTYBackend
+import pytest
+
+
+## Backend tests ##
+
+def test_file_backend_writes_text_to_a_text_file():
+    """A FileBackend writes strings to a text file and counts the bytes."""
+    file = io.StringIO()
+    backend = FileBackend(file)
+    backend.write_text(u'abc')
+    backend.write(b'de')
+    assert file.getvalue() == u'abcde'
+    assert backend.writes == 2
+    assert backend.bytes_written == 5
+
+def test_file_backend_writes_bytes_to_a_binary_file():
+    """A FileBackend writes bytes to a binary file."""
+    file = io.BytesIO()
+    backend = FileBackend(file)
+    backend.write_text(u'abc')
+    backend.write(bytearray(b'de'))
+    assert file.getvalue() == b'abcde'
+
+@patch('os.write', side_effect=lambda fd, data: min(len(data), 2))
+def test_tty_backend_writes_everything_to_the_file_descriptor(mock_os_write):
+    """A TTYBackend keeps writing until all of the data is written."""
+    backend = TTYBackend(7)
+    backend.write(b'abcde')
+    assert mock_os_write.call_count == 3
+    assert backend.bytes_written == 5
+
+def test_headless_backend_feeds_its_virtual_terminal():
+    """A HeadlessBackend feeds a VirtualTerminal, even when a character is
+    split between two writes."""
+    backend = HeadlessBackend(Size(2, 10))
+    data = u'héllo'.encode('utf-8')
+    backend.write(data[:2])
+    backend.write(data[2:])
+    assert backend.terminal.display == [u'héllo', '']
+
+def test_set_backend_redirects_output():
+    """Output (including frames) goes to the backend that is set."""
+    backend = HeadlessBackend(Size(3, 10))
+    previous = output.set_backend(backend)
+    try:
+        assert output.get_backend() is backend
+        buffer = screen.ScreenBuffer(Size(3, 10))
+        buffer.write(1, 2, 'Hello')
+        with output.frame():
+            buffer.flush()
+    finally:
+        output.set_backend(previous)
+    assert backend.writes == 1
+    assert backend.terminal.display == ['', '  Hello', '']
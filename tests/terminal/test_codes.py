@@ -15,6 +15,7 @@ from __future__ import absolute_import
 
 from mock import patch
 from nwid.terminal import codes as code
+from nwid.terminal import output
 from nwid.terminal.codes import TerminalCode
 
 
@@ -92,3 +93,34 @@ def test_TerminalCode_call_with_args(mock_write):
     terminal_code = TerminalCode('name', 'abc{}efg{}ijk{}')
     terminal_code('d', 'h', 'l')
     mock_write.assert_called_once_with('abcdefghijkl')
+
+def test_TerminalCode_using_is_cached_and_bounded():
+    """A TerminalCode caches the sequences made with using() up to its
+    cache_size."""
+    terminal_code = TerminalCode('name', 'abc{};{}')
+    terminal_code.cache_size = 2
+    assert terminal_code.using(1, 2) == 'abc1;2'
+    assert terminal_code.using(1, 2) is terminal_code.using(1, 2)
+    terminal_code.using(3, 4)
+    terminal_code.using(5, 6)
+    assert len(terminal_code._using_cache) <= 2
+
+def test_TerminalCode_recompiles_when_its_value_changes():
+    """Changing a TerminalCode's value changes the sequences it makes."""
+    terminal_code = TerminalCode('name', 'abc{}')
+    assert terminal_code.using(1) == 'abc1'
+    terminal_code.value = 'xyz{}%'
+    assert terminal_code.using(1) == 'xyz1%'
+    assert terminal_code.encode(1) == b'xyz1%'
+
+def test_TerminalCode_can_be_encoded():
+    """A TerminalCode can be encoded as bytes."""
+    assert code.CURSOR_SET_POSITION.encode(3, 4) == b'\x1b[3;4f'
+    assert code.CLEAR_SCREEN.encode() == b'\x1b[2J'
+
+@patch('nwid.terminal.output.commit')
+def test_TerminalCode_call_inside_a_frame_is_added_to_the_frame(mock_commit):
+    """A TerminalCode called inside a frame is added to the frame."""
+    with output.frame():
+        code.CLEAR_SCREEN()
+    mock_commit.assert_called_once_with(bytearray(b'\x1b[2J'))
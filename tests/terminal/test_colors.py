@@ -16,6 +16,8 @@ from __future__ import absolute_import
 from nwid.terminal import codes as code
 from nwid.terminal import colors as color
 from nwid.terminal import sgr
+from nwid.terminal.styled import Run, StyledText
+import pytest
 
 
 ## Terminal color function tests ##
@@ -104,3 +106,50 @@ def tests_color_functions_can_be_chained_together_and_nested():
         ' back to default (magenta on white)' + sgr.reset()
 
     assert test_string == desired_string 
+
+def tests_color_functions_style_StyledText_structurally():
+    """A color function given StyledText merges its attributes into the
+    styles of the runs instead of wrapping escape sequences."""
+    text = color.bg_white(StyledText('red ', code.RED) + 'plain', color.bold)
+    assert text.runs == [
+        Run(sgr.rendition(code.BG_WHITE, code.BOLD, code.RED), 'red '),
+        Run(sgr.rendition(code.BG_WHITE, code.BOLD), 'plain')]
+
+def tests_color_styles_precompute_their_escape_sequences():
+    """A Style creates its prefix and suffix once and applies them the same
+    way sgr.wrap does."""
+    assert color.red.prefix == sgr.create(code.RED)
+    assert color.red.suffix == sgr.reset()
+    string = 'a' + sgr.reset() + 'b' + sgr.reset()
+    assert color.red(string) == sgr.wrap(string, code.RED)
+
+def tests_color_style_chains_are_resolved_once():
+    """A chain of Styles is combined into a single cached Style."""
+    string = 'This is sample text.'
+    assert color.bold(string, color.red, color.on_white) == \
+        color.Style(code.BOLD, code.RED, code.BG_WHITE)(string)
+    assert color._chain(color.bold, (), (color.red, color.on_white)) is \
+        color._chain(color.bold, (), (color.red, color.on_white))
+
+def tests_color_styles_chain_with_functions():
+    """A chain can include functions that take the same arguments as a
+    Style."""
+    def blink(string, *funcs, **additional):
+        return color._combine(string, code.BLINK, *funcs, **additional)
+    string = 'This is sample text.'
+    assert color.bold(string, blink, color.red) == \
+        sgr.create(code.BOLD, code.BLINK, code.RED) + string + sgr.reset()
+
+def tests_color_two_color_styles_keep_chained_attributes():
+    """A two-color Style chained after other attributes keeps them."""
+    string = 'This is sample text.'
+    assert color.bold(string, color.black_on_yellow) == \
+        sgr.create(code.BOLD, code.BG_YELLOW, code.BLACK) + string + \
+        sgr.reset()
+    assert all(isinstance(getattr(color, name), color.Style)
+               for name in dir(color) if '_on_' in name)
+
+def tests_color_styles_are_immutable():
+    """A Style cannot be changed."""
+    with pytest.raises(AttributeError):
+        color.red.prefix = ''
@@ -14,8 +14,10 @@ Unittests for nwid.terminal.cursor module.
 from __future__ import absolute_import
 
 from mock import patch
+from nwid import Point
 from nwid.terminal import codes as code
 from nwid.terminal import cursor
+from nwid.terminal.cursor import CursorTracker, plan_move
 
 
 ## Cursor code escape sequence tests ##
@@ -99,3 +101,60 @@ def test_cursor_get_position(mock_write):
     # also: row, col, x, y
     pass
     cursor.get_position()
+
+
+## Cursor tracking tests ##
+
+def test_plan_move_uses_single_byte_controls_when_cheapest():
+    """Moving the cursor uses CR, LF, and BS when they are cheapest."""
+    assert plan_move(5, 5, 5, 5) == ''
+    assert plan_move(5, 5, 5, 0) == code.CR
+    assert plan_move(5, 5, 6, 5) == code.LF
+    assert plan_move(5, 5, 5, 4) == code.BS
+    assert plan_move(5, 5, 7, 0) == code.LF + code.LF + code.CR
+
+def test_plan_move_uses_relative_moves_when_cheapest():
+    """Moving the cursor uses relative CSI moves when they are cheapest."""
+    assert plan_move(5, 5, 5, 15) == code.CURSOR_RIGHT.using(10)
+    assert plan_move(5, 5, 2, 5) == code.CURSOR_UP.using(3)
+    assert plan_move(5, 5, 15, 5) == code.CURSOR_DOWN.using(10)
+    assert plan_move(5, 9, 5, 1) == code.CURSOR_LEFT.using(8)
+    assert plan_move(5, 5, 2, 0) == code.CURSOR_PREVIOUS_LINE.using(3)
+
+def test_plan_move_uses_absolute_moves_when_cheapest():
+    """Moving the cursor uses CHA or CUP when they are cheapest."""
+    assert plan_move(5, 150, 5, 3) == code.CURSOR_HORIZONTAL_ABSOLUTE.using(4)
+    assert plan_move(50, 50, 2, 3) == code.CURSOR_SET_POSITION.using(3, 4)
+
+def test_CursorTracker_uses_absolute_moves_from_an_unknown_position():
+    """A CursorTracker that doesn't know its position moves absolutely."""
+    tracker = CursorTracker()
+    assert tracker.move_to(5, 5) == code.CURSOR_SET_POSITION.using(6, 6)
+    assert tracker.position == Point(5, 5)
+    assert tracker.move_to(5, 6) == code.CURSOR_RIGHT.using(1)
+    tracker.forget()
+    assert tracker.move_to(5, 6) == code.CURSOR_SET_POSITION.using(6, 7)
+
+def test_CursorTracker_can_advance_after_text_is_written():
+    """A CursorTracker follows text that is written and forgets its position
+    when a line wrap is pending."""
+    tracker = CursorTracker(Point(0, 0), width=10)
+    tracker.advance(4)
+    assert tracker.position == Point(0, 4)
+    tracker.advance(6)
+    assert tracker.position is None
+
+@patch('sys.stdout.write')
+def test_cursor_move_to_uses_the_tracked_position(mock_write):
+    """Tests cursor.move_to() escape sequence."""
+    cursor.set_position(3, 3)  # The terminal's third row and column
+    cursor.move_to(2, 1)
+    mock_write.assert_called_with(code.BS)
+    cursor.move_up()
+    cursor.move_to(2, 1)
+    mock_write.assert_called_with(code.CURSOR_SET_POSITION.using(3, 2))
+
+def test_cursor_cache_positions_holds_every_position_on_the_screen():
+    """The cursor position cache can be sized to hold the whole screen."""
+    cursor.cache_positions(Point(100, 200))
+    assert code.CURSOR_SET_POSITION.cache_size == 20000
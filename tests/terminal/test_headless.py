@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_headless.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.terminal.headless module.
+"""
+
+from __future__ import absolute_import
+
+from nwid import Size
+from nwid.terminal import codes as code
+from nwid.terminal import sgr
+from nwid.terminal.headless import VirtualTerminal
+
+
+## VirtualTerminal tests ##
+
+def test_virtual_terminal_prints_and_moves_the_cursor():
+    """Text is printed at the cursor, which CUP moves (1-based)."""
+    terminal = VirtualTerminal(Size(3, 10))
+    terminal.feed('ab' + code.CURSOR_SET_POSITION.using(3, 4) + 'cd')
+    assert terminal.display == ['ab', '', '   cd']
+    assert (terminal.cursor.row, terminal.cursor.col) == (2, 5)
+
+def test_virtual_terminal_wraps_at_the_right_margin():
+    """Printing past the last column wraps to the next line."""
+    terminal = VirtualTerminal(Size(2, 4))
+    terminal.feed('abcdef')
+    assert terminal.display == ['abcd', 'ef']
+
+def test_virtual_terminal_applies_sgr():
+    """SGR sequences change the rendition of printed cells."""
+    terminal = VirtualTerminal(Size(1, 10))
+    terminal.feed(sgr.create(code.BOLD, code.RED) + 'a' +
+                  sgr.create(code.RESET) + 'b')
+    assert terminal.cell(0, 0).style == sgr.rendition(code.BOLD, code.RED)
+    assert terminal.cell(0, 1).style == sgr.DEFAULT
+
+def test_virtual_terminal_erases():
+    """CLEAR_LINE_FORWARD and CLEAR_SCREEN erase cells."""
+    terminal = VirtualTerminal(Size(2, 10))
+    terminal.feed('abcdef' + code.CURSOR_SET_POSITION.using(1, 3) +
+                  code.CLEAR_LINE_FORWARD.value)
+    assert terminal.display == ['ab', '']
+    terminal.feed(code.CLEAR_SCREEN.value)
+    assert terminal.display == ['', '']
+
+def test_virtual_terminal_scrolls_the_scroll_region():
+    """SCROLL_UP at the bottom of a scroll region only moves the region's
+    rows."""
+    terminal = VirtualTerminal(Size(4, 10))
+    terminal.feed('a\r\nb\r\nc\r\nd')
+    terminal.feed(code.SET_SCROLL.using(2, 3) +
+                  code.CURSOR_SET_POSITION.using(3, 1) + code.SCROLL_UP.value)
+    assert terminal.display == ['a', 'c', '', 'd']
+
+def test_virtual_terminal_completes_split_escape_sequences():
+    """An escape sequence split between feeds is not printed."""
+    terminal = VirtualTerminal(Size(2, 10))
+    sequence = code.CURSOR_SET_POSITION.using(2, 2)
+    terminal.feed('a' + sequence[:3])
+    terminal.feed(sequence[3:] + 'b')
+    assert terminal.display == ['a', ' b']
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_output.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.terminal.output module.
+"""
+
+from __future__ import absolute_import
+
+from mock import patch
+from nwid.terminal import codes as code
+from nwid.terminal import cursor, output, screen
+import pytest
+
+
+## Output tests ##
+
+@patch('sys.stdout.write')
+def test_write_outside_of_a_frame_writes_immediately(mock_write):
+    """Writing outside of a frame writes to stdout immediately."""
+    output.write('abc')
+    mock_write.assert_called_once_with('abc')
+
+@patch('nwid.terminal.output.commit')
+@patch('sys.stdout.write')
+def test_frame_collects_output_into_one_commit(mock_write, mock_commit):
+    """Everything written inside of a frame is committed once at the end."""
+    with screen.frame():
+        assert output.in_frame()
+        cursor.set_position(1, 2)
+        output.write('Hello')
+        screen.clear_line_forward()
+        assert not mock_write.called
+        assert not mock_commit.called
+    assert not output.in_frame()
+    mock_commit.assert_called_once_with(bytearray(
+        (code.CURSOR_SET_POSITION.using(1, 2) + 'Hello' +
+         code.CLEAR_LINE_FORWARD.value).encode('utf-8')))
+
+@patch('nwid.terminal.output.commit')
+def test_nested_frames_only_commit_once(mock_commit):
+    """Only the outermost frame commits its output."""
+    with output.frame():
+        output.write('a')
+        with output.frame():
+            output.write('b')
+        assert not mock_commit.called
+    mock_commit.assert_called_once_with(bytearray(b'ab'))
+
+@patch('nwid.terminal.output.commit')
+def test_frame_discards_output_on_exception(mock_commit):
+    """A frame that raises an exception discards its output."""
+    with pytest.raises(KeyError):
+        with output.frame():
+            output.write('a')
+            raise KeyError()
+    assert not mock_commit.called
+    assert not output.in_frame()
+
+@patch('os.write', side_effect=lambda fd, data: min(len(data), 2))
+@patch('sys.stdout.fileno', return_value=99, create=True)
+def test_commit_writes_everything_to_the_file_descriptor(mock_fileno,
+                                                         mock_os_write):
+    """Committing writes all of the data to stdout's file descriptor, even
+    when the system only accepts part of it at a time."""
+    output.commit(bytearray(b'abcde'))
+    assert mock_os_write.call_count == 3
+    assert all(call[0][0] == 99 for call in mock_os_write.call_args_list)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_palette.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.terminal.palette module.
+"""
+
+from __future__ import absolute_import
+
+from nwid import Size
+from nwid.terminal import codes as code
+from nwid.terminal import colors as color
+from nwid.terminal import palette, screen, sgr
+from nwid.terminal.headless import VirtualTerminal
+import pytest
+
+
+## Extended color tests ##
+
+def test_extended_colors_create_sgr_sequences():
+    """256 and RGB colors use the EXTENDED and BG_EXTENDED codes."""
+    assert sgr.create(palette.color(208)) == code.CSI + '38;5;208m'
+    assert sgr.create(palette.on_color(10, 20, 30)) == \
+        code.CSI + '48;2;10;20;30m'
+    assert sgr.create(code.BOLD, palette.color(1, 2, 3)) == \
+        code.CSI + '1;38;2;1;2;3m'
+
+def test_extended_colors_are_equal_by_value():
+    """Extended colors with the same value are equal and fit in renditions."""
+    assert palette.ExtendedColor(208) == palette.color(208)
+    assert palette.color(208) != palette.on_color(208)
+    assert sgr.rendition(palette.color(208)).fg_color == palette.color(208)
+    assert sgr.rendition(palette.on_color(208)).bg_color == \
+        palette.on_color(208)
+
+def test_extended_colors_must_be_in_range():
+    """Colors outside of the palette or RGB range are refused."""
+    with pytest.raises(ValueError):
+        palette.color(256)
+    with pytest.raises(ValueError):
+        palette.color(0, 0, 300)
+
+def test_color_functions_wrap_text_with_extended_colors():
+    """colors.color() and colors.on_color() work like the basic colors."""
+    assert color.color(208)('text', color.bold) == \
+        sgr.create(palette.color(208), code.BOLD) + 'text' + sgr.reset()
+    assert color.on_color(1, 2, 3)('text') == \
+        sgr.create(palette.on_color(1, 2, 3)) + 'text' + sgr.reset()
+
+
+## Downsampling tests ##
+
+def test_rgb_to_256_uses_the_nearest_cube_or_gray_color():
+    """RGB colors map to the nearest color cube or gray ramp entry."""
+    assert palette.rgb_to_256(255, 135, 0) == 208
+    assert palette.rgb_to_256(0, 0, 0) == 16
+    assert palette.rgb_to_256(128, 128, 128) == 244
+    assert palette.rgb_to_256(250, 250, 250) == 231
+
+def test_rgb_to_256_matches_a_full_palette_search():
+    """The lookup tables agree with searching the palette for colors in the
+    cube and gray ramp."""
+    def search(rgb):
+        return min(range(16, 256), key=lambda index: sum(
+            (a - b) ** 2 for a, b in zip(palette.PALETTE[index], rgb)))
+    for rgb in [(10, 200, 30), (90, 90, 100), (250, 5, 128), (47, 47, 47),
+                (0, 130, 255)]:
+        index = palette.rgb_to_256(*rgb)
+        assert palette._distance(palette.PALETTE[index], rgb) == \
+            palette._distance(palette.PALETTE[search(rgb)], rgb)
+
+def test_downsample_converts_extended_colors():
+    """Extended colors are downsampled to what the terminal can display."""
+    orange = palette.color(255, 135, 0)
+    assert palette.downsample(orange, palette.TRUECOLOR) is orange
+    assert palette.downsample(orange, palette.COLORS_256) == palette.color(208)
+    assert palette.downsample(palette.color(196), palette.COLORS_16) is \
+        code.BRIGHT_RED
+    assert palette.downsample(palette.on_color(1), palette.COLORS_16) is \
+        code.BG_RED
+    assert palette.downsample(code.RED, palette.COLORS_16) is code.RED
+
+def test_downsample_rendition_converts_both_colors():
+    """Downsampling a rendition converts its text and background colors."""
+    rendition = sgr.rendition(code.BOLD, palette.color(196),
+                              palette.on_color(0, 0, 0))
+    assert palette.downsample_rendition(rendition, palette.COLORS_16) == \
+        sgr.rendition(code.BOLD, code.BRIGHT_RED, code.BG_BLACK)
+
+def test_detect_reads_the_environment(monkeypatch):
+    """The number of colors is read from COLORTERM and TERM."""
+    monkeypatch.setenv('COLORTERM', 'truecolor')
+    assert palette.detect() == palette.TRUECOLOR
+    monkeypatch.delenv('COLORTERM')
+    monkeypatch.setenv('TERM', 'xterm-256color')
+    assert palette.detect() == palette.COLORS_256
+    monkeypatch.setenv('TERM', 'xterm')
+    assert palette.detect() == palette.COLORS_16
+
+
+## Rendering tests ##
+
+def test_ScreenBuffer_downsamples_when_rendering():
+    """A ScreenBuffer renders extended colors the terminal can display."""
+    buffer = screen.ScreenBuffer(Size(1, 2))
+    buffer.colors = palette.COLORS_16
+    buffer.write(0, 0, 'a', palette.color(196))
+    terminal = VirtualTerminal(Size(1, 2))
+    terminal.feed(buffer.render())
+    assert terminal.cell(0, 0).style == sgr.rendition(code.BRIGHT_RED)
+
+def test_VirtualTerminal_parses_extended_colors():
+    """A VirtualTerminal understands 256 and RGB color sequences."""
+    terminal = VirtualTerminal(Size(1, 2))
+    terminal.feed(sgr.create(palette.color(208), palette.on_color(1, 2, 3)) +
+                  'a')
+    assert terminal.cell(0, 0).style == \
+        sgr.rendition(palette.color(208), palette.on_color(1, 2, 3))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_parser.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.terminal.parser module.
+"""
+
+from __future__ import absolute_import
+
+from nwid.terminal.parser import ControlSequence, StreamParser
+
+
+## StreamParser tests ##
+
+def test_StreamParser_yields_text_and_control_sequences():
+    """A StreamParser yields each run of text and each ControlSequence of a
+    chunk in order."""
+    parser = StreamParser()
+    assert list(parser.feed('a\x1b[1;31mb\x1b]0;title\x07\n\x1bc\x08')) == [
+        'a',
+        ControlSequence('CSI', '1;31', '', 'm', '\x1b[1;31m'),
+        'b',
+        ControlSequence('OSC', '0;title', '', '', '\x1b]0;title\x07'),
+        '\n',
+        ControlSequence('ESC', '', '', 'c', '\x1bc'),
+        ControlSequence('control', '', '', '\x08', '\x08'),
+    ]
+
+def test_StreamParser_understands_8bit_controls():
+    """A StreamParser parses the 8-bit (C1) forms of CSI and control
+    strings."""
+    parser = StreamParser()
+    assert list(parser.feed(u'\x9b2J\x90data\x9c')) == [
+        ControlSequence('CSI', '2', '', 'J', u'\x9b2J'),
+        ControlSequence('DCS', 'data', '', '', u'\x90data\x9c'),
+    ]
+
+def test_StreamParser_completes_sequences_split_between_chunks():
+    """A control sequence split between chunks is yielded once the chunk that
+    completes it is fed."""
+    parser = StreamParser()
+    assert list(parser.feed('a\x1b[1')) == ['a']
+    assert list(parser.feed(';31')) == []
+    assert list(parser.feed('mb')) == [
+        ControlSequence('CSI', '1;31', '', 'm', '\x1b[1;31m'), 'b']
+    assert list(parser.feed('\x1b]2;x\x1b')) == []
+    assert list(parser.feed('\\')) == [
+        ControlSequence('OSC', '2;x', '', '', '\x1b]2;x\x1b\\')]
+
+def test_StreamParser_decodes_characters_split_between_byte_chunks():
+    """A multi-byte character split between bytes chunks is decoded once it
+    is complete."""
+    parser = StreamParser()
+    data = u'é\x1b[0m中'.encode('utf-8')
+    items = []
+    for index in range(len(data)):
+        items.extend(parser.feed(data[index:index + 1]))
+    assert items == [u'é', ControlSequence('CSI', '0', '', 'm', '\x1b[0m'),
+                     u'中']
+
+def test_StreamParser_can_be_fed_before_using_up_a_chunk():
+    """What is pending is decided when a chunk is fed, not when it is
+    parsed."""
+    parser = StreamParser()
+    first = parser.feed('a\x1b[')
+    second = parser.feed('mb')
+    assert list(first) == ['a']
+    assert list(second) == [ControlSequence('CSI', '', '', 'm', '\x1b[m'), 'b']
+
+def test_StreamParser_memory_is_bounded():
+    """A control sequence longer than max_pending is discarded up to its
+    end."""
+    parser = StreamParser()
+    parser.max_pending = 8
+    assert list(parser.feed('a\x1b]' + 'x' * 20)) == ['a']
+    assert parser._pending == ''
+    assert list(parser.feed('x' * 20 + '\x1b')) == []
+    assert list(parser.feed('\\b')) == ['b']
+
+def test_StreamParser_close_drops_an_incomplete_sequence():
+    """Closing a StreamParser drops an incomplete sequence and resets it."""
+    parser = StreamParser()
+    assert list(parser.feed(b'a\x1b[1')) == ['a']
+    assert list(parser.close()) == []
+    assert list(parser.feed('m')) == ['m']
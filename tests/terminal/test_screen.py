@@ -16,8 +16,10 @@ Note: screen.size() is not tested here.
 from __future__ import absolute_import
 
 from mock import patch
+from nwid import Size
 from nwid.terminal import codes as code
-from nwid.terminal import screen
+from nwid.terminal import palette, screen, sgr
+from nwid.terminal.styled import StyledText
 
 
 ## Screen code escape sequence tests ##
@@ -64,3 +66,132 @@ def test_screen_reset(mock_write):
     screen.reset()
     mock_write.assert_any_call(code.CURSOR_SET_POSITION.using(0,0))
     mock_write.assert_any_call(code.CLEAR_SCREEN.value)
+
+
+## ScreenBuffer tests ##
+
+def test_ScreenBuffer_is_initialized_with_a_size():
+    """A ScreenBuffer is initialized with a blank back buffer of the given
+    size."""
+    buffer = screen.ScreenBuffer(Size(3, 4))
+    assert buffer.size == Size(3, 4)
+    assert len(buffer.back_chars) == len(buffer.back_styles) == 3
+    assert all(len(line) == 4 for line in buffer.back_chars)
+    assert all(len(line) == 4 for line in buffer.back_styles)
+    assert buffer.get(2, 3) == screen.BLANK
+
+def test_ScreenBuffer_stores_cells_in_compact_arrays():
+    """A ScreenBuffer stores codepoints and style IDs in typed arrays."""
+    buffer = screen.ScreenBuffer(Size(1, 3))
+    buffer.write(0, 0, 'ab', code.BOLD)
+    assert buffer.back_chars[0].typecode == 'I'
+    assert buffer.back_styles[0].typecode == 'H'
+    assert list(buffer.back_chars[0]) == [ord('a'), ord('b'), ord(' ')]
+    assert list(buffer.back_styles[0]) == [buffer.styles.intern(code.BOLD)] * 2 \
+        + [0]
+
+def test_ScreenBuffer_write_clips_to_the_screen():
+    """Writing to a ScreenBuffer clips anything off of the screen."""
+    buffer = screen.ScreenBuffer(Size(2, 4))
+    buffer.write(0, 2, 'abcdef', code.RED)
+    buffer.write(1, -2, 'xyz')
+    buffer.write(5, 0, 'ignored')
+    assert buffer.get(0, 2) == screen.Cell('a', sgr.rendition(code.RED))
+    assert buffer.get(0, 3) == screen.Cell('b', sgr.rendition(code.RED))
+    assert buffer.get(1, 0) == screen.Cell('z', sgr.DEFAULT)
+
+def test_ScreenBuffer_write_styled_writes_each_run_with_its_style():
+    """Writing StyledText to a ScreenBuffer stores the style of each run."""
+    buffer = screen.ScreenBuffer(Size(1, 4))
+    buffer.write_styled(0, 1, StyledText('a', code.RED) + 'bc')
+    assert buffer.get(0, 0) == screen.Cell(' ', sgr.DEFAULT)
+    assert buffer.get(0, 1) == screen.Cell('a', sgr.rendition(code.RED))
+    assert buffer.get(0, 2) == screen.Cell('b', sgr.DEFAULT)
+    assert buffer.get(0, 3) == screen.Cell('c', sgr.DEFAULT)
+
+def test_ScreenBuffer_reuses_the_ids_of_styles_no_longer_on_screen():
+    """A ScreenBuffer whose StyleTable is full reclaims the IDs of styles
+    that are in neither buffer instead of refusing new styles."""
+    buffer = screen.ScreenBuffer(Size(1, 2))
+    buffer.styles.max_styles = len(buffer.styles) + 4
+    for value in range(10):
+        buffer.write(0, 0, 'a', palette.color(value, 0, 0))
+        buffer.write(0, 1, 'b', code.BOLD, palette.color(0, value, 0))
+        buffer.render()
+    assert len(buffer.styles) <= buffer.styles.max_styles
+    assert buffer.get(0, 0) == \
+        screen.Cell('a', sgr.rendition(palette.color(9, 0, 0)))
+    assert buffer.get(0, 1) == \
+        screen.Cell('b', sgr.rendition(code.BOLD, palette.color(0, 9, 0)))
+    assert buffer.render() == ''
+
+def test_ScreenBuffer_first_render_paints_every_cell():
+    """The first render of a ScreenBuffer paints the entire screen."""
+    buffer = screen.ScreenBuffer(Size(2, 2))
+    buffer.write(0, 0, 'ab')
+    buffer.write(1, 0, 'cd')
+    assert buffer.render() == \
+        code.CURSOR_SET_POSITION.using(1, 1) + sgr.reset() + 'ab' + \
+        code.CURSOR_SET_POSITION.using(2, 1) + 'cd'
+
+def test_ScreenBuffer_render_only_emits_changed_runs():
+    """Once rendered, a ScreenBuffer only emits the cells that changed."""
+    buffer = screen.ScreenBuffer(Size(2, 20))
+    buffer.render()
+    assert buffer.render() == ''
+
+    buffer.write(1, 2, 'ab', code.BOLD)
+    buffer.write(1, 15, 'c')
+    assert buffer.render() == \
+        code.CURSOR_SET_POSITION.using(2, 3) + \
+        sgr.create(code.BOLD) + 'ab' + \
+        code.CURSOR_RIGHT.using(11) + sgr.reset() + 'c'
+
+def test_ScreenBuffer_render_merges_runs_with_small_gaps():
+    """Changed runs separated by only a few unchanged cells are merged."""
+    buffer = screen.ScreenBuffer(Size(1, 10))
+    buffer.render()
+    buffer.write(0, 0, 'a')
+    buffer.write(0, 3, 'b')
+    assert buffer.render() == \
+        code.CURSOR_SET_POSITION.using(1, 1) + 'a  b'
+
+def test_ScreenBuffer_invalidate_forces_a_full_repaint():
+    """Invalidating a ScreenBuffer repaints every cell on the next render."""
+    buffer = screen.ScreenBuffer(Size(1, 2))
+    buffer.render()
+    buffer.invalidate()
+    assert buffer.render() == \
+        code.CURSOR_SET_POSITION.using(1, 1) + sgr.reset() + '  '
+
+@patch('sys.stdout.write')
+def test_ScreenBuffer_flush_writes_the_render(mock_write):
+    """Flushing a ScreenBuffer writes its render to stdout."""
+    buffer = screen.ScreenBuffer(Size(1, 2))
+    buffer.write(0, 0, 'hi')
+    buffer.flush()
+    mock_write.assert_called_once_with(
+        code.CURSOR_SET_POSITION.using(1, 1) + sgr.reset() + 'hi')
+    buffer.flush()
+    mock_write.assert_called_once()
+
+@patch('sys.stdout.write')
+def test_ScreenBuffer_scroll_shifts_both_buffers(mock_write):
+    """Scrolling a ScreenBuffer region shifts its lines on the terminal and in
+    both buffers."""
+    buffer = screen.ScreenBuffer(Size(4, 3))
+    for row in range(4):
+        buffer.write(row, 0, str(row) * 3)
+    buffer.render()
+    assert buffer.scroll(1, 4, 1)
+    mock_write.assert_called_once_with(
+        code.SET_SCROLL.using(2, 4) + code.LF * 3 + code.SCROLL_UP.value + code.SET_SCROLL_ALL.value)
+    assert [buffer.get(row, 0).char for row in range(4)] == ['0', '2', '3', ' ']
+    buffer.write(3, 0, 'abc')
+    assert buffer.render() == code.LF * 3 + 'abc'
+
+def test_ScreenBuffer_scroll_refuses_to_scroll_the_whole_region():
+    """A ScreenBuffer will not scroll a region by its height or more."""
+    buffer = screen.ScreenBuffer(Size(4, 3))
+    assert not buffer.scroll(0, 4, 4)
+    assert not buffer.scroll(0, 4, 0)
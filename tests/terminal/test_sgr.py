@@ -13,6 +13,7 @@ Unittests for nwid.terminal.sgr module.
 
 from __future__ import absolute_import
 
+from array import array
 from nwid.terminal import codes as code
 from nwid.terminal import sgr
 import pytest
@@ -25,6 +26,12 @@ def test_sgr_can_create_codes():
     assert sgr.create(code.BLACK) == code.CSI + code.BLACK + 'm'
     assert sgr.create(code.BG_BLACK) == code.CSI + code.BG_BLACK + 'm'
 
+def test_sgr_create_is_cached():
+    """SGR escape sequences are cached by their attributes."""
+    sgr.clear_cache()
+    sequence = sgr.create(code.BOLD, code.RED)
+    assert sgr.create(code.BOLD, code.RED) is sequence
+
 def test_sgr_create():
     """SGR create returns an empty string when no args are passed."""
     assert sgr.create() == ''
@@ -72,3 +79,126 @@ def test_can_wrap_string_with_trailing_reset_with_sgr():
             sgr.create(code.RED) + 'is a string.' + sgr.reset()
 
     assert sgr.wrap(string, code.BG_BLUE) == modified_string
+
+
+## SGR rendition tests ##
+
+def test_rendition_applies_attributes_in_order():
+    """A rendition is built by applying SGR attributes in order."""
+    assert sgr.rendition() == sgr.DEFAULT
+    assert sgr.rendition(code.BOLD, code.RED, code.BG_BLUE) == \
+        sgr.Rendition(frozenset([code.BOLD]), code.RED, code.BG_BLUE)
+    assert sgr.rendition(code.RED, code.GREEN) == \
+        sgr.Rendition(frozenset(), code.GREEN, None)
+    assert sgr.rendition(code.BOLD, code.RED, code.RESET, code.UNDERLINE) == \
+        sgr.Rendition(frozenset([code.UNDERLINE]), None, None)
+    assert sgr.rendition(code.BLINK, code.RBLINK, code.BLINK_OFF,
+                         code.FG_DEFAULT) == sgr.DEFAULT
+
+def test_rendition_can_be_applied_to_a_base():
+    """A rendition can be built on top of another."""
+    base = sgr.rendition(code.BOLD, code.RED)
+    assert sgr.rendition(code.BOLD_OFF, code.BG_WHITE, base=base) == \
+        sgr.Rendition(frozenset(), code.RED, code.BG_WHITE)
+
+def test_rendition_only_accepts_sgr_codes():
+    """Only SGR escape sequences can be used in a rendition."""
+    with pytest.raises(sgr.SGRError):
+        sgr.rendition(code.CURSOR_HIDE)
+
+def test_transition_emits_only_the_changes():
+    """A transition between renditions only emits what changed."""
+    bold_red_on_blue = sgr.rendition(code.BOLD, code.RED, code.BG_BLUE)
+    red_on_blue = sgr.rendition(code.RED, code.BG_BLUE)
+    green_on_blue = sgr.rendition(code.GREEN, code.BG_BLUE)
+    assert sgr.transition(red_on_blue, red_on_blue) == ''
+    assert sgr.transition(bold_red_on_blue, red_on_blue) == \
+        sgr.create(code.BOLD_OFF)
+    assert sgr.transition(red_on_blue, green_on_blue) == \
+        sgr.create(code.GREEN)
+    assert sgr.transition(sgr.DEFAULT, bold_red_on_blue) == \
+        sgr.create(code.BOLD, code.RED, code.BG_BLUE)
+
+def test_transition_uses_a_reset_when_it_is_shorter():
+    """A transition uses a reset when that is shorter than the changes."""
+    assert sgr.transition(sgr.rendition(code.RED), sgr.DEFAULT) == sgr.reset()
+    assert sgr.transition(sgr.rendition(code.BOLD, code.UNDERLINE, code.RED),
+                          sgr.rendition(code.GREEN)) == \
+        sgr.create(code.RESET, code.GREEN)
+
+def test_transition_from_an_unknown_rendition_resets():
+    """A transition from an unknown rendition starts with a reset."""
+    assert sgr.transition(None, sgr.DEFAULT) == sgr.reset()
+    assert sgr.transition(None, sgr.rendition(code.RED)) == \
+        sgr.create(code.RESET, code.RED)
+
+def test_transition_keeps_a_shared_blink_off_code_correct():
+    """Turning off one kind of blink turns off both, so the other kind is
+    turned back on."""
+    assert sgr.transition(sgr.rendition(code.BLINK, code.RBLINK, code.BOLD),
+                          sgr.rendition(code.RBLINK, code.BOLD)) == \
+        sgr.create(code.BLINK_OFF, code.RBLINK)
+
+def test_SGRState_tracks_the_current_rendition():
+    """An SGRState emits only the changes from its current rendition."""
+    state = sgr.SGRState()
+    assert state.update(code.RED) == sgr.create(code.RESET, code.RED)
+    assert state.update(code.RED, code.BG_WHITE) == sgr.create(code.BG_WHITE)
+    assert state.update(code.RED, code.BG_WHITE) == ''
+    assert state.change_to(sgr.DEFAULT) == sgr.reset()
+    state.forget()
+    assert state.rendition is None
+
+def test_sgr_render_joins_runs_with_minimal_sequences():
+    """SGR render joins styled runs with only the sequences needed."""
+    assert sgr.render([
+        ('a', (code.RED, code.BG_WHITE)),
+        ('b', (code.GREEN, code.BG_WHITE)),
+        ('c', (code.GREEN, code.BG_WHITE)),
+        ('d', ()),
+    ]) == sgr.create(code.RED, code.BG_WHITE) + 'a' + \
+        sgr.create(code.GREEN) + 'bc' + sgr.reset() + 'd'
+
+
+## StyleTable tests ##
+
+def test_StyleTable_interns_the_default_as_zero():
+    """The default rendition is always style ID 0."""
+    table = sgr.StyleTable()
+    assert table.intern() == 0
+    assert table.intern(code.RESET) == 0
+    assert table.lookup(0) == sgr.DEFAULT
+
+def test_StyleTable_gives_equal_renditions_the_same_id():
+    """Attributes that result in the same rendition share a style ID."""
+    table = sgr.StyleTable()
+    style_id = table.intern(code.BOLD, code.RED)
+    assert table.intern(code.RED, code.BOLD) == style_id
+    assert table.intern_rendition(sgr.rendition(code.BOLD, code.RED)) == \
+        style_id
+    assert table.intern(code.BOLD) != style_id
+    assert table.lookup(style_id) == sgr.rendition(code.BOLD, code.RED)
+
+def test_StyleTable_is_limited_to_unsigned_short_ids():
+    """A StyleTable refuses to grow past the IDs an array('H') can hold."""
+    table = sgr.StyleTable()
+    table.max_styles = len(table)
+    assert table.intern(code.BOLD) < table.max_styles
+    with pytest.raises(sgr.SGRError):
+        table.intern(code.BOLD, code.RED, code.BG_BLUE)
+
+def test_StyleTable_compact_renumbers_the_styles_in_use():
+    """Compacting a StyleTable drops unused styles and rewrites the IDs of
+    the others."""
+    table = sgr.StyleTable()
+    fixed = len(table)
+    table.intern(code.BOLD, code.RED)
+    used = table.intern(code.BOLD, code.BLUE)
+    lines = [array('H', [0, used, table.UNKNOWN]),
+             array('H', [table.intern(code.BOLD)])]
+    table.compact(lines)
+    assert len(table) == fixed + 1
+    assert list(lines[0]) == [0, fixed, table.UNKNOWN]
+    assert table.lookup(fixed) == sgr.rendition(code.BOLD, code.BLUE)
+    assert table.intern(code.BOLD, code.BLUE) == fixed
+    assert table.intern(code.BOLD, code.RED) == fixed + 1
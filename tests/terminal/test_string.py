@@ -13,10 +13,12 @@ Unittests for nwid.terminal.string module.
 
 from __future__ import absolute_import
 
+from mock import patch
 from nwid.terminal import codes as code
 from nwid.terminal import colors as color
 from nwid.terminal import sgr, TerminalString
 from nwid.terminal.string import EscapeMarker
+import pytest
 
 
 ## Test TerminalString object ##
@@ -96,6 +98,126 @@ def test_TerminalString_parses_and_marks_its_string_for_non_printable_chars():
     assert terminal_string.escape_markers == expected
     assert just_the_string == 'This is a string.'
 
+def test_TerminalString_marks_all_ecma_48_escape_sequences():
+    """A TerminalString marks control sequences with intermediate bytes,
+    control strings ended by BEL or ST, and other escape sequences."""
+    cases = [
+        ('\033[1 qa', [EscapeMarker(0, 4)]),              # CSI intermediate
+        ('\033[?25ha', [EscapeMarker(0, 5)]),             # Private CSI
+        ('\033]0;title\007a', [EscapeMarker(0, 9)]),      # OSC ended by BEL
+        ('\033]8;;url\033\\a', [EscapeMarker(0, 9)]),     # OSC ended by ST
+        ('\033Pq#0\033\\a', [EscapeMarker(0, 6)]),        # DCS
+        ('\033(Ba', [EscapeMarker(0, 2)]),                # Charset selection
+        ('\0337a', [EscapeMarker(0, 1)]),                 # Save cursor
+        ('\x9b31ma', [EscapeMarker(0, 3)]),               # 8-bit CSI
+        ('a\033[1;2', [EscapeMarker(1, 5)]),              # Cut off
+        ('a\033', [EscapeMarker(1, 1)]),
+        ('a\tb\n', []),                                   # Whitespace
+    ]
+    for string, expected in cases:
+        terminal_string = TerminalString(string)
+        assert terminal_string.escape_markers == expected
+        assert terminal_string.visible().strip() in ('a', 'a\tb')
+
+def test_TerminalString_parses_its_escape_markers_lazily():
+    """A TerminalString is not parsed until its markers are needed, and is
+    parsed again when its string is changed."""
+    terminal_string = TerminalString(color.red('This is a string.'))
+    assert terminal_string._escape_markers is None
+    assert len(terminal_string) == 17
+    assert terminal_string._escape_markers is None
+    assert terminal_string.escape_markers == \
+        [EscapeMarker(0, 4), EscapeMarker(22, 25)]
+
+    terminal_string.string = 'plain'
+    assert terminal_string.escape_markers == []
+    assert len(terminal_string) == 5
+
+def test_TerminalString_caches_its_len():
+    """A TerminalString measures its length once."""
+    terminal_string = TerminalString('This is a string.')
+    assert len(terminal_string) == 17
+    terminal_string._string = 'changed without resetting the cache'
+    assert len(terminal_string) == 17
+
+def test_TerminalString_case_changes_of_plain_text_skip_parsing():
+    """upper() and lower() of text without escape sequences know the result
+    has none (and the same length, for ASCII)."""
+    terminal_string = TerminalString('This is a string.')
+    assert len(terminal_string) == 17
+    upper = terminal_string.upper()
+    assert upper._escape_markers == []
+    assert upper._length == 17
+    assert str(upper) == 'THIS IS A STRING.'
+    assert TerminalString('abc').lower()._escape_markers == []
+
+    colored = TerminalString(color.red('abc')).upper()
+    assert colored._escape_markers is None
+    assert len(colored) == 3
+
+def test_TerminalString_case_changes_that_change_the_length():
+    """upper() and lower() of non-ASCII text measure the result again, since
+    a character may become several."""
+    terminal_string = TerminalString(u'straße')
+    assert len(terminal_string) == 6
+    upper = terminal_string.upper()
+    assert str(upper) == 'STRASSE'
+    assert len(upper) == 7
+    ligature = TerminalString(u'\ufb01x')
+    assert len(ligature) == 2
+    assert len(ligature.upper()) == 3
+
+def test_TerminalString_concatenation_links_pieces():
+    """Adding TerminalStrings links them without joining their strings until
+    the string is needed."""
+    left = TerminalString(color.red('ab'))
+    right = TerminalString(color.bold('cd'))
+    joined = 'x' + left + right + 'y'
+    assert isinstance(joined, TerminalString)
+    assert joined._string is None
+    assert len(joined) == 6
+    assert joined._string is None
+    assert str(joined) == 'x' + color.red('ab') + color.bold('cd') + 'y'
+    assert joined._pieces is None
+
+def test_TerminalString_concatenation_shifts_parsed_markers():
+    """The markers of a concatenation are the shifted markers of its pieces,
+    which are not scanned again."""
+    left = TerminalString(color.red('ab'))
+    right = TerminalString(color.bold('cd'))
+    assert left.escape_markers and right.escape_markers
+    joined = left + right
+    with patch.object(TerminalString, 'parse_escape_markers',
+                      side_effect=AssertionError('scanned again')):
+        markers = joined.escape_markers
+    assert markers == \
+        TerminalString(color.red('ab') + color.bold('cd')).escape_markers
+
+def test_TerminalString_concatenation_completes_cut_off_sequences():
+    """An escape sequence split between two pieces is marked as one."""
+    assert len(TerminalString('ab\033[3') + TerminalString('1mcd')) == 4
+    joined = TerminalString('ab\033[3') + TerminalString('1mcd')
+    assert joined.escape_markers == [EscapeMarker(2, 6)]
+    assert len(joined) == 4
+    assert joined[2:] == sgr.create(code.RED) + 'cd' + sgr.reset()
+
+def test_TerminalString_concatenation_completes_a_split_string_terminator():
+    """A control string whose ST (ESC \\) is split between two pieces is
+    marked as one sequence."""
+    string = 'x\x1b]0;title\x1b\\y'
+    assert len(TerminalString(string[:11]) + TerminalString(string[11:])) \
+        == 2
+    joined = TerminalString(string[:11]) + TerminalString(string[11:])
+    assert joined.escape_markers == TerminalString(string).escape_markers \
+        == [EscapeMarker(1, 11)]
+    assert len(joined) == 2
+
+def test_TerminalString_concatenation_measures_joined_clusters():
+    """Characters joined across two pieces are measured as one cluster."""
+    joined = TerminalString(u'\U0001F468\u200d') + \
+        TerminalString(u'\U0001F469')
+    assert len(joined) == 2
+
 def test_TerminalString_has_a_len_method():
     """A TerminalString has a len method."""
     terminal_string = TerminalString('This is a string.')
@@ -116,6 +238,12 @@ def test_TerminalString_len_method_ignores_escape_sequences():
     )
     assert len(terminal_string) == 17
 
+def test_TerminalString_len_method_counts_terminal_columns():
+    """A TerminalString's len method counts the columns it takes up."""
+    assert len(TerminalString(u'日本語')) == 6
+    assert len(TerminalString(u'cafe\u0301')) == 4
+    assert len(TerminalString(u'\U0001F468\u200d\U0001F469')) == 2
+
 def test_TerminalString_indexing_ignores_escape_sequences():
     """Indexing a TerminalString ignores escape sequences."""
     string = 'This is a string.'
@@ -147,7 +275,8 @@ def test_TerminalString_indexing_ignores_escape_sequences():
 
 def test_TerminalString_splicing_ignores_escape_sequences_for_positioning_but_includes_them():
     """Splicing a TerminalString ignores escape sequences for positioning but
-    includes them in the returned string."""
+    includes them in the returned string. Only the rendition in effect at the
+    start of the slice is applied before it."""
     string = 'This is a string.'
     terminal_string = TerminalString(string)
 
@@ -167,20 +296,28 @@ def test_TerminalString_splicing_ignores_escape_sequences_for_positioning_but_in
     )
     assert terminal_string[0:5] == sgr.create(code.RED, code.BG_BLACK) + 'This ' + sgr.reset()
     assert terminal_string[1:4] == sgr.create(code.RED, code.BG_BLACK) + 'his' + sgr.reset()
-    assert terminal_string[6:11] == sgr.create(code.RED, code.BG_BLACK) + \
-            sgr.create(code.BOLD) + 's ' + sgr.reset() + \
+    assert terminal_string[6:11] == sgr.create(code.BOLD, code.RED, code.BG_BLACK) + \
+            's ' + sgr.reset() + \
             sgr.create(code.RED, code.BG_BLACK) + \
             sgr.create(code.BG_WHITE) + 'a ' + sgr.reset() + \
             sgr.create(code.RED, code.BG_BLACK) + \
             's' + sgr.reset()
 
-    assert terminal_string[9:17] == sgr.create(code.RED, code.BG_BLACK) + \
-            sgr.create(code.BOLD) + sgr.reset() + \
-            sgr.create(code.RED, code.BG_BLACK) + \
-            sgr.create(code.BG_WHITE) + ' ' + sgr.reset() + \
+    assert terminal_string[9:17] == sgr.create(code.RED, code.BG_WHITE) + \
+            ' ' + sgr.reset() + \
             sgr.create(code.RED, code.BG_BLACK) + \
             'string.' + sgr.reset()
 
+def test_TerminalString_splicing_uses_terminal_columns():
+    """Splicing a TerminalString positions by column and never splits a wide
+    character or a grapheme cluster."""
+    terminal_string = TerminalString(u'a日本e\u0301b')
+    assert terminal_string[0:3] == u'a日'
+    assert terminal_string[1:4] == u'日'
+    assert terminal_string[2:7] == u'本e\u0301b'
+    assert terminal_string[5] == u'e\u0301'
+    assert terminal_string[1] == terminal_string[2] == u'日'
+
 def test_TerminalString_splicing_works_with_negative_values():
     """Splicing a TerminalString works with negative values."""
     string = 'This is a string.'
@@ -202,23 +339,50 @@ def test_TerminalString_splicing_works_with_negative_values():
     )
     assert terminal_string[:-12] == sgr.create(code.RED, code.BG_BLACK) + 'This ' + sgr.reset()
     assert terminal_string[-16:4] == sgr.create(code.RED, code.BG_BLACK) + 'his' + sgr.reset()
-    assert terminal_string[-11:-6] == sgr.create(code.RED, code.BG_BLACK) + \
-            sgr.create(code.BOLD) + 's ' + sgr.reset() + \
+    assert terminal_string[-11:-6] == sgr.create(code.BOLD, code.RED, code.BG_BLACK) + \
+            's ' + sgr.reset() + \
             sgr.create(code.RED, code.BG_BLACK) + \
             sgr.create(code.BG_WHITE) + 'a ' + sgr.reset() + \
             sgr.create(code.RED, code.BG_BLACK) + \
             's' + sgr.reset()
 
-    assert terminal_string[-8:-1] == sgr.create(code.RED, code.BG_BLACK) + \
-            sgr.create(code.BOLD) + sgr.reset() + \
-            sgr.create(code.RED, code.BG_BLACK) + \
-            sgr.create(code.BG_WHITE) + ' ' + sgr.reset() + \
+    assert terminal_string[-8:-1] == sgr.create(code.RED, code.BG_WHITE) + \
+            ' ' + sgr.reset() + \
             sgr.create(code.RED, code.BG_BLACK) + \
             'string' + sgr.reset()
 
 def test_TerminalString_splicing_works_with_step_value():
     """Splicing a TerminalString works with step value."""
-    # TODO: Not yet implemented.
-    pass
+    string = 'This is a string.'
+    terminal_string = TerminalString(string)
+
+    assert string[::2] == terminal_string[::2]
+    assert string[1:10:3] == terminal_string[1:10:3]
+    assert string[::-1] == terminal_string[::-1]
+    assert string[-2:2:-4] == terminal_string[-2:2:-4]
+
+    terminal_string = TerminalString(
+        color.red(
+            'This ' +
+            color.bold('is ') +
+            color.bg_white('a ') +
+            'string.', color.bg_black
+        )
+    )
+    assert terminal_string[::2] == sgr.create(code.RED, code.BG_BLACK) + \
+            'Ti ' + sgr.create(code.BOLD) + 's' + \
+            sgr.create(code.BOLD_OFF, code.BG_WHITE) + 'a' + \
+            sgr.create(code.BG_BLACK) + 'srn.' + sgr.reset()
+
+def test_TerminalString_indexing_and_splicing_use_the_column_index():
+    """A TerminalString finds columns in its column index."""
+    terminal_string = TerminalString(color.red(u'a日b'))
+    assert terminal_string.column_index.columns == [0, 1, 3]
+    assert terminal_string.column_index.column_stops == [1, 3, 4]
+    assert terminal_string[-1] == 'b'
+    assert terminal_string[2] == u'日'
+    assert terminal_string[1:] == sgr.create(code.RED) + u'日b' + sgr.reset()
+    with pytest.raises(IndexError):
+        terminal_string[4]
 
     # ALSO TODO: work on string type tests
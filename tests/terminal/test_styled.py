@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_styled.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.terminal.styled module.
+"""
+
+from __future__ import absolute_import
+
+from nwid.terminal import codes as code
+from nwid.terminal import colors, sgr
+from nwid.terminal.string import TerminalString
+from nwid.terminal.styled import Run, StyledText
+
+
+## StyledText tests ##
+
+def test_StyledText_is_a_single_run():
+    """StyledText is initialized as one run styled by SGR attributes."""
+    text = StyledText('Hello', code.BOLD, code.RED)
+    assert text.runs == [Run(sgr.rendition(code.BOLD, code.RED), 'Hello')]
+    assert StyledText('').runs == []
+
+def test_StyledText_merges_adjacent_runs_of_the_same_style():
+    """Adding StyledText joins runs of the same style and drops empty
+    ones."""
+    text = StyledText('a', code.RED) + StyledText('', code.BOLD) + \
+        StyledText('b', code.RED) + 'c'
+    assert text.runs == [Run(sgr.rendition(code.RED), 'ab'),
+                         Run(sgr.DEFAULT, 'c')]
+
+def test_StyledText_style_merges_under_the_style_of_each_run():
+    """Styling StyledText applies attributes under each run's own style, so
+    nested styles never add escape sequences to the text."""
+    text = (StyledText('a', code.RED) + StyledText('b')).style(
+        code.BLUE, code.BG_WHITE).style(code.BOLD)
+    assert text.runs == [
+        Run(sgr.rendition(code.BOLD, code.BG_WHITE, code.RED), 'a'),
+        Run(sgr.rendition(code.BOLD, code.BG_WHITE, code.BLUE), 'b')]
+
+def test_StyledText_renders_the_fewest_escape_sequences():
+    """StyledText is rendered with only the changes between its runs and
+    ends with the default rendition."""
+    text = StyledText('a', code.BOLD) + StyledText('b', code.BOLD, code.RED)
+    assert text.render() == sgr.create(code.BOLD) + 'a' + \
+        sgr.create(code.RED) + 'b' + sgr.reset()
+    assert str(StyledText('plain')) == 'plain'
+
+def test_StyledText_renders_from_a_known_state():
+    """Rendering StyledText with an SGRState emits only the changes from it
+    and updates it."""
+    state = sgr.SGRState(sgr.rendition(code.RED))
+    text = StyledText('a', code.RED)
+    assert text.render(state) == 'a' + sgr.reset()
+    assert state.rendition == sgr.DEFAULT
+
+def test_StyledText_is_measured_in_columns():
+    """The length of StyledText is the number of columns of its text."""
+    text = StyledText('ab', code.RED) + StyledText(u'中', code.BOLD)
+    assert len(text) == 4
+    assert text.plain == u'ab中'
+
+def test_StyledText_from_string_parses_sgr_sequences():
+    """StyledText can be made from a string or TerminalString with escape
+    sequences."""
+    string = colors.red('a' + colors.bold('b') + 'c')
+    runs = [Run(sgr.rendition(code.RED), 'a'),
+            Run(sgr.rendition(code.RED, code.BOLD), 'b'),
+            Run(sgr.rendition(code.RED), 'c')]
+    assert StyledText.from_string(string).runs == runs
+    assert StyledText.from_string(TerminalString(string)).runs == runs
+
+def test_StyledText_round_trips_through_a_TerminalString():
+    """StyledText rendered to a TerminalString parses back to the same
+    runs."""
+    text = StyledText('a', code.RED) + StyledText('b', code.UNDERLINE)
+    string = text.to_terminal_string()
+    assert isinstance(string, TerminalString)
+    assert len(string) == 2
+    assert StyledText.from_string(string) == text
+
+def test_StyledText_adds_with_strings_and_TerminalStrings():
+    """Strings and TerminalStrings can be added to StyledText on either
+    side."""
+    text = 'x' + StyledText('a', code.RED) + TerminalString(colors.bold('b'))
+    assert text.runs == [Run(sgr.DEFAULT, 'x'),
+                         Run(sgr.rendition(code.RED), 'a'),
+                         Run(sgr.rendition(code.BOLD), 'b')]
+    assert (TerminalString('x') + StyledText('a', code.RED)).string == \
+        'x' + sgr.create(code.RED) + 'a' + sgr.reset()
+
+def test_StyledText_addition_links_pieces_and_merges_where_they_meet():
+    """Adding StyledText links the pieces without copying their runs, and
+    runs of the same style are merged where two pieces meet."""
+    text = StyledText()
+    for fragment in ['ab', 'cd', 'ef']:
+        text = text + StyledText(fragment, code.RED)
+    text = text + 'g'
+    assert text._runs is None
+    assert text.runs == [Run(sgr.rendition(code.RED), 'abcdef'),
+                         Run(sgr.DEFAULT, 'g')]
+    assert text._pieces is None
+
+def test_StyledText_join():
+    """StyledText.join joins items with a separator."""
+    text = StyledText.join([StyledText('a', code.RED), 'b'],
+                           StyledText(', ', code.BOLD))
+    assert text.plain == 'a, b'
+    assert text.runs[1] == Run(sgr.rendition(code.BOLD), ', ')
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_width.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.terminal.width module.
+"""
+
+from __future__ import absolute_import
+
+from nwid.terminal import width
+
+
+## Display width tests ##
+
+def test_width_of_ascii_text_is_its_length():
+    """ASCII text takes up one column per printable character."""
+    assert width.width('') == 0
+    assert width.width('This is a string.') == 17
+    assert width.width('a\tb\x07') == 2
+
+def test_is_ascii_works_without_str_isascii():
+    """is_ascii() has a fallback for Pythons without str.isascii()."""
+    for string in ('', 'abc\x1b[0m\x7f', u'straße', u'中'):
+        assert width._is_ascii(string) == width.is_ascii(string)
+    assert width._is_ascii('abc')
+    assert not width._is_ascii(u'abç')
+
+def test_width_counts_wide_characters_as_two_columns():
+    """East Asian wide and fullwidth characters take up two columns."""
+    assert width.width(u'日本語') == 6
+    assert width.width(u'ｆｕｌｌ') == 8
+    assert width.width(u'a日b') == 4
+    assert width.width(u'\U00020000') == 2  # CJK Extension B
+    assert width.width(u'\U0001F44D') == 2  # Thumbs up emoji
+
+def test_width_counts_combining_marks_as_no_columns():
+    """Combining marks and format characters take up no columns."""
+    assert width.width(u'e\u0301') == 1
+    assert width.width(u'a\u200bb') == 2
+    assert width.width(u'\u1100\u1161\u11a8') == 2  # Hangul jamo syllable
+    assert width.width(u'a\U000E0100') == 1  # Variation selector supplement
+
+def test_width_measures_grapheme_clusters():
+    """Emoji ZWJ sequences, flags, and emoji presentation sequences are
+    measured as the one symbol the terminal draws."""
+    family = u'\U0001F468\u200d\U0001F469\u200d\U0001F467'
+    assert width.width(family) == 2
+    assert width.width(u'\U0001F1FA\U0001F1F8') == 2  # Flag
+    assert width.width(u'\u2764\ufe0f') == 2
+    assert width.width(u'x' + family + u'y') == 4
+
+def test_char_width_of_single_characters():
+    """char_width gives the width of one codepoint."""
+    assert width.char_width('a') == 1
+    assert width.char_width(u'日') == 2
+    assert width.char_width(u'\u0301') == 0
+    assert width.char_width('\x1b') == 0
+    assert width.char_width(u'\U0001F600') == 2
+    assert width.char_width(u'\U00010000') == 1
+
+def test_clusters_groups_joined_characters():
+    """clusters splits a string into grapheme clusters."""
+    assert width.clusters('abc') == ['a', 'b', 'c']
+    assert width.clusters(u'e\u0301x') == [u'e\u0301', 'x']
+    assert width.clusters(u'\U0001F1FA\U0001F1F8\U0001F1EC\U0001F1E7') == \
+        [u'\U0001F1FA\U0001F1F8', u'\U0001F1EC\U0001F1E7']
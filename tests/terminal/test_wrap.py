@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# name:             test_wrap.py
+# author:           Harold Bradley III
+# email:            harold@bradleystudio.net
+# created on:       10/18/2026
+#
+
+"""
+Unittests for nwid.terminal.wrap module.
+"""
+
+from __future__ import absolute_import
+
+from itertools import islice
+
+from nwid.terminal import codes as code
+from nwid.terminal import colors, sgr, wrap
+from nwid.terminal.string import TerminalString
+from nwid.terminal.styled import Run, StyledText
+import pytest
+
+
+## Wrap tests ##
+
+def test_wrap_breaks_lines_at_whitespace():
+    """Text is wrapped at whitespace, which is dropped at each break."""
+    lines = wrap.wrap('The quick brown fox jumps', 10)
+    assert [line.plain for line in lines] == ['The quick', 'brown fox',
+                                              'jumps']
+
+def test_wrap_keeps_line_breaks():
+    """Each line break of the text ends a line."""
+    lines = wrap.wrap('one\n\ntwo three\n', 5)
+    assert [line.plain for line in lines] == ['one', '', 'two', 'three']
+
+def test_wrap_breaks_long_words():
+    """A word longer than a line is broken."""
+    lines = wrap.wrap('abcdefgh ij', 3)
+    assert [line.plain for line in lines] == ['abc', 'def', 'gh', 'ij']
+
+def test_wrap_measures_display_width():
+    """Wide characters take up two columns of a line."""
+    lines = wrap.wrap(u'中文中文 中', 4)
+    assert [line.plain for line in lines] == [u'中文', u'中文', u'中']
+
+def test_wrap_keeps_styles_across_line_breaks():
+    """The style in effect where a line is broken carries on to the next
+    line."""
+    string = colors.red('red ' + colors.bold('bold words') + ' end')
+    lines = list(wrap.wrap(TerminalString(string), 9))
+    red, bold = sgr.rendition(code.RED), sgr.rendition(code.RED, code.BOLD)
+    assert lines == [
+        StyledText.from_runs([(red, 'red '), (bold, 'bold')]),
+        StyledText.from_runs([(bold, 'words'), (red, ' end')]),
+    ]
+
+def test_wrap_joins_words_split_between_runs():
+    """A word made of several runs is wrapped as one word."""
+    text = StyledText('ab ') + StyledText('cd', code.BOLD) + \
+        StyledText('ef', code.RED)
+    assert [line.plain for line in wrap.wrap(text, 4)] == ['ab', 'cdef']
+
+def test_wrap_is_lazy():
+    """Only as much of the text as the lines taken need is wrapped."""
+    def text():
+        yield Run(sgr.DEFAULT, 'one two three ')
+        raise AssertionError('Read too much of the text.')
+    assert [line.plain for line in islice(wrap.wrap(text(), 7), 1)] == \
+        ['one two']
+
+def test_wrap_needs_a_column():
+    """Lines must be at least one column wide."""
+    with pytest.raises(ValueError):
+        list(wrap.wrap('text', 0))
+
+
+## Truncate tests ##
+
+def test_truncate_leaves_text_that_fits():
+    """Text that fits is not changed."""
+    assert wrap.truncate(colors.red('short'), 5) == StyledText('short',
+                                                               code.RED)
+
+def test_truncate_ends_with_an_ellipsis():
+    """Text that does not fit is cut and ends with an ellipsis in the style
+    where it was cut."""
+    assert wrap.truncate(colors.bold('A long title'), 8) == \
+        StyledText(u'A long …', code.BOLD)
+    assert wrap.truncate(u'中文中文', 4, '.') == StyledText(u'中.')
+
+def test_truncate_with_a_wide_ellipsis():
+    """An ellipsis wider than the columns is cut too."""
+    assert wrap.truncate('abcdef', 2, '...') == StyledText('..')
@@ -13,7 +13,7 @@ Unittests for nwid.point module.
 
 from __future__ import absolute_import
 
-from nwid import Point, Size
+from nwid import Point, Rect, Region, Size
 
 
 ## Test data structure Point ##
@@ -128,3 +128,72 @@ def test_Size_can_be_set_by_width_and_height_attributes():
     size.height = 5
     assert size.width == 10
     assert size.height == 5
+
+
+## Test data structure Rect ##
+
+def test_Rect_can_be_initialized_with_a_position_and_size():
+    """A Rect object is initialized with a position and a size."""
+    rect = Rect((2, 3), (4, 5))
+    assert rect.position == Point(2, 3)
+    assert rect.size == Size(4, 5)
+    assert (rect.top, rect.left, rect.bottom, rect.right) == (2, 3, 6, 8)
+    assert Rect(Point(2, 3), Size(4, 5)) == rect
+
+def test_Rect_can_test_for_intersection_and_containment():
+    """A Rect object can tell if it intersects or contains another Rect."""
+    rect = Rect((0, 0), (10, 10))
+    assert rect.intersects(Rect((9, 9), (5, 5)))
+    assert not rect.intersects(Rect((10, 0), (5, 5)))
+    assert not rect.intersects(Rect((5, 5), (0, 0)))
+    assert rect.contains(Rect((2, 2), (8, 8)))
+    assert not rect.contains(Rect((2, 2), (9, 8)))
+
+def test_Rect_can_be_intersected_and_unioned():
+    """A Rect object can be intersected and unioned with another Rect."""
+    rect = Rect((0, 0), (10, 10))
+    assert rect.intersection(Rect((5, 6), (10, 10))) == Rect((5, 6), (5, 4))
+    assert rect.intersection(Rect((20, 20), (1, 1))).is_empty()
+    assert rect.union(Rect((5, 6), (10, 10))) == Rect((0, 0), (15, 16))
+
+
+def test_Rect_can_be_subtracted():
+    """Subtracting a Rect leaves the Rects that cover the rest."""
+    rect = Rect((0, 0), (10, 10))
+    assert rect.subtract(Rect((20, 20), (1, 1))) == [rect]
+    assert rect.subtract(Rect((0, 0), (10, 10))) == []
+    assert rect.subtract(Rect((0, 0), (10, 4))) == [Rect((0, 4), (10, 6))]
+    pieces = rect.subtract(Rect((2, 3), (4, 5)))
+    assert pieces == [Rect((0, 0), (2, 10)), Rect((6, 0), (4, 10)),
+                      Rect((2, 0), (4, 3)), Rect((2, 8), (4, 2))]
+    assert sum(piece.area() for piece in pieces) == 100 - 20
+
+## Test data structure Region ##
+
+def test_Region_merges_rects_without_covering_extra_cells():
+    """A Region merges Rects when their union covers no extra cells."""
+    region = Region()
+    region.add(Rect((0, 0), (1, 10)))
+    region.add(Rect((1, 0), (1, 10)))
+    region.add(Rect((0, 2), (2, 2)))
+    assert list(region) == [Rect((0, 0), (2, 10))]
+
+    region.add(Rect((5, 5), (1, 1)))
+    assert len(region) == 2
+
+def test_Region_does_not_merge_rects_into_larger_areas():
+    """A Region keeps Rects separate if merging would cover extra cells."""
+    region = Region([Rect((0, 0), (1, 10)), Rect((0, 0), (10, 1))])
+    assert len(region) == 2
+    assert region.intersects(Rect((5, 0), (1, 1)))
+    assert not region.intersects(Rect((5, 5), (1, 1)))
+
+def test_Region_ignores_empty_rects_and_can_be_cleared():
+    """A Region ignores empty Rects and can be cleared."""
+    region = Region()
+    region.add(Rect((0, 0), (0, 10)))
+    assert not region
+    region.add(Rect((0, 0), (1, 1)))
+    assert region
+    region.clear()
+    assert not region
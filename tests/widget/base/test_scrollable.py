@@ -13,8 +13,11 @@ Unittests for nwid.widget.base.scrollable module.
 
 from __future__ import absolute_import
 
-from nwid import Point, Size
-from nwid.widget.base import Scrollable
+from mock import patch
+from nwid import Point, Rect, Size
+from nwid.terminal import codes as code
+from nwid.terminal.screen import ScreenBuffer
+from nwid.widget.base import Scrollable, Viewport
 import pytest
 
 
@@ -205,3 +208,53 @@ def test_Scrollable_cannot_scroll_right_past_right_edge():
     assert scrollable.offset.col == 10
     scrollable.scroll_right(2)
     assert scrollable.offset.col == scrollable.rightmost_offset
+
+
+## Test Scrollable scrolling the terminal ##
+
+class MockScreenScrollable(Scrollable):
+    """A Mock of a scrollable object drawn onto a screen."""
+    def __init__(self, viewport):
+        self.size = Size(200, 20)
+        self.offset = Point(0, 0)
+        self.viewport = viewport
+        self.rect = viewport.rect
+        self.screen = ScreenBuffer(Size(10, 20))
+        self.invalidated = []
+        super(MockScreenScrollable, self).__init__()
+
+    def invalidate(self, rect=None):
+        self.invalidated.append(rect)
+
+@patch('sys.stdout.write')
+def test_Scrollable_full_width_viewport_scrolls_the_terminal(mock_write):
+    """A Scrollable whose viewport spans the screen scrolls the terminal and
+    only invalidates the exposed lines."""
+    scrollable = MockScreenScrollable(Viewport((2, 0), (6, 20)))
+    scrollable.screen.write(7, 0, 'last line')
+    scrollable.screen.render()
+
+    scrollable.scroll_down(2)
+    assert scrollable.invalidated == [Rect((4, 0), (2, 20))]
+    sequence = mock_write.call_args[0][0]
+    assert code.SET_SCROLL.using(3, 8) in sequence
+    assert sequence.count(code.SCROLL_UP.value) == 2
+    assert sequence.endswith(code.SET_SCROLL_ALL.value)
+    assert scrollable.screen.get(5, 0).char == 'l'
+
+    scrollable.scroll_up(1)
+    assert scrollable.invalidated[-1] == Rect((0, 0), (1, 20))
+    assert mock_write.call_args[0][0].count(code.SCROLL_DOWN.value) == 1
+
+def test_Scrollable_partial_width_viewport_invalidates_the_viewport():
+    """A Scrollable whose viewport doesn't span the screen invalidates the
+    entire viewport."""
+    scrollable = MockScreenScrollable(Viewport((2, 5), (6, 10)))
+    scrollable.scroll_down(2)
+    assert scrollable.invalidated == [Rect((0, 0), (6, 10))]
+
+def test_Scrollable_large_scroll_invalidates_the_viewport():
+    """Scrolling a whole viewport's height or more invalidates it."""
+    scrollable = MockScreenScrollable(Viewport((2, 0), (6, 20)))
+    scrollable.scroll_down(6)
+    assert scrollable.invalidated == [Rect((0, 0), (6, 20))]
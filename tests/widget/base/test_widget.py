@@ -10,3 +10,125 @@
 """
 Unittests for nwid.widget.base.widget module.
 """
+
+from __future__ import absolute_import
+
+from nwid import Rect, Size
+from nwid.event import RenderScheduler
+from nwid.terminal.screen import ScreenBuffer
+from nwid.widget.base import BaseWidget
+
+
+## Test BaseWidget ##
+
+def make_tree():
+    """Returns a root widget with a child, which has a grandchild."""
+    root = BaseWidget((0, 0), (10, 20))
+    child = BaseWidget((2, 2), (5, 10))
+    grandchild = BaseWidget((1, 1), (2, 2))
+    root.add_child(child)
+    child.add_child(grandchild)
+    return root, child, grandchild
+
+def test_BaseWidget_rect_is_in_screen_coordinates():
+    """A BaseWidget's rect is its position relative to the screen."""
+    root, child, grandchild = make_tree()
+    assert grandchild.rect == Rect((3, 3), (2, 2))
+    assert grandchild.root is root
+
+def test_BaseWidget_invalidate_adds_damage_to_the_root():
+    """Invalidating a BaseWidget adds its area to the root's damage."""
+    root, child, grandchild = make_tree()
+    root.damage.clear()
+    child.invalidate(Rect((0, 0), (1, 3)))
+    assert list(root.damage) == [Rect((2, 2), (1, 3))]
+
+def test_BaseWidget_invalidate_is_clipped_to_the_widget():
+    """Damage outside of a BaseWidget is clipped."""
+    root, child, grandchild = make_tree()
+    root.damage.clear()
+    grandchild.invalidate(Rect((1, 1), (10, 10)))
+    assert list(root.damage) == [Rect((4, 4), (1, 1))]
+
+def test_BaseWidget_repaint_only_paints_damaged_widgets():
+    """Repainting paints the damaged child without its parents."""
+    root, child, grandchild = make_tree()
+    screen = ScreenBuffer(Size(10, 20))
+    assert root.repaint(screen) == [root, child, grandchild]
+    assert root.repaint(screen) == []
+
+    grandchild.invalidate()
+    assert root.repaint(screen) == [grandchild]
+
+    child.invalidate(Rect((0, 5), (1, 1)))
+    assert root.repaint(screen) == [child]
+
+    child.invalidate(Rect((0, 0), (2, 2)))
+    assert root.repaint(screen) == [child, grandchild]
+
+def test_BaseWidget_repaint_paints_damaged_children_apart_from_the_parent():
+    """Damage on a child away from its parent's damage is not lost."""
+    root = BaseWidget((0, 0), (10, 10))
+    child = BaseWidget((5, 5), (3, 3))
+    root.add_child(child)
+    screen = ScreenBuffer(Size(10, 10))
+    root.repaint(screen)
+
+    root.invalidate(Rect((0, 0), (1, 1)))
+    child.invalidate()
+    assert root.repaint(screen) == [root, child]
+
+def test_BaseWidget_repaint_skips_a_parent_covered_by_damaged_children():
+    """Damage merged across adjacent children does not paint their parent."""
+    root = BaseWidget((0, 0), (10, 10))
+    left = BaseWidget((0, 0), (3, 3))
+    right = BaseWidget((0, 3), (3, 3))
+    root.add_child(left)
+    root.add_child(right)
+    screen = ScreenBuffer(Size(10, 10))
+    root.repaint(screen)
+
+    left.invalidate()
+    right.invalidate()
+    assert len(root.damage) == 1
+    assert root.repaint(screen) == [left, right]
+
+def test_BaseWidget_draw_fills_its_area():
+    """A BaseWidget draws by filling its area with its fill character."""
+    root, child, grandchild = make_tree()
+    grandchild.fill = 'x'
+    screen = ScreenBuffer(Size(10, 20))
+    root.repaint(screen)
+    assert screen.get(3, 3).char == 'x'
+    assert screen.get(2, 2).char == ' '
+
+def test_BaseWidget_draw_is_clipped_to_the_damage():
+    """A repainted BaseWidget only draws its damaged area."""
+    root, child, grandchild = make_tree()
+    screen = ScreenBuffer(Size(10, 20))
+    root.repaint(screen)
+    child.fill = '-'
+    child.invalidate(Rect((0, 0), (1, 2)))
+    root.repaint(screen)
+    assert screen.get(2, 3).char == '-'
+    assert screen.get(2, 4).char == ' '
+
+def test_BaseWidget_remove_child_damages_the_uncovered_area():
+    """Removing a child damages the area it covered."""
+    root, child, grandchild = make_tree()
+    screen = ScreenBuffer(Size(10, 20))
+    root.repaint(screen)
+    child.remove_child(grandchild)
+    assert root.repaint(screen) == [child]
+
+def test_BaseWidget_redraw_schedules_its_root():
+    """Redrawing a BaseWidget schedules its root with the render scheduler
+    instead of drawing right away."""
+    frames = []
+    root, child, grandchild = make_tree()
+    root.render_scheduler = RenderScheduler(frames.append)
+    child.redraw()
+    grandchild.redraw()
+    assert len(root.render_scheduler) == 1
+    root.render_scheduler.run()
+    assert frames == [[root]]